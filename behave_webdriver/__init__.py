@@ -1,3 +1,5 @@
+import sys
+
 __all__ = [
     'Chrome',
     'Firefox',
@@ -12,27 +14,65 @@ __all__ = [
     'from_env',
     'from_string',
     'fixture_browser',
+    'fixture_site',
     'before_all_factory',
     'before_feature_factory',
     'before_scenario_factory',
 ]
-from behave_webdriver.driver import (Chrome,
-                                     Firefox,
-                                     Ie,
-                                     Edge,
-                                     Opera,
-                                     Safari,
-                                     BlackBerry,
-                                     PhantomJS,
-                                     Android,
-                                     Remote)
-from behave_webdriver.utils import (from_env,
-                                    from_string)
-from behave_webdriver.fixtures import (fixture_browser,
-                                       before_all_factory,
-                                       before_feature_factory,
-                                       before_scenario_factory)
 from behave_webdriver.parameter_transformations import (NoTransformation,
                                                         FormatTransformation,
                                                         set_parameter_transformation_service,
                                                         transform_parameter)
+
+# selenium and behave are only imported once one of these names is used
+_lazy_attributes = {
+    'Chrome': 'behave_webdriver.driver',
+    'Firefox': 'behave_webdriver.driver',
+    'Ie': 'behave_webdriver.driver',
+    'Edge': 'behave_webdriver.driver',
+    'Opera': 'behave_webdriver.driver',
+    'Safari': 'behave_webdriver.driver',
+    'BlackBerry': 'behave_webdriver.driver',
+    'PhantomJS': 'behave_webdriver.driver',
+    'Android': 'behave_webdriver.driver',
+    'Remote': 'behave_webdriver.driver',
+    'from_env': 'behave_webdriver.utils',
+    'from_string': 'behave_webdriver.utils',
+    'fixture_browser': 'behave_webdriver.fixtures',
+    'fixture_site': 'behave_webdriver.fixtures',
+    'before_all_factory': 'behave_webdriver.fixtures',
+    'before_feature_factory': 'behave_webdriver.fixtures',
+    'before_scenario_factory': 'behave_webdriver.fixtures',
+}
+
+if sys.version_info < (3, 7):
+    # no module level __getattr__ (PEP 562), import everything up front
+    from behave_webdriver.driver import (Chrome,
+                                         Firefox,
+                                         Ie,
+                                         Edge,
+                                         Opera,
+                                         Safari,
+                                         BlackBerry,
+                                         PhantomJS,
+                                         Android,
+                                         Remote)
+    from behave_webdriver.utils import (from_env,
+                                        from_string)
+    from behave_webdriver.fixtures import (fixture_browser,
+                                           fixture_site,
+                                           before_all_factory,
+                                           before_feature_factory,
+                                           before_scenario_factory)
+else:
+    def __getattr__(name):
+        module_name = _lazy_attributes.get(name)
+        if module_name is None:
+            raise AttributeError("module 'behave_webdriver' has no attribute '{}'".format(name))
+        import importlib
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()).union(_lazy_attributes))
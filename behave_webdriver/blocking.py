@@ -0,0 +1,312 @@
+"""
+Provides resource blocking, to skip the images, fonts, media and third-party scripts functional checks don't need.
+
+Pass a blocklist as ``block``, e.g. through the fixture:
+
+>>> use_fixture(fixture_browser, ctx, webdriver_name='chrome.headless', block=['images', 'fonts', 'analytics'])
+
+Entries are presets (see ``PRESETS``) or URL patterns where ``*`` matches anything, e.g. ``'*.example.com/ads/*'``.
+
+Chrome blocks the requests itself, through the DevTools protocol (``Network.setBlockedURLs``), and reports them in its
+performance log. Other drivers are sent through a local :py:class:`BlockingProxy` answering blocked requests with a
+403. The proxy only sees the host of HTTPS requests, so path patterns apply to plain HTTP only, and browsers usually
+bypass proxies for localhost.
+
+A browser running on another machine (a remote driver without the DevTools protocol) reaches the proxy through the
+address of this machine as seen from the browser, passed as ``block_proxy_host``; the proxy then listens on every
+interface:
+
+>>> use_fixture(fixture_browser, ctx, webdriver_name='remote', block=['images'], block_proxy_host='10.0.0.12')
+
+Call the hooks of this module from your ``environment.py`` to count the blocked requests of each scenario in
+``scenario.blocked_requests``. Blocked requests are never sent, so the bytes they would have cost are not known.
+"""
+import fnmatch
+import json
+import re
+import select
+import socket
+import threading
+try:
+    from http.client import HTTPConnection
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlsplit
+except ImportError:  # Python 2
+    from httplib import HTTPConnection
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlsplit
+from selenium import webdriver
+
+try:
+    _string_types = basestring  # Python 2, where step arguments are unicode
+except NameError:
+    _string_types = str
+
+#: Drivers that start their browser on this machine
+_LOCAL_DRIVERS = tuple(driver for driver in (getattr(webdriver, name, None) for name in (
+    'Chrome', 'Firefox', 'Ie', 'Edge', 'Safari', 'Opera', 'PhantomJS', 'WebKitGTK')) if isinstance(driver, type))
+_LOOPBACK_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+PRESETS = {
+    'images': ['*.png', '*.png?*', '*.jpg', '*.jpg?*', '*.jpeg', '*.jpeg?*', '*.gif', '*.gif?*', '*.webp',
+               '*.webp?*', '*.svg', '*.svg?*', '*.ico', '*.ico?*'],
+    'fonts': ['*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf', '*.otf?*', '*.eot',
+              '*.eot?*'],
+    'media': ['*.mp4', '*.mp4?*', '*.webm', '*.webm?*', '*.mp3', '*.mp3?*', '*.ogg', '*.ogg?*', '*.wav', '*.wav?*'],
+    'analytics': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*connect.facebook.net*',
+                  '*hotjar.com*', '*segment.io*', '*segment.com*', '*mixpanel.com*', '*newrelic.com*',
+                  '*nr-data.net*'],
+}
+
+
+class Blocklist(object):
+    """
+    URL patterns of requests to block.
+
+    :param entries: presets or URL patterns, or a comma separated string of them
+    """
+    def __init__(self, entries):
+        if isinstance(entries, _string_types):
+            entries = [entry.strip() for entry in entries.split(',') if entry.strip()]
+        patterns = []
+        for entry in entries:
+            for pattern in PRESETS.get(entry, [entry]):
+                if pattern not in patterns:
+                    patterns.append(pattern)
+        self.patterns = patterns
+        self._regex = re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns) or '(?!)',
+                                 re.IGNORECASE)
+
+    def matches(self, url):
+        """
+        Whether or not a URL is blocked.
+        """
+        return self._regex.match(url) is not None
+
+    def __bool__(self):
+        return bool(self.patterns)
+    __nonzero__ = __bool__
+
+
+class CdpBlocker(object):
+    """
+    Blocks requests in Chrome with the DevTools protocol. The driver must be created with the 'performance' log
+    enabled (``goog:loggingPrefs``) for blocked requests to be counted.
+    """
+    capabilities = {'goog:loggingPrefs': {'performance': 'ALL'}}
+
+    def __init__(self, blocklist):
+        self.blocklist = blocklist
+        self.driver = None
+        self._blocked = 0
+        self._requested = {}  # the URL by request id, until the request finishes or fails
+        self.urls = []
+
+    def attach(self, driver):
+        self.driver = driver
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocklist.patterns})
+
+    def _collect(self):
+        # the events of a request may come in different batches of the log
+        requested = self._requested
+        for entry in self.driver.get_log('performance'):
+            message = json.loads(entry['message']).get('message', {})
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                requested[params.get('requestId')] = params.get('request', {}).get('url')
+            elif method == 'Network.loadingFinished':
+                requested.pop(params.get('requestId'), None)
+            elif method == 'Network.loadingFailed':
+                url = requested.pop(params.get('requestId'), None)
+                if params.get('blockedReason') == 'inspector':
+                    self._blocked += 1
+                    self.urls.append(url)
+
+    @property
+    def blocked(self):
+        """
+        The number of requests blocked so far.
+        """
+        if self.driver is not None:
+            self._collect()
+        return self._blocked
+
+    def close(self):
+        self.driver = None
+        self._requested.clear()
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.0'
+
+    def log_message(self, *args):
+        pass
+
+    def _block(self):
+        self.server.proxy.record_blocked(self.path)
+        self.send_response(403)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_CONNECT(self):
+        host, _, port = self.path.rpartition(':')
+        if self.server.proxy.blocklist.matches('https://{}/'.format(host)):
+            return self._block()
+        try:
+            upstream = socket.create_connection((host, int(port)), timeout=30)
+        except (socket.error, ValueError):
+            self.send_error(502)
+            return
+        self.send_response(200, 'Connection established')
+        self.end_headers()
+        sockets = [self.connection, upstream]
+        try:
+            while True:
+                readable, _, errored = select.select(sockets, [], sockets, 30)
+                if errored or not readable:
+                    break
+                for source in readable:
+                    data = source.recv(65536)
+                    if not data:
+                        return
+                    (upstream if source is self.connection else self.connection).sendall(data)
+        finally:
+            upstream.close()
+
+    def _forward(self):
+        if self.server.proxy.blocklist.matches(self.path):
+            return self._block()
+        parts = urlsplit(self.path)
+        body = None
+        if self.headers.get('Content-Length'):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        headers = dict((name, value) for name, value in self.headers.items()
+                       if name.lower() not in ('proxy-connection', 'connection', 'keep-alive'))
+        connection = HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        try:
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+            connection.request(self.command, path, body, headers)
+            response = connection.getresponse()
+            content = response.read()
+        except (socket.error, IOError):
+            self.send_error(502)
+            return
+        finally:
+            connection.close()
+        self.send_response(response.status, response.reason)
+        for name, value in response.getheaders():
+            if name.lower() not in ('connection', 'keep-alive', 'transfer-encoding', 'content-length'):
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_OPTIONS = do_PATCH = _forward
+
+
+class _ProxyServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class BlockingProxy(object):
+    """
+    A local HTTP proxy answering the requests of a blocklist with a 403, for drivers without the DevTools protocol.
+
+    :param blocklist: a :py:class:`Blocklist`
+    :param host: the interface to listen on
+    :param advertised_host: the host the browser reaches the proxy by, defaults to ``host``
+    """
+    def __init__(self, blocklist, host='127.0.0.1', advertised_host=None):
+        self.blocklist = blocklist
+        self.host = host
+        self.advertised_host = advertised_host or host
+        self.urls = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        self._server = _ProxyServer((self.host, 0), _ProxyHandler)
+        self._server.proxy = self
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    @property
+    def address(self):
+        return '{}:{}'.format(self.advertised_host, self._server.server_address[1])
+
+    @property
+    def capabilities(self):
+        return {'proxy': {'proxyType': 'manual', 'httpProxy': self.address, 'sslProxy': self.address}}
+
+    def attach(self, driver):
+        pass
+
+    def record_blocked(self, url):
+        with self._lock:
+            self.urls.append(url)
+
+    @property
+    def blocked(self):
+        """
+        The number of requests blocked so far.
+        """
+        return len(self.urls)
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _runs_browser_elsewhere(driver, command_executor):
+    if isinstance(driver, _LOCAL_DRIVERS):
+        return False
+    url = getattr(command_executor, '_url', command_executor) or 'http://127.0.0.1:4444/wd/hub'
+    return urlsplit(url).hostname not in _LOOPBACK_HOSTS
+
+
+def blocker_for(driver, entries, proxy_host=None, command_executor=None):
+    """
+    The blocker to use for a driver: Chrome's DevTools protocol when available, otherwise a started proxy.
+
+    :param proxy_host: the address of this machine as seen from the browser, when it runs on another machine
+    :param command_executor: the command executor (or its URL) of a remote driver
+    :raises ValueError: when a remote browser could not reach the proxy
+    """
+    blocklist = entries if isinstance(entries, Blocklist) else Blocklist(entries)
+    if callable(getattr(driver, 'execute_cdp_cmd', None)):
+        return CdpBlocker(blocklist)
+    if proxy_host:
+        return BlockingProxy(blocklist, host='0.0.0.0', advertised_host=proxy_host).start()
+    if _runs_browser_elsewhere(driver, command_executor):
+        raise ValueError('The browser of {} runs on another machine, which cannot reach a blocking proxy on '
+                         '127.0.0.1. Pass block_proxy_host, the address of this machine as seen from the '
+                         'browser.'.format(type(driver).__name__))
+    return BlockingProxy(blocklist).start()
+
+
+def _blocker(context):
+    return getattr(getattr(context, 'behave_driver', None), 'blocker', None)
+
+
+def before_scenario(context, scenario):
+    blocker = _blocker(context)
+    if blocker is not None:
+        context.blocked_requests_start = blocker.blocked
+
+
+def after_scenario(context, scenario):
+    blocker = _blocker(context)
+    start = getattr(context, 'blocked_requests_start', None)
+    if blocker is not None and start is not None:
+        scenario.blocked_requests = blocker.blocked - start
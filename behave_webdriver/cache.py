@@ -0,0 +1,112 @@
+"""
+Provides an opt-in cache of located elements, so consecutive steps on the same selector skip the lookup round trip.
+"""
+
+
+class ElementCache(object):
+    """
+    Maps a selector (and the ``by`` strategy used to locate it) to a previously located WebElement.
+
+    Entries are scoped to the browsing context they were located in: the current window handle and frame path are part
+    of every key. The cache tracks that context itself (see :py:class:`CacheAwareSwitchTo`), so no round trip is
+    needed to build a key.
+
+    The cache is invalidated by :py:class:`~behave_webdriver.driver.BehaveDriverMixin` on navigation, window switches
+    and whenever a cached element turns out to be stale.
+
+    ``hits`` and ``misses`` count lookups served from the cache and lookups that had to go to the driver.
+    """
+    def __init__(self):
+        self._elements = {}
+        self.window = None
+        self.frames = ()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _key(self, selector, by):
+        return selector, by, self.frames, self.window
+
+    def get(self, selector, by=None):
+        """
+        Get the cached element for a selector in the current browsing context.
+
+        :return: the cached WebElement, or None (counted as a miss) if it is not cached
+        """
+        element = self._elements.get(self._key(selector, by))
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return element
+
+    def put(self, selector, element, by=None):
+        self._elements[self._key(selector, by)] = element
+
+    def discard(self, selector, by=None):
+        self._elements.pop(self._key(selector, by), None)
+
+    def clear(self):
+        """
+        Drop every cached element. Hit/miss counters are kept.
+        """
+        if self._elements:
+            self.invalidations += 1
+        self._elements.clear()
+
+    def switch_window(self, window_name):
+        self.clear()
+        self.window = window_name
+        self.frames = ()
+
+    def switch_frame(self, frame_reference):
+        self.frames = self.frames + (frame_reference,)
+
+    def switch_parent_frame(self):
+        self.frames = self.frames[:-1]
+
+    def switch_default_content(self):
+        self.frames = ()
+
+    def stats(self):
+        """
+        :return: a dictionary with the hit, miss and invalidation counts and the hit ratio
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_ratio': float(self.hits) / lookups if lookups else 0.0}
+
+    def __len__(self):
+        return len(self._elements)
+
+
+class CacheAwareSwitchTo(object):
+    """
+    Wraps a selenium ``SwitchTo`` object to keep an :py:class:`ElementCache` informed of window and frame switches.
+    Everything else is delegated to the wrapped object.
+    """
+    def __init__(self, switch_to, cache):
+        self._switch_to = switch_to
+        self._cache = cache
+
+    def window(self, window_name):
+        self._switch_to.window(window_name)
+        self._cache.switch_window(window_name)
+
+    def frame(self, frame_reference):
+        self._switch_to.frame(frame_reference)
+        self._cache.switch_frame(frame_reference)
+
+    def parent_frame(self):
+        self._switch_to.parent_frame()
+        self._cache.switch_parent_frame()
+
+    def default_content(self):
+        self._switch_to.default_content()
+        self._cache.switch_default_content()
+
+    def __getattr__(self, item):
+        return getattr(self._switch_to, item)
@@ -1,5 +1,14 @@
 """
 Provides additional expected conditions as well as *negatable* versions of selenium's expected conditions.
+
+Each condition also describes itself as a predicate that :py:class:`~behave_webdriver.waits.BrowserWait` can evaluate
+inside the page, see :py:class:`~behave_webdriver.conditions.BrowserPredicateMixin`.
+
+Conditions on the same element combine with :py:class:`all_of`, :py:class:`any_of` and :py:class:`not_`, which locate
+the element once per poll and evaluate every predicate against it:
+
+>>> locator = (By.CSS_SELECTOR, '#submit')
+>>> ready = all_of(element_is_visible(locator), element_is_enabled(locator), element_contains_text(locator))
 """
 
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
@@ -26,6 +35,143 @@ class NegationMixin(object):
         return result
 
 
+class BrowserPredicateMixin(object):
+    """
+    Names the in-page predicate (see ``behave_webdriver.scripts.ELEMENT_PREDICATE_FUNCTION``) equivalent to a condition.
+    The predicate honors the same ``negative`` flag and the ``text`` (if any) of the condition.
+    """
+    js_predicate = None
+
+    def js_spec(self):
+        """
+        :return: the JSON-serializable description of this condition passed to the in-page predicate
+        :rtype: dict
+        """
+        return {'predicate': self.js_predicate,
+                'negative': bool(getattr(self, 'negative', False)),
+                'text': getattr(self, 'text', '') or ''}
+
+
+def evaluate_predicate(spec, element):
+    """
+    Same as ``evaluatePredicate`` in ``behave_webdriver.scripts``, on a located ``WebElement`` (or None).
+
+    :param spec: the description of a condition, see :py:meth:`BrowserPredicateMixin.js_spec`
+    :param element: the element the condition is about, or None when no element was located
+    :return: whether or not the condition holds, None when it needs an element and there is none
+    :raises StaleElementReferenceException: when the element went stale
+    """
+    predicate = spec['predicate']
+    if predicate == 'present':
+        result = element is not None
+    elif predicate in ('all', 'any'):
+        combine = all if predicate == 'all' else any
+        result = combine(evaluate_predicate(condition, element) for condition in spec['conditions'])
+    elif element is None:
+        return None
+    elif predicate == 'visible':
+        result = element.is_displayed()
+    elif predicate == 'actionable':
+        result = element.is_displayed() and element.is_enabled()
+    elif predicate == 'enabled':
+        result = element.is_enabled()
+    elif predicate == 'selected':
+        result = element.is_selected()
+    elif predicate == 'text':
+        text = element.text or ''
+        result = len(text) > 0 and spec.get('text', '') in text
+    elif predicate == 'value':
+        value = element.get_attribute('value') or ''
+        result = len(value) > 0 and spec.get('text', '') in value
+    else:
+        raise ValueError('Unknown predicate: {}'.format(predicate))
+    return not result if spec.get('negative') else result
+
+
+class CompositeMixin(object):
+    """
+    Combines conditions on the same locator. Each poll locates the element once, with ``find_elements`` so that a
+    missing element is a result rather than an error, and evaluates the predicates of every condition against it.
+
+    ``lookups`` and ``polls`` count the ``find_elements`` calls and evaluations of the condition, which are equal.
+    """
+
+    def __init__(self, *conditions):
+        if not conditions:
+            raise ValueError('At least one condition is required')
+        locators = set(tuple(condition.locator) for condition in conditions)
+        if len(locators) != 1:
+            raise ValueError('Combined conditions must share one locator, got {}'.format(sorted(locators)))
+        for condition in conditions:
+            if not getattr(condition, 'js_predicate', None):
+                raise ValueError('{!r} does not describe its predicate'.format(condition))
+        self.conditions = conditions
+        self.locator = conditions[0].locator
+        self.lookups = 0
+        self.polls = 0
+
+    def js_spec(self):
+        spec = super(CompositeMixin, self).js_spec()
+        spec['conditions'] = [condition.js_spec() for condition in self.conditions]
+        return spec
+
+    def __call__(self, driver):
+        self.polls += 1
+        self.lookups += 1
+        elements = driver.find_elements(*self.locator)
+        element = elements[0] if elements else None
+        spec = dict(self.js_spec(), negative=False)  # the negation is applied by NegationMixin
+        if not evaluate_predicate(spec, element):
+            return False
+        return True if element is None else element
+
+
+class CachedElementMixin(object):
+    """
+    Locates the element of a condition on the first poll and re-checks the same handle on later polls. The element is
+    located again only when it could not be found, or after its handle went stale (the poll then reports False, see
+    :py:class:`~behave_webdriver.conditions.NegationMixin`).
+
+    ``lookups`` and ``polls`` count the ``find_element`` calls and evaluations of the condition.
+    """
+    #: Whether or not the handle is kept across polls. Checking a cached handle costs a round trip of its own, so
+    #: conditions that need nothing but the lookup itself don't keep it.
+    cache_element = True
+    #: Whether or not the element, rather than True, is the result of a positive check
+    returns_element = False
+
+    def __init__(self, *args, **kwargs):
+        super(CachedElementMixin, self).__init__(*args, **kwargs)
+        self._element = None
+        self.lookups = 0
+        self.polls = 0
+
+    def locate(self, driver):
+        """
+        :return: the cached element, or the newly located one
+        :raises NoSuchElementException: when no element is located
+        """
+        element = self._element
+        if element is None:
+            self.lookups += 1
+            element = driver.find_element(*self.locator)
+            if self.cache_element:
+                self._element = element
+        return element
+
+    def __call__(self, driver):
+        self.polls += 1
+        element = self.locate(driver)
+        try:
+            result = evaluate_predicate(dict(self.js_spec(), negative=False), element)
+        except StaleElementReferenceException:
+            self._element = None
+            raise
+        if result and self.returns_element:
+            return element
+        return bool(result)
+
+
 class AnyTextMixin(object):
     """
     Provides default for text_ arguments when the EC expects it. An empty value will test true when
@@ -45,24 +191,46 @@ class AnyTextMixin(object):
         super(AnyTextMixin, self).__init__(*args, **kwargs)
 
 
-class element_is_selected(NegationMixin, EC.element_located_to_be_selected):
+class element_is_selected(NegationMixin, CachedElementMixin, BrowserPredicateMixin, EC.element_located_to_be_selected):
     """
     Like selenium's element_located_to_be_selected but with the :ref:`~behave_webdriver.conditions.NegationMixin`.
+    and :ref:`~behave_webdriver.conditions.CachedElementMixin`.
     """
-    pass
+    js_predicate = 'selected'
 
 
-class element_is_visible(NegationMixin, EC.visibility_of_element_located):
+class element_is_visible(NegationMixin, CachedElementMixin, BrowserPredicateMixin, EC.visibility_of_element_located):
     """
     Like selenium's visibility_of_element_located but with the :ref:`~behave_webdriver.conditions.NegationMixin`.
+    and :ref:`~behave_webdriver.conditions.CachedElementMixin`.
+    """
+    js_predicate = 'visible'
+    returns_element = True
+
+
+class element_is_actionable(NegationMixin, CachedElementMixin, BrowserPredicateMixin):
+    """
+    A new EC that checks an element can be acted on: attached, visible, enabled, with a stable bounding box and not
+    obscured by another element at its center. The last two are only known inside the page; polled from the test
+    process, the condition checks that the element is displayed and enabled.
     """
-    pass
+    js_predicate = 'actionable'
+    returns_element = True
+
+    def __init__(self, locator, negative=False):
+        super(element_is_actionable, self).__init__(negative=negative)
+        self.locator = locator
 
 
-class element_is_present(NegationMixin, EC.presence_of_element_located):
+class element_is_present(NegationMixin, CachedElementMixin, BrowserPredicateMixin, EC.presence_of_element_located):
     """
     Like selenium's presence_of_element_located but with the :ref:`~behave_webdriver.conditions.NegationMixin`.
+    The element is located on every poll, since the lookup is the check.
     """
+    js_predicate = 'present'
+    cache_element = False
+    returns_element = True
+
     def __call__(self, driver):
         """
         extends __call__ to catch NoSuchElementException errors to support negation of element existing.
@@ -76,50 +244,57 @@ class element_is_present(NegationMixin, EC.presence_of_element_located):
         return result
 
 
-class element_is_enabled(object):
+class element_is_enabled(NegationMixin, CachedElementMixin, BrowserPredicateMixin):
     """
-    A new EC that checks a webelement's ``is_enabled`` method.
-    Negation is supplied manually, rather than the usual mixin.
+    A new EC that checks a webelement's ``is_enabled`` method,
+    with the :ref:`~behave_webdriver.conditions.NegationMixin` and :ref:`~behave_webdriver.conditions.CachedElementMixin`.
     """
+    js_predicate = 'enabled'
+
     def __init__(self, locator, negative=False):
+        super(element_is_enabled, self).__init__(negative=negative)
         self.locator = locator
-        self.negative = negative
 
-    def __call__(self, driver):
-        try:
-            element = driver.find_element(*self.locator)
-        except StaleElementReferenceException:
-            return False
-        result = element.is_enabled()
-        if self.negative:
-            return not result
-        return result
+
+class element_contains_text(NegationMixin, AnyTextMixin, CachedElementMixin, BrowserPredicateMixin,
+                            EC.text_to_be_present_in_element):
+    """
+    Like selenium's text_to_be_present_in_element but with the :ref:`~behave_webdriver.conditions.NegationMixin`,
+    :ref:`~behave_webdriver.conditions.AnyTextMixin` and :ref:`~behave_webdriver.conditions.CachedElementMixin`.
+    Empty text never contains the expected text, as in the page.
+    """
+    js_predicate = 'text'
 
 
-class element_contains_text(NegationMixin, AnyTextMixin, EC.text_to_be_present_in_element):
+class element_contains_value(NegationMixin, AnyTextMixin, CachedElementMixin, BrowserPredicateMixin,
+                             EC.text_to_be_present_in_element_value):
     """
-    Like selenium's text_to_be_present_in_element but with the :ref:`~behave_webdriver.conditions.NegationMixin`.
-    and :ref:`~behave_webdriver.conditions.AnyTextMixin`.
+    Like selenium's text_to_be_present_in_element_value but with the :ref:`~behave_webdriver.conditions.NegationMixin`,
+    :ref:`~behave_webdriver.conditions.AnyTextMixin` and :ref:`~behave_webdriver.conditions.CachedElementMixin`.
     """
-    def __call__(self, driver):
-        """
-        Same logic as in EC.text_to_be_present_in_element except StaleElementReferenceException is not caught
-        this, for now, is needed to distinguish if a False return value is the result of this exception.
-        """
-        try:
-            element = driver.find_element(*self.locator)
-            result = bool(element.text)
-        except StaleElementReferenceException:
-            return False
+    js_predicate = 'value'
 
-        if self.negative:
-            return not result
-        return result
+
+class all_of(NegationMixin, CompositeMixin, BrowserPredicateMixin):
+    """
+    Holds when every condition holds for the element, see :py:class:`~behave_webdriver.conditions.CompositeMixin`.
+    With ``negative=True``, holds when any of them does not.
+    """
+    js_predicate = 'all'
+
+
+class any_of(NegationMixin, CompositeMixin, BrowserPredicateMixin):
+    """
+    Holds when at least one condition holds for the element, see
+    :py:class:`~behave_webdriver.conditions.CompositeMixin`. With ``negative=True``, holds when none of them does.
+    """
+    js_predicate = 'any'
 
 
-class element_contains_value(NegationMixin, AnyTextMixin, EC.text_to_be_present_in_element_value):
+class not_(all_of):
     """
-    Like selenium's text_to_be_present_in_element_value but with the :ref:`~behave_webdriver.conditions.NegationMixin`.
-    and :ref:`~behave_webdriver.conditions.AnyTextMixin`.
+    Holds when the condition does not hold for the element. Unlike the condition's own ``negative`` flag, this also
+    negates conditions that are composites themselves.
     """
-    pass
+    def __init__(self, condition, negative=False):
+        super(not_, self).__init__(condition, negative=not negative)
@@ -1,25 +1,42 @@
+from __future__ import division
+
 import time
 import json
 import os
-from functools import partial
+from functools import partial, wraps
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (InvalidElementStateException,
+                                        InvalidSelectorException,
+                                        NoSuchElementException,
+                                        StaleElementReferenceException,
+                                        TimeoutException,
+                                        WebDriverException)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.color import Color
 from selenium.webdriver.support.select import Select as _Select
-
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from behave_webdriver import scripts, readiness, blocking
+from behave_webdriver.cache import ElementCache, CacheAwareSwitchTo
+from behave_webdriver.geometry import ElementGeometry
+from behave_webdriver.predicates import TextMatch, TEXT_MODES
+from behave_webdriver.waits import BrowserWait, PollingWait, polling_strategy, wait_for_quiescence
+from behave_webdriver.remote_connection import PooledRemoteConnection
+from behave_webdriver.instrumentation import RoundTrips, PauseLog, WaitLog, timed_wait
 from behave_webdriver.conditions import (element_is_present,
                                          element_is_selected,
                                          element_contains_value,
                                          element_is_visible,
                                          element_contains_text,
-                                         element_is_enabled)
+                                         element_is_enabled,
+                                         element_is_actionable,
+                                         all_of,
+                                         any_of)
 
 
 class Select(_Select):
@@ -37,6 +54,59 @@ class Select(_Select):
                                                                                                          attr_value))
 
 
+#: The length of the values that are entered in one operation rather than typed, unless set otherwise with the
+#: ``fast_input`` argument of ``BehaveDriverMixin``
+FAST_INPUT_THRESHOLD = 1000
+
+#: The values that check a checkbox (or radio button) when filling a form, see ``BehaveDriverMixin.fill_form``
+_CHECKED_VALUES = ('true', 'yes', 'on', 'checked', '1', 'x')
+
+
+def _retry_stale(method):
+    """
+    When the element cache is enabled, a cached element may have gone stale since it was located.
+    In that case the cache is invalidated and the method is retried once with freshly located elements.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except StaleElementReferenceException:
+            if self.element_cache is None:
+                raise
+            self.element_cache.clear()
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _set_capability(driver, args, kwargs, name, value):
+    """
+    Add a capability to the constructor arguments of a selenium driver: to its options when given, else to its
+    desired capabilities (positional or keyword), else to new options of the driver.
+
+    :return: the updated positional and keyword arguments
+    """
+    for key in ('options', 'chrome_options', 'firefox_options'):
+        options = kwargs.get(key)
+        if options is not None and hasattr(options, 'set_capability'):
+            options.set_capability(name, value)
+            return args, kwargs
+    if isinstance(kwargs.get('desired_capabilities'), dict):
+        kwargs['desired_capabilities'] = dict(kwargs['desired_capabilities'], **{name: value})
+        return args, kwargs
+    for index, arg in enumerate(args):
+        if isinstance(arg, dict):
+            args = args[:index] + (dict(arg, **{name: value}),) + args[index + 1:]
+            return args, kwargs
+    if hasattr(driver, 'create_options'):
+        options = driver.create_options()
+        options.set_capability(name, value)
+        kwargs['options'] = options
+    else:
+        kwargs['desired_capabilities'] = {name: value}
+    return args, kwargs
+
+
 class BehaveDriverMixin(object):
     """
     Implements most of the general (I.E. not browser-specific) logic for step implementations.
@@ -62,11 +132,217 @@ class BehaveDriverMixin(object):
     >>> response = behave_driver.request('GET', 'https://github.com/spyoungtech/behave-webdriver')
 
 
+    Located elements can be cached, so that consecutive steps on the same selector skip the lookup round trip.
+    The cache is invalidated on navigation, window switches and stale elements.
+
+    >>> behave_driver = MyBehaveDriver(element_cache=True)
+    >>> behave_driver.element_cache.stats()
+    {'hits': 0, 'misses': 0, 'invalidations': 0, 'hit_ratio': 0.0}
+
+
+    Every command sent to the browser is counted in ``roundtrips``, see ``behave_webdriver.instrumentation``.
+
+    >>> behave_driver.roundtrips.commands
+    1
+
+
+    The commands of each scenario and their responses can be recorded to a directory, to be replayed without a browser
+    by the 'replay' driver, see ``behave_webdriver.recording``.
+
+    >>> behave_driver = MyBehaveDriver(record='recordings')
+
+
+    Smart pauses treat the time of a pause as an upper bound, returning as soon as the page is quiescent: loaded, no
+    pending fetch/XHR and no DOM mutations for a settle window (``True`` for 100ms, or a number of milliseconds).
+    Requested and actual pause times are kept in ``pauses``.
+
+    >>> behave_driver = MyBehaveDriver(smart_pause=250)
+    >>> behave_driver.pause(3000)
+    >>> behave_driver.pauses.saved
+    2.65
+
+
+    ``open_url`` can return before the load event with an 'eager' or 'none' page load strategy, and wait for readiness
+    conditions instead, see ``behave_webdriver.readiness``.
+
+    >>> behave_driver = MyBehaveDriver(page_load_strategy='eager', ready='selector:#app')
+
+
+    Requests for images, fonts, media or any URL pattern can be blocked, see ``behave_webdriver.blocking``.
+
+    >>> behave_driver = MyBehaveDriver(block=['images', 'fonts', 'analytics'])
+    >>> behave_driver.blocker.blocked
+    14
+
+
+    Waits polled from the test process sleep between polls as told by a polling strategy: 'fixed' (selenium's half
+    second), 'backoff' or 'fast-start', see ``behave_webdriver.waits``. Their polls and time to success are kept in
+    ``waits``.
+
+    >>> behave_driver = MyBehaveDriver(polling='fast-start')
+    >>> behave_driver.waits.polls
+    4
+
+
+    With auto-waiting, actions on an element (clicks, drags, submits and input) first wait, up to ``default_wait``,
+    for it to be actionable: attached, visible, enabled, with a stable bounding box and not obscured. The check runs
+    inside the page, see ``behave_webdriver.conditions.element_is_actionable``.
+
+    >>> behave_driver = MyBehaveDriver(auto_wait=True)
+
+
+    Values of ``FAST_INPUT_THRESHOLD`` characters or more are entered into input fields in one operation, which fires
+    key, input and change events, rather than typed character by character. ``fast_input`` sets another threshold,
+    or ``True`` (``False``) to always (never) enter values in one operation.
+
+    >>> behave_driver = MyBehaveDriver(fast_input=200)
+
+
     """
+    element_cache = None
+    roundtrips = None
+    smart_pause = None
+    pauses = None
+    polling = None
+    waits = None
+    auto_wait = False
+    fast_input_threshold = FAST_INPUT_THRESHOLD
+    ready = ()
+    ready_timeout = 30
+    blocker = None
+    _async_script_timeout = None
+
     def __init__(self, *args, **kwargs):
         default_wait = kwargs.pop('default_wait', 1.5)
-        super(BehaveDriverMixin, self).__init__(*args, **kwargs)
+        element_cache = kwargs.pop('element_cache', False)
+        record = kwargs.pop('record', None)
+        smart_pause = kwargs.pop('smart_pause', False)
+        polling = polling_strategy(kwargs.pop('polling', None))
+        auto_wait = kwargs.pop('auto_wait', False)
+        fast_input = kwargs.pop('fast_input', FAST_INPUT_THRESHOLD)
+        if fast_input is True:
+            fast_input = 0
+        elif fast_input is False:
+            fast_input = None
+        page_load_strategy = kwargs.pop('page_load_strategy', None)
+        ready = readiness.conditions(kwargs.pop('ready', None))
+        ready_timeout = kwargs.pop('ready_timeout', self.ready_timeout)
+        if page_load_strategy is not None:
+            if page_load_strategy not in readiness.PAGE_LOAD_STRATEGIES:
+                raise ValueError('Invalid page load strategy "{}". Valid options are: {}'.format(
+                    page_load_strategy, ', '.join(readiness.PAGE_LOAD_STRATEGIES)))
+            args, kwargs = _set_capability(self, args, kwargs, 'pageLoadStrategy', page_load_strategy)
+        block = kwargs.pop('block', None)
+        block_proxy_host = kwargs.pop('block_proxy_host', None)
+        blocker = None
+        if block:
+            if not isinstance(self, webdriver.Remote):
+                raise ValueError('{} does not load resources to block'.format(type(self).__name__))
+            command_executor = kwargs.get('command_executor', args[0] if args else None)
+            blocker = blocking.blocker_for(self, block, block_proxy_host, command_executor)
+            for name, value in blocker.capabilities.items():
+                args, kwargs = _set_capability(self, args, kwargs, name, value)
+        self.ready = ready
+        self.ready_timeout = ready_timeout
+        self.roundtrips = RoundTrips()
+        self.pauses = PauseLog()
+        self.polling = polling
+        self.waits = WaitLog()
+        self.auto_wait = auto_wait
+        self.fast_input_threshold = fast_input
+        if smart_pause is True:
+            smart_pause = 100
+        self.smart_pause = smart_pause or None
+        try:
+            super(BehaveDriverMixin, self).__init__(*args, **kwargs)
+            if blocker is not None:
+                blocker.attach(self)
+        except Exception:
+            if blocker is not None:
+                blocker.close()
+            raise
+        self.blocker = blocker
+        if record:
+            from behave_webdriver.recording import RecordingConnection
+            if getattr(self, 'command_executor', None) is None:
+                raise ValueError('{} does not send WebDriver commands to record'.format(type(self).__name__))
+            self.command_executor = RecordingConnection(self.command_executor, record)
         self.default_wait = default_wait
+        if element_cache is True:
+            element_cache = ElementCache()
+        elif element_cache is False:
+            element_cache = None
+        self.element_cache = element_cache
+
+    def execute(self, driver_command, params=None):
+        roundtrips = self.roundtrips
+        if roundtrips is None:
+            return super(BehaveDriverMixin, self).execute(driver_command, params)
+        started = time.time()
+        try:
+            return super(BehaveDriverMixin, self).execute(driver_command, params)
+        finally:
+            roundtrips.record(driver_command, time.time() - started)
+
+    @property
+    def switch_to(self):
+        """
+        Same as selenium's ``switch_to``. When the element cache is enabled, window and frame switches made through it
+        are tracked by the cache.
+        """
+        switch_to = super(BehaveDriverMixin, self).switch_to
+        if self.element_cache is None:
+            return switch_to
+        return CacheAwareSwitchTo(switch_to, self.element_cache)
+
+    def switch_to_window(self, window_name):
+        """
+        Shortcut for ``switch_to.window``
+
+        :param window_name: the name or window handle of the window to switch to
+        """
+        self.switch_to.window(window_name)
+
+    def _invalidate_element_cache(self):
+        if self.element_cache is not None:
+            self.element_cache.clear()
+
+    def quit(self):
+        try:
+            super(BehaveDriverMixin, self).quit()
+        finally:
+            if self.blocker is not None:
+                self.blocker.close()
+
+    def get(self, url):
+        self._invalidate_element_cache()
+        result = super(BehaveDriverMixin, self).get(url)
+        if self.smart_pause is not None:
+            self._track_activity()
+        return result
+
+    def _track_activity(self):
+        # installed early, the tracker of smart pauses also knows of the requests the page starts on load
+        try:
+            self.execute_script(scripts.ACTIVITY_TRACKER)
+        except WebDriverException:
+            pass
+
+    def back(self):
+        self._invalidate_element_cache()
+        return super(BehaveDriverMixin, self).back()
+
+    def forward(self):
+        self._invalidate_element_cache()
+        return super(BehaveDriverMixin, self).forward()
+
+    def refresh(self):
+        self._invalidate_element_cache()
+        return super(BehaveDriverMixin, self).refresh()
+
+    def close(self):
+        self._invalidate_element_cache()
+        return super(BehaveDriverMixin, self).close()
 
     @property
     def alert(self):
@@ -121,7 +397,7 @@ class BehaveDriverMixin(object):
         :rtype: bool
         """
         try:
-            WebDriverWait(self, 1).until(EC.alert_is_present())
+            PollingWait(self, 1, self.polling, self.waits).until(EC.alert_is_present())
             alert = self.switch_to.alert
             return True
         except TimeoutException:
@@ -158,18 +434,27 @@ class BehaveDriverMixin(object):
         Takes a selector string and uses an appropriate method (XPATH or CSS selector by default) to find a WebElement
         The optional `by` argument can be supplied to specify any locating method explicitly.
         This is used to resolve selectors from step definition strings to actual element objects
+        When the element cache is enabled, a previously located element is returned without a round trip.
 
         :param selector: The selector to use, an XPATH or CSS selector
         :type selector: str
         :param by: alternate method used to locate element, e.g. (By.id) See selenium.webdriver.common.by.By attributes
         :return: WebElement object
         """
+        cache = self.element_cache
+        if cache is not None:
+            elem = cache.get(selector, by)
+            if elem is not None:
+                return elem
         if by:
-            return self.find_element(by, selector)
-        if selector.startswith('/'):
-            return self.find_element_by_xpath(selector)
+            elem = self.find_element(by, selector)
+        elif selector.startswith('/'):
+            elem = self.find_element_by_xpath(selector)
         else:
-            return self.find_element_by_css_selector(selector)
+            elem = self.find_element_by_css_selector(selector)
+        if cache is not None:
+            cache.put(selector, elem, by)
+        return elem
 
     def get_element_text(self, element):
         """
@@ -177,18 +462,61 @@ class BehaveDriverMixin(object):
         When present on the WebElement, the element's 'value' property is returned. (For example, this is useful for
         getting the current text of Input elements)
         If the element has no 'value' property, the containing text is returned (elem.text)
+        Both are read in a single script call.
 
         :param element: CSS Selector or XPATH used to locate the element
         :type element: str
         :return: the text contained within the element.
         :rtype: str
         """
-        elem = self.get_element(element)
-        value = elem.get_property('value')
-        if value is not None:
-            return value
-        return elem.text
+        text = self.execute_script(scripts.ELEMENT_TEXT, element)
+        if text is None:
+            raise NoSuchElementException('Unable to locate element: {}'.format(element))
+        return text
+
+    def match_element_text(self, element, mode, expected='', excerpt_length=80):
+        """
+        Evaluates a text predicate against the text (or 'value' property) of an element inside the browser.
+        Only the expected string is sent and only the outcome, plus a short excerpt of the text, is returned.
 
+        :param element: CSS Selector or XPATH used to locate the element
+        :type element: str
+        :param mode: one of 'equals', 'contains', 'empty' or 'any' (any text)
+        :type mode: str
+        :param expected: the text to compare against, used by 'equals' and 'contains'
+        :type expected: str
+        :param excerpt_length: maximum length of the text excerpt returned for messages
+        :type excerpt_length: int
+        :return: the outcome of the predicate, truthy when it matched
+        :rtype: behave_webdriver.predicates.TextMatch
+        """
+        if mode not in TEXT_MODES:
+            raise ValueError('Invalid text mode "{}". Valid options are: {}'.format(mode, ', '.join(TEXT_MODES)))
+        result = self.execute_script(scripts.TEXT_PREDICATE, element, mode, expected, int(excerpt_length))
+        if result is None:
+            raise NoSuchElementException('Unable to locate element: {}'.format(element))
+        return TextMatch.from_script_result(result)
+
+    def compare_element_texts(self, first, second, excerpt_length=80):
+        """
+        Compares the texts (or 'value' properties) of two elements inside the browser. Neither text is transferred,
+        only whether they are the same and a short excerpt of each, around their first difference.
+
+        :param first: CSS Selector or XPATH used to locate the first element
+        :type first: str
+        :param second: CSS Selector or XPATH used to locate the second element
+        :type second: str
+        :param excerpt_length: maximum length of the text excerpts returned for messages
+        :type excerpt_length: int
+        :return: the outcomes for the first and second element, truthy when the texts are the same
+        :rtype: tuple
+        """
+        result = self.execute_script(scripts.SAME_TEXT, first, second, int(excerpt_length))
+        if isinstance(result, dict):
+            raise NoSuchElementException('Unable to locate element: {}'.format((first, second)[result['missing']]))
+        return tuple(TextMatch.from_script_result(text) for text in result)
+
+    @_retry_stale
     def get_element_attribute(self, element, attr, css=False, expected_value=None):
         """
         Get the value of an attribute or css attribute from an element.
@@ -215,6 +543,22 @@ class BehaveDriverMixin(object):
             value = elem.get_attribute(attr)
         return value
 
+    def get_element_geometry(self, element, scroll=False):
+        """
+        Measures the rect of an element along with the window scroll offsets and viewport size in one script call.
+
+        :param element: CSS Selector or XPATH used to locate the element
+        :type element: str
+        :param scroll: Whether or not to scroll the window to the element's location before measuring
+        :type scroll: bool
+        :return: the element geometry
+        :rtype: behave_webdriver.geometry.ElementGeometry
+        """
+        result = self.execute_script(scripts.ELEMENT_GEOMETRY, element, bool(scroll))
+        if result is None:
+            raise NoSuchElementException('Unable to locate element: {}'.format(element))
+        return ElementGeometry.from_script_result(result)
+
     def get_element_size(self, element):
         """
         Returns a dictionary containing the size information of an element.
@@ -225,8 +569,7 @@ class BehaveDriverMixin(object):
         :return: A dictionary with size information
         :rtype: dict
         """
-        elem = self.get_element(element)
-        return elem.size
+        return self.get_element_geometry(element).size
 
     def get_element_location(self, element):
         """
@@ -238,19 +581,25 @@ class BehaveDriverMixin(object):
         :return: the element's location
         :rtype: dict
         """
-        elem = self.get_element(element)
-        return elem.location
+        return self.get_element_geometry(element).location
 
-    def open_url(self, url):
+    def open_url(self, url, ready=None):
         """
         Navigate to an absolute URL
         Behaves same as ``driver.get`` but serves as a common entry-point for subclasses wanting to change this.
+        Then waits for the readiness conditions of the driver, if any, or those given.
 
         :param url: an absolute URL including the scheme
         :type url: str
+        :param ready: readiness conditions replacing those of the driver, see ``behave_webdriver.readiness``
         :return:
         """
-        return self.get(url)
+        result = self.get(url)
+        conditions = self.ready if ready is None else readiness.conditions(ready)
+        if conditions:
+            with timed_wait(self.roundtrips):
+                readiness.wait_until_ready(self, conditions, self.ready_timeout)
+        return result
 
     def element_exists(self, element):
         """
@@ -262,6 +611,8 @@ class BehaveDriverMixin(object):
         :return: True if the element could be found, False if it couldn't be found
         :rtype: bool
         """
+        if self.element_cache is not None:
+            self.element_cache.discard(element)  # a cached handle says nothing about the current page
         try:
             self.get_element(element)  # attempt to get the element
             return True  # if it succeeded, return True
@@ -269,6 +620,7 @@ class BehaveDriverMixin(object):
             # The element was not able to be located
             return False
 
+    @_retry_stale
     def element_visible(self, element):
         """
         Checks if an element is visible or not.
@@ -289,27 +641,9 @@ class BehaveDriverMixin(object):
         :param element: CSS Selector or XPATH used to locate the element
         :return:
         """
-        elem = self.get_element(element)
-        elem_left_bound = elem.location.get('x')
-        elem_top_bound = elem.location.get('y')
-        elem_width = elem.size.get('width')
-        elem_height = elem.size.get('height')
-        elem_right_bound = elem_left_bound + elem_width
-        elem_lower_bound = elem_top_bound + elem_height
-
-        win_upper_bound = self.execute_script('return window.pageYOffset')
-        win_left_bound = self.execute_script('return window.pageXOffset')
-        win_width = self.execute_script('return document.documentElement.clientWidth')
-        win_height = self.execute_script('return document.documentElement.clientHeight')
-        win_right_bound = win_left_bound + win_width
-        win_lower_bound = win_upper_bound + win_height
-
-        return all((win_left_bound <= elem_left_bound,
-                    win_right_bound >= elem_right_bound,
-                    win_upper_bound <= elem_top_bound,
-                    win_lower_bound >= elem_lower_bound)
-                   )
+        return self.get_element_geometry(element).in_viewport
 
+    @_retry_stale
     def element_enabled(self, element):
         """
         Checks if an element is enabled or not.
@@ -322,11 +656,13 @@ class BehaveDriverMixin(object):
         elem = self.get_element(element)
         return elem.is_enabled()
 
+    @_retry_stale
     def element_focused(self, element):
         elem = self.get_element(element)
         focused_elem = self.switch_to.active_element
         return elem == focused_elem
 
+    @_retry_stale
     def element_selected(self, element):
         """
         Checks if an element is selected or not.
@@ -350,12 +686,9 @@ class BehaveDriverMixin(object):
         :return: True or False, whether or not the value was found in the element.
         :rtype: bool
         """
-        elem = self.get_element(element)
-        element_value = elem.get_property('value')
-        if element_value is None:
-            element_value = elem.text
-        return value in element_value
+        return bool(self.match_element_text(element, 'contains', value))
 
+    @_retry_stale
     def element_has_class(self, element, cls):
         """
         Checks whether or not an element has a particular css class.
@@ -371,6 +704,22 @@ class BehaveDriverMixin(object):
         elem_classes = elem.get_attribute('class')
         return cls in elem_classes
 
+    def get_actionable_element(self, selector):
+        """
+        Get the element to act on. With ``auto_wait``, it is first waited for to be actionable, up to ``default_wait``;
+        when it does not become actionable in time, it is located anyway and the action reports the actual problem.
+
+        :param selector: CSS Selector or XPATH used to locate the element
+        :type selector: str
+        :return: WebElement object
+        """
+        if self.auto_wait:
+            result = self.wait_for_element_condition(selector, None, False, element_is_actionable)
+            if result is not None and result is not True:
+                return result  # the wait located it already
+        return self.get_element(selector)
+
+    @_retry_stale
     def click_element(self, element):
         """
         Click on an element. Note: this will not trigger some doubleclick events, even when n=2 with any delay.
@@ -379,9 +728,10 @@ class BehaveDriverMixin(object):
         :param element: CSS Selector or XPATH used to locate the element
         :type element: str
         """
-        elem = self.get_element(element)
+        elem = self.get_actionable_element(element)
         elem.click()
 
+    @_retry_stale
     def doubleclick_element(self, element):
         """
         Double click an element
@@ -390,7 +740,7 @@ class BehaveDriverMixin(object):
         :type element: str
         :return:
         """
-        elem = self.get_element(element)
+        elem = self.get_actionable_element(element)
         actions = ActionChains(self)
         actions.double_click(elem)
         actions.perform()
@@ -411,6 +761,7 @@ class BehaveDriverMixin(object):
         else:
             self.find_element_by_link_text(text).click()
 
+    @_retry_stale
     def drag_element(self, element, to_element):
         """
         Drag an element to the location of another element.
@@ -421,12 +772,13 @@ class BehaveDriverMixin(object):
         :type to_element: str
         :return:
         """
-        source_elem = self.get_element(element)
-        to_elem = self.get_element(to_element)
+        source_elem = self.get_actionable_element(element)
+        to_elem = self.get_actionable_element(to_element)
         actions = ActionChains(self)
         actions.drag_and_drop(source_elem, to_elem)
         actions.perform()
 
+    @_retry_stale
     def submit(self, element):
         """
         Shortcut for submitting an element
@@ -435,9 +787,149 @@ class BehaveDriverMixin(object):
         :type element: str
         :return:
         """
-        elem = self.get_element(element)
+        elem = self.get_actionable_element(element)
         elem.submit()
 
+    @_retry_stale
+    def set_input(self, element, value, fast=None):
+        """
+        Replace the value of an input field
+
+        :param element: CSS Selector or XPATH used to locate the element
+        :type element: str
+        :param value: the text to type
+        :type value: str
+        :param fast: whether or not to enter the value in one operation rather than type it. Defaults to whether the
+            value is as long as the driver's ``fast_input_threshold``
+        :type fast: bool
+        """
+        elem = self.get_actionable_element(element)
+        if self._enters_fast(value, fast) and self._enter_value(elem, value):
+            return
+        elem.clear()
+        elem.send_keys(value)
+
+    @_retry_stale
+    def add_input(self, element, value, fast=None):
+        """
+        Type text at the end of the value of an input field
+
+        :param element: CSS Selector or XPATH used to locate the element
+        :type element: str
+        :param value: the text to type
+        :type value: str
+        :param fast: whether or not to enter the text in one operation rather than type it. Defaults to whether the
+            text is as long as the driver's ``fast_input_threshold``
+        :type fast: bool
+        """
+        elem = self.get_actionable_element(element)
+        if self._enters_fast(value, fast) and self._enter_value(elem, value, append=True):
+            return
+        elem.send_keys(value)
+
+    def _enters_fast(self, value, fast):
+        if fast is not None:
+            return fast
+        threshold = self.fast_input_threshold
+        return threshold is not None and len(value) >= threshold
+
+    def _enter_value(self, elem, value, append=False):
+        """
+        Set the value of an element in one operation, between a keydown and a keyup event of its last character, with
+        the same setter (and input and change events) as ``fill_form``. Values longer than the ``maxlength`` of the
+        field are cut off, as typing them would be.
+
+        :return: whether or not the value was entered. Only input and textarea elements can be, others (such as
+            contenteditable editors) are to be typed into.
+        """
+        outcome = self.execute_script(scripts.SET_VALUE, elem, value, append)
+        if outcome is False:
+            return False
+        if outcome:
+            raise InvalidElementStateException('The input field {}'.format(outcome))
+        return True
+
+    @_retry_stale
+    def clear_input(self, element):
+        """
+        Clear the value of an input field
+
+        :param element: CSS Selector or XPATH used to locate the element
+        :type element: str
+        """
+        elem = self.get_actionable_element(element)
+        elem.clear()
+
+    def fill_form(self, form, fields, keystrokes=False):
+        """
+        Set the fields of a form. A field is located within the form by a CSS selector or XPATH, else by its name; a
+        group of radio buttons by name is set by checking the button of the value. Selects take the value or text of
+        an option, checkboxes and radio buttons are checked by any of ``true``, ``yes``, ``on``, ``checked``, ``1`` or
+        ``x`` (and unchecked by anything else).
+
+        By default, every field is located and set in a single script call that fires their ``input`` and ``change``
+        events. With ``keystrokes``, fields are typed into, clicked and selected like a user would, a few round trips
+        per field, for pages that listen to key events.
+
+        :param form: CSS Selector or XPATH used to locate the form
+        :type form: str
+        :param fields: the (field, value) pairs to set, in order, or a dictionary
+        :param keystrokes: whether or not to type with real keystrokes
+        :type keystrokes: bool
+        :raises NoSuchElementException: when the form or a field is not found. No field is set then, unless typing.
+        :raises InvalidElementStateException: when a field cannot be set, e.g. it is disabled or has no such option
+        """
+        if isinstance(fields, dict):
+            fields = fields.items()
+        fields = [(field, value) for field, value in fields]
+        if keystrokes:
+            self._type_form(form, fields)
+            return
+        if self.auto_wait:
+            self.wait_for_element_condition(form, None, False, 'be visible')
+        outcome = self.execute_script(scripts.FILL_FORM, form, [list(field) for field in fields])
+        if outcome is None:
+            raise NoSuchElementException('Unable to locate form: {}'.format(form))
+        if outcome['missing']:
+            raise NoSuchElementException('Unable to locate fields of form {}: {}'.format(
+                form, ', '.join(outcome['missing'])))
+        if outcome['errors']:
+            raise InvalidElementStateException('Could not fill form {}: {}'.format(form, '; '.join(outcome['errors'])))
+
+    @_retry_stale
+    def _type_form(self, form, fields):
+        form_elem = self.get_actionable_element(form)
+        for field, value in fields:
+            elem = self._locate_field(form_elem, field, value)
+            input_type = (elem.get_attribute('type') or '').lower()
+            if elem.tag_name.lower() == 'select':
+                select = Select(elem)
+                try:
+                    select.select_by_visible_text(value)
+                except NoSuchElementException:
+                    select.select_by_value(value)
+            elif input_type in ('checkbox', 'radio'):
+                checked = value.lower() in _CHECKED_VALUES or (input_type == 'radio' and
+                                                               elem.get_attribute('value') == value)
+                if elem.is_selected() != checked:
+                    elem.click()
+            elif not (self._enters_fast(value, None) and self._enter_value(elem, value)):
+                elem.clear()
+                elem.send_keys(value)
+
+    @staticmethod
+    def _locate_field(form_elem, field, value):
+        if field.startswith('/'):
+            return form_elem.find_element_by_xpath(field)
+        try:
+            return form_elem.find_element_by_css_selector(field)
+        except (NoSuchElementException, InvalidSelectorException):
+            pass
+        for elem in form_elem.find_elements_by_name(field):
+            if elem.get_attribute('type') != 'radio' or elem.get_attribute('value') == value:
+                return elem
+        raise NoSuchElementException('Unable to locate field {} of form'.format(field))
+
     def send_keys(self, keys):
         """
         Send arbitrary keys. Note: this is different than sending keys directly to an element.
@@ -476,10 +968,7 @@ class BehaveDriverMixin(object):
         :param element: CSS Selector or XPATH used to locate the element
         :return:
         """
-        location = self.get_element_location(element)
-        x = location['x']
-        y = location['y']
-        self.scroll_to(x, y)
+        self.get_element_geometry(element, scroll=True)
 
     def scroll_to(self, x, y):
         """
@@ -496,6 +985,7 @@ class BehaveDriverMixin(object):
         y = int(y)
         self.execute_script('window.scrollTo({}, {});'.format(x, y))
 
+    @_retry_stale
     def move_to_element(self, element, offset=None):
         """
         Moves the mouse to the middle of an element
@@ -518,22 +1008,46 @@ class BehaveDriverMixin(object):
         """
         Pause for a number of miliseconds.
         ``time.sleep`` is used here due to issues with w3c browsers and ActionChain pause feature.
+        With ``smart_pause``, the pause ends early once the page is quiescent.
 
         :param milliseconds: number of miliseconds to wait
         :type milliseconds: int
         :return:
         """
         seconds = round(milliseconds / 1000, 3)
-        time.sleep(seconds)
+        started = time.time()
+        with timed_wait(self.roundtrips):
+            if self.smart_pause is not None and seconds > 0:
+                self._smart_pause(seconds)
+            else:
+                time.sleep(seconds)
+        self.pauses.record(seconds, time.time() - started)
+
+    def _smart_pause(self, seconds):
+        started = time.time()
+        try:
+            wait_for_quiescence(self, seconds, round(self.smart_pause / 1000, 3))
+        except WebDriverException:
+            # e.g. no async script support or the page navigated away mid-pause, sleep for the remaining time
+            time.sleep(max(seconds - (time.time() - started), 0))
 
-    def wait_for_element_condition(self, element, ms, negative, condition):
+    def wait_for_element_condition(self, element, ms, negative, condition, polling=None):
         """
         Wait on an element until a certain condition is met, up to a maximum amount of time to wait.
+        The condition is evaluated inside the page in a single round trip (see ``behave_webdriver.waits.BrowserWait``)
+        when the driver supports it, otherwise it is polled with ``behave_webdriver.waits.PollingWait``.
+
+        Conditions named in one string with ``and`` (or ``or``), e.g. ``'be visible and be enabled'``, are combined
+        with :py:class:`~behave_webdriver.conditions.all_of` (or :py:class:`~behave_webdriver.conditions.any_of`), which
+        evaluates them against the element located once per poll; ``negative`` then negates the combination as a whole.
 
         :param element: CSS Selector or XPATH used to locate the element
         :param ms: maximum time (in milliseconds) to wait for the condition to be true
         :param negative: whether or not the check for negation of condition. Will coarse boolean from value
-        :param condition: the condition to check for. Defaults to checking for presence of element
+        :param condition: the condition to check for. Defaults to checking for presence of element.
+            Either its name(s), or a callable taking the locator and ``negative`` keyword argument that returns an
+            expected condition, such as the classes of ``behave_webdriver.conditions``
+        :param polling: the polling strategy (or its name) when the condition is polled, defaults to the driver's
         :return: element
         """
         if not ms:
@@ -541,6 +1055,20 @@ class BehaveDriverMixin(object):
         else:
             seconds = round(ms / 1000, 3)
 
+        if element.startswith('/'):
+            locator = (By.XPATH, element)
+        else:
+            locator = (By.CSS_SELECTOR, element)
+
+        if callable(condition):
+            expected_condition = condition(locator, negative=bool(negative))
+        else:
+            expected_condition = self._named_condition(locator, condition, bool(negative))
+        with timed_wait(self.roundtrips):
+            return self._wait_until(expected_condition, seconds, polling)
+
+    @staticmethod
+    def _named_condition(locator, condition, negative):
         condition_text_map = {
             'be checked': element_is_selected,
             'be enabled': element_is_enabled,
@@ -551,25 +1079,42 @@ class BehaveDriverMixin(object):
             'exist': element_is_present,
         }
 
-        if condition:
-            expected = condition_text_map[condition]
+        if not condition:
+            return element_is_present(locator, negative=negative)
+        if ' and ' in condition and ' or ' in condition:
+            raise ValueError('Cannot mix "and" with "or" in condition "{}"'.format(condition))
+        if ' or ' in condition:
+            names, combine = condition.split(' or '), any_of
         else:
-            expected = element_is_present
-
-        if element.startswith('/'):
-            locator = (By.XPATH, element)
-        else:
-            locator = (By.CSS_SELECTOR, element)
-
-        wait = WebDriverWait(self, seconds)
+            names, combine = condition.split(' and '), all_of
+        if len(names) == 1:
+            return condition_text_map[condition](locator, negative=negative)
+        return combine(*[condition_text_map[name](locator) for name in names], negative=negative)
+
+    def _wait_until(self, expected_condition, seconds, polling=None):
+        browser_wait = BrowserWait(self, seconds)
+        if browser_wait.supports(expected_condition):
+            started = time.time()
+            try:
+                return browser_wait.until(expected_condition)
+            except TimeoutException:
+                return None
+            except WebDriverException:
+                # e.g. no async script support or the page navigated away mid-wait, poll for the remaining time
+                seconds = max(seconds - (time.time() - started), 0)
+
+        if polling is None:
+            polling = self.polling
+        wait = PollingWait(self, seconds, polling, self.waits)
 
         try:
-            result = wait.until(expected(locator, negative=bool(negative)))
+            result = wait.until(expected_condition)
         except TimeoutException:
             result = None
 
         return result
 
+    @_retry_stale
     def select_option(self, select_element, by, by_arg):
         """
         Implements features for selecting options in Select elements. Uses selenium's ``Select`` support class.
@@ -675,6 +1220,38 @@ class Android(BehaveDriverMixin, webdriver.Android):
 class Remote(BehaveDriverMixin, webdriver.Remote):
     """
     Remote driver class. Alternate constructors and browser-specific logic is implemented here.
+
+    Passing ``connection_pool`` (True, or a dict of ``PooledRemoteConnection`` options) sends commands through a
+    :py:class:`~behave_webdriver.remote_connection.PooledRemoteConnection` that keeps its connections to the server
+    alive. This also works through the fixture and ``from_string`` keyword arguments:
+
+    >>> use_fixture(fixture_browser, ctx, webdriver_name='remote', command_executor='http://grid:4444/wd/hub',
+    ...             connection_pool={'pool_size': 2, 'timeout': 60}, desired_capabilities={'browserName': 'chrome'})
     """
-    pass
+    def __init__(self, *args, **kwargs):
+        connection_pool = kwargs.pop('connection_pool', None)
+        if connection_pool:
+            options = {} if connection_pool is True else dict(connection_pool)
+            if args:
+                args = (self._pooled_executor(args[0], options),) + tuple(args[1:])
+            else:
+                command_executor = kwargs.get('command_executor', 'http://127.0.0.1:4444/wd/hub')
+                kwargs['command_executor'] = self._pooled_executor(command_executor, options)
+        super(Remote, self).__init__(*args, **kwargs)
+
+    @staticmethod
+    def _pooled_executor(command_executor, options):
+        if isinstance(command_executor, RemoteConnection):
+            return command_executor  # already a connection object, leave it as configured
+        if isinstance(command_executor, bytes):
+            command_executor = command_executor.decode('utf-8')
+        return PooledRemoteConnection(command_executor, **options)
+
+    def quit(self):
+        try:
+            super(Remote, self).quit()
+        finally:
+            from behave_webdriver.recording import RecordingConnection
+            if isinstance(self.command_executor, (PooledRemoteConnection, RecordingConnection)):
+                self.command_executor.close()  # a recording connection closes the pooled one it wraps
 
@@ -4,9 +4,44 @@ Provides fixtures to initialize the web driver.
 from behave import fixture, use_fixture
 from behave_webdriver.utils import _from_string, _from_env
 from behave_webdriver.driver import BehaveDriverMixin
+from behave_webdriver.pool import DriverPool
 
 
 _env_webdriver_name = 'env'
+_pool_options = ('size', 'max_uses', 'reset', 'health_check')
+_shared_pools = {}
+
+
+def _configuration_key(value):
+    """
+    A hashable form of driver constructor arguments, equal for equal configurations. Selenium options compare by the
+    capabilities they describe, other objects that cannot be compared by value by their identity.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted(((name, _configuration_key(item)) for name, item in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_configuration_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_configuration_key(item) for item in value)
+    to_capabilities = getattr(value, 'to_capabilities', None)
+    if callable(to_capabilities):
+        return type(value), _configuration_key(to_capabilities())
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), id(value)
+    return value
+
+
+def _shared_pool(key, options):
+    """
+    Pools configured through fixture keyword arguments outlive a single fixture usage (e.g. a scenario), so they are
+    kept here, one per driver configuration (selection and constructor arguments) and pool configuration.
+    """
+    key = (key, tuple(sorted((name, repr(value)) for name, value in options.items())))
+    if key not in _shared_pools:
+        _shared_pools[key] = DriverPool(**options)
+    return _shared_pools[key]
 
 
 @fixture
@@ -16,7 +51,8 @@ def fixture_browser(ctx, *args, **kwargs):
     
     Can raise ValueError in case of bad parameters.
 
-    Will destroy the driver at the end of this fixture usage.
+    Will destroy the driver at the end of this fixture usage, unless a pool is used. Pooled drivers are reset and kept
+    alive for the next fixture usage instead, see :py:class:`~behave_webdriver.pool.DriverPool`.
 
     :param webdriver_name: the name of the webdriver.
                            Special 'env' name is to tell to get the name from `BEHAVE_WEBDRIVER` environment variable.
@@ -32,6 +68,14 @@ def fixture_browser(ctx, *args, **kwargs):
                             Default to None.
     :param default_driver: used for `from_env` method in `webdriver_name` is 'env'.
                            Default to None.
+    :param pool: a `behave_webdriver.pool.DriverPool` to take the driver from and give it back to.
+                 Default to None.
+    :param pool_size: use a pool of this many live drivers, shared by every fixture usage with the same driver
+                      selection, constructor arguments and pool options. Default to None (no pool).
+    :param pool_max_uses: recycle a pooled driver after this many uses. Default to None (never).
+    :param pool_reset: how to reset a pooled driver between uses, see `DriverPool`. Default to 'full'.
+    :param pool_health_check: whether or not to check a pooled driver still responds before using it.
+                              Default to True.
     :param args: arguments that will be passed as is to the driver constructor.
                  They will be added to those from `webdriver_args`.
     :param kwargs: keywords arguments that will be passed as is to the driver constructor.
@@ -100,10 +144,19 @@ def fixture_browser(ctx, *args, **kwargs):
     ...         return ([], {})
     >>> def before_all(ctx):
     ...     use_fixture(fixture_browser, ctx, webdriver_args=get_driver_args)
+
+    You could keep warm drivers between scenarios instead of launching a browser for each one:
+
+    >>> from behave import use_fixture
+    >>> from behave_webdriver import fixture_browser
+    >>> def before_scenario(ctx, scenario):
+    ...     use_fixture(fixture_browser, ctx, webdriver_name='chrome.headless', pool_size=1, pool_max_uses=100)
     """
     webdriver_name = kwargs.pop('webdriver_name', _env_webdriver_name)
     webdriver_class = kwargs.pop('webdriver_class', None)
     webdriver_args = kwargs.pop('webdriver_args', None)
+    pool = kwargs.pop('pool', None)
+    pool_options = dict((option, kwargs.pop('pool_' + option)) for option in _pool_options if 'pool_' + option in kwargs)
     if webdriver_class is not None:
         if BehaveDriverMixin not in webdriver_class.mro():
             raise ValueError('The driver "{}" does not inherit from BehaveDriverMixin.'.format(webdriver_class.__name__))
@@ -121,12 +174,44 @@ def fixture_browser(ctx, *args, **kwargs):
         wd_args, wd_kwargs = webdriver_args(ctx, webdriver_class)
         args = tuple(wd_args) + tuple(args)
         kwargs = dict(list(wd_kwargs.items()) + list(kwargs.items()))
-    ctx.behave_driver = webdriver_class(*args, **kwargs)
-    yield ctx.behave_driver
-    ctx.behave_driver.quit()
+    if pool is None and pool_options:
+        pool_key = (webdriver_name, webdriver_class, _configuration_key(args), _configuration_key(kwargs))
+        pool = _shared_pool(pool_key, pool_options)
+    if pool is None:
+        ctx.behave_driver = webdriver_class(*args, **kwargs)
+        yield ctx.behave_driver
+        ctx.behave_driver.quit()
+    else:
+        ctx.behave_driver = pool.acquire(lambda: webdriver_class(*args, **kwargs))
+        yield ctx.behave_driver
+        pool.release(ctx.behave_driver)
     del ctx.behave_driver
 
 
+@fixture
+def fixture_site(ctx, root, **kwargs):
+    """
+    Serve the static files of a directory on a free port for the duration of this fixture usage, as
+    `ctx.site_server`, and set `ctx.base_url` to its URL for the `I open the site` steps.
+
+    :param root: the directory to serve
+    :param kwargs: keyword arguments of `behave_webdriver.server.SiteServer`, e.g. `gzip` or `max_age`
+    :return: the started `SiteServer`
+
+    >>> from behave import use_fixture
+    >>> from behave_webdriver.fixtures import fixture_browser, fixture_site
+    >>> def before_all(ctx):
+    ...     use_fixture(fixture_site, ctx, 'tests/demo-app')
+    ...     use_fixture(fixture_browser, ctx)
+    """
+    from behave_webdriver.server import SiteServer
+    ctx.site_server = SiteServer(root, **kwargs).start()
+    ctx.base_url = ctx.site_server.url.rstrip('/')
+    yield ctx.site_server
+    ctx.site_server.stop()
+    del ctx.site_server
+
+
 def before_all_factory(*args, **kwargs):
     """
     Create and return a `before_all` function that use the `fixture_browser` fixture with the corresponding arguments
@@ -0,0 +1,65 @@
+"""
+Provides the element geometry snapshot used for size, position and viewport checks.
+"""
+
+
+class ElementGeometry(object):
+    """
+    The bounding box of an element together with the scroll offsets and client size of the window it was measured in.
+    All values are collected by a single script call, see :py:meth:`~behave_webdriver.driver.BehaveDriverMixin.get_element_geometry`.
+
+    Element coordinates are relative to the document (like ``WebElement.location``), not to the viewport.
+    """
+    def __init__(self, x, y, width, height, scroll_x=0, scroll_y=0, viewport_width=0, viewport_height=0):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.scroll_x = scroll_x
+        self.scroll_y = scroll_y
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+
+    @classmethod
+    def from_script_result(cls, result):
+        """
+        Build an instance from the dictionary returned by ``behave_webdriver.scripts.ELEMENT_GEOMETRY``
+        """
+        return cls(x=result['x'],
+                   y=result['y'],
+                   width=result['width'],
+                   height=result['height'],
+                   scroll_x=result['scrollX'],
+                   scroll_y=result['scrollY'],
+                   viewport_width=result['viewportWidth'],
+                   viewport_height=result['viewportHeight'])
+
+    @property
+    def location(self):
+        """
+        Same format as ``WebElement.location``: a dict with rounded 'x' and 'y' keys.
+        """
+        return {'x': int(round(self.x)), 'y': int(round(self.y))}
+
+    @property
+    def size(self):
+        """
+        Same format as ``WebElement.size``: a dict with 'width' and 'height' keys.
+        """
+        return {'width': self.width, 'height': self.height}
+
+    @property
+    def in_viewport(self):
+        """
+        Whether or not the element is *completely* within the viewport.
+        """
+        x = self.location['x']
+        y = self.location['y']
+        return all((self.scroll_x <= x,
+                    self.scroll_x + self.viewport_width >= x + self.width,
+                    self.scroll_y <= y,
+                    self.scroll_y + self.viewport_height >= y + self.height)
+                   )
+
+    def __repr__(self):
+        return '<ElementGeometry x={} y={} width={} height={}>'.format(self.x, self.y, self.width, self.height)
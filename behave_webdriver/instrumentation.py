@@ -0,0 +1,266 @@
+"""
+Provides WebDriver round trip accounting per step and per scenario, and round trip budgets.
+
+Every command a ``BehaveDriverMixin`` driver sends to the browser is counted, along with its wall time, in the
+driver's ``roundtrips`` (a :py:class:`RoundTrips`). Call the hooks of this module from your ``environment.py`` to
+attribute them to steps and scenarios:
+
+>>> from behave_webdriver import instrumentation
+>>> def before_scenario(context, scenario):
+...     instrumentation.before_scenario(context, scenario)
+>>> def before_step(context, step):
+...     instrumentation.before_step(context, step)
+>>> def after_step(context, step):
+...     instrumentation.after_step(context, step)
+>>> def after_scenario(context, scenario):
+...     instrumentation.after_scenario(context, scenario)
+
+After each step, ``step.roundtrips`` holds the number of commands the step issued, ``step.roundtrip_time`` the
+seconds spent on them and ``step.wait_time`` the seconds spent in explicit waits and pauses (commands issued while
+waiting count in both). Scenarios get the same attributes, totalled over their steps and hooks.
+
+A budget of round trips per step can be set for a scenario or a feature with a tag, or for the whole run with
+userdata. Steps over budget fail, or only warn with ``roundtrip_budget_action=warn``::
+
+    @roundtrip_budget=4
+    Scenario: ...
+
+    behave -D roundtrip_budget=6 -D roundtrip_budget_action=warn
+"""
+import time
+import warnings
+from collections import namedtuple
+from contextlib import contextmanager
+
+BUDGET_TAG = 'roundtrip_budget='
+BUDGET_ACTIONS = ('fail', 'warn')
+
+#: Round trips and timings over a span of time, e.g. a step
+RoundTripUsage = namedtuple('RoundTripUsage', ('roundtrips', 'roundtrip_time', 'wait_time'))
+
+
+class RoundTripBudgetExceeded(AssertionError):
+    """
+    Raised after a step that issued more WebDriver commands than its budget.
+    """
+
+
+class RoundTripBudgetWarning(UserWarning):
+    """
+    Warned after a step that issued more WebDriver commands than its budget, with ``roundtrip_budget_action=warn``.
+    """
+
+
+class RoundTrips(object):
+    """
+    Counts the commands sent to the browser and the time spent on them.
+
+    >>> behave_driver.roundtrips.commands
+    12
+    >>> behave_driver.roundtrips.by_command
+    {'newSession': 1, 'findElement': 6, 'isElementDisplayed': 5}
+    """
+    def __init__(self):
+        self.commands = 0
+        self.seconds = 0.0
+        self.wait_seconds = 0.0
+        self.by_command = {}
+
+    def record(self, command, seconds):
+        self.commands += 1
+        self.seconds += seconds
+        self.by_command[command] = self.by_command.get(command, 0) + 1
+
+    def record_wait(self, seconds):
+        self.wait_seconds += seconds
+
+    def snapshot(self):
+        """
+        :return: the current totals, to be compared later with :py:meth:`since`
+        :rtype: RoundTripUsage
+        """
+        return RoundTripUsage(self.commands, self.seconds, self.wait_seconds)
+
+    def since(self, snapshot):
+        """
+        :return: the round trips and timings since ``snapshot`` was taken
+        :rtype: RoundTripUsage
+        """
+        return RoundTripUsage(self.commands - snapshot.roundtrips,
+                              self.seconds - snapshot.roundtrip_time,
+                              self.wait_seconds - snapshot.wait_time)
+
+    def reset(self):
+        self.__init__()
+
+
+@contextmanager
+def timed_wait(roundtrips):
+    """
+    Record the time spent in a block as waiting time of ``roundtrips`` (if not None).
+    """
+    started = time.time()
+    try:
+        yield
+    finally:
+        if roundtrips is not None:
+            roundtrips.record_wait(time.time() - started)
+
+
+class PauseLog(object):
+    """
+    The time requested and the time actually spent by each pause of a driver. With smart pauses, the difference is
+    the time a plain sleep would have wasted.
+
+    >>> behave_driver.pauses.requested, behave_driver.pauses.actual, behave_driver.pauses.saved
+    (3.0, 0.412, 2.588)
+    """
+    def __init__(self):
+        self.entries = []
+
+    def record(self, requested, actual):
+        """
+        :param requested: the seconds the pause was asked for
+        :param actual: the seconds it lasted
+        """
+        self.entries.append((requested, actual))
+
+    @property
+    def requested(self):
+        return sum(requested for requested, _ in self.entries)
+
+    @property
+    def actual(self):
+        return sum(actual for _, actual in self.entries)
+
+    @property
+    def saved(self):
+        return max(self.requested - self.actual, 0.0)
+
+    def reset(self):
+        self.__init__()
+
+
+#: A wait polled from the test process
+WaitEntry = namedtuple('WaitEntry', ('polling', 'polls', 'seconds', 'succeeded'))
+
+
+class WaitLog(object):
+    """
+    The polling strategy, number of polls and duration of each polled wait of a driver, e.g. to tune the polling
+    strategy for both latency and load. The duration of a successful wait is its time to success.
+
+    >>> behave_driver.waits.polls, behave_driver.waits.time_to_success
+    (14, 1.843)
+    """
+    def __init__(self):
+        self.entries = []
+
+    def record(self, polling, polls, seconds, succeeded):
+        """
+        :param polling: the name of the polling strategy
+        :param polls: the number of times the condition was evaluated
+        :param seconds: the duration of the wait
+        :param succeeded: whether or not the condition held before the timeout
+        """
+        self.entries.append(WaitEntry(polling, polls, seconds, succeeded))
+
+    @property
+    def polls(self):
+        return sum(entry.polls for entry in self.entries)
+
+    @property
+    def time_to_success(self):
+        """
+        The total seconds successful waits took
+        """
+        return sum(entry.seconds for entry in self.entries if entry.succeeded)
+
+    @property
+    def timeouts(self):
+        return sum(1 for entry in self.entries if not entry.succeeded)
+
+    def reset(self):
+        self.__init__()
+
+
+def _driver_roundtrips(context):
+    driver = getattr(context, 'behave_driver', None)
+    return getattr(driver, 'roundtrips', None)
+
+
+def budget_for(context, scenario=None):
+    """
+    The round trip budget per step: from a ``@roundtrip_budget=N`` tag of the scenario or, failing that, of its
+    feature, else from the ``roundtrip_budget`` userdata.
+
+    :return: the maximum number of round trips per step, or None when there is no budget
+    :rtype: int
+    """
+    scenario = scenario or getattr(context, 'scenario', None)
+    tag_sources = [getattr(scenario, 'effective_tags', None) or getattr(scenario, 'tags', None),
+                   getattr(getattr(scenario, 'feature', None), 'tags', None)]
+    for tags in tag_sources:
+        for tag in tags or ():
+            if tag.startswith(BUDGET_TAG):
+                return int(tag[len(BUDGET_TAG):])
+    userdata = getattr(getattr(context, 'config', None), 'userdata', None) or {}
+    budget = userdata.get('roundtrip_budget')
+    return int(budget) if budget not in (None, '') else None
+
+
+def budget_action(context):
+    userdata = getattr(getattr(context, 'config', None), 'userdata', None) or {}
+    action = userdata.get('roundtrip_budget_action', 'fail')
+    if action not in BUDGET_ACTIONS:
+        raise ValueError('Invalid roundtrip_budget_action "{}". Valid options are: {}'.format(action,
+                                                                                              ', '.join(BUDGET_ACTIONS)))
+    return action
+
+
+def _attach(statement, usage):
+    statement.roundtrips = usage.roundtrips
+    statement.roundtrip_time = usage.roundtrip_time
+    statement.wait_time = usage.wait_time
+
+
+def before_scenario(context, scenario):
+    roundtrips = _driver_roundtrips(context)
+    if roundtrips is not None:
+        context.roundtrips_scenario_start = roundtrips.snapshot()
+
+
+def after_scenario(context, scenario):
+    roundtrips = _driver_roundtrips(context)
+    start = getattr(context, 'roundtrips_scenario_start', None)
+    if roundtrips is not None and start is not None:
+        _attach(scenario, roundtrips.since(start))
+
+
+def before_step(context, step):
+    roundtrips = _driver_roundtrips(context)
+    if roundtrips is not None:
+        context.roundtrips_step_start = roundtrips.snapshot()
+
+
+def after_step(context, step):
+    """
+    Attach the step's round trips and timings to it and enforce the budget.
+
+    :raises RoundTripBudgetExceeded: when the step is over budget and the budget action is 'fail'
+    """
+    roundtrips = _driver_roundtrips(context)
+    start = getattr(context, 'roundtrips_step_start', None)
+    if roundtrips is None or start is None:
+        return
+    usage = roundtrips.since(start)
+    _attach(step, usage)
+    budget = budget_for(context)
+    if budget is None or usage.roundtrips <= budget:
+        return
+    message = 'Step "{} {}" issued {} WebDriver commands ({:.3f}s), over its budget of {}'.format(
+        step.keyword, step.name, usage.roundtrips, usage.roundtrip_time, budget)
+    if budget_action(context) == 'warn':
+        warnings.warn(message, RoundTripBudgetWarning)
+    else:
+        raise RoundTripBudgetExceeded(message)
@@ -0,0 +1,223 @@
+"""
+Provides the step matchers of the step library, indexed by the leading literal text of their patterns.
+
+behave tries every step definition in turn on each step, so a step costs a regex (or parse) match per definition of
+the library. The 'indexed-parse' and 'indexed-re' matchers behave like 'parse' and 're', but share a
+:py:class:`StepIndex` of their patterns by leading literal text (e.g. ``I expect that element "``). The candidates of
+a step text are looked up once, and every other indexed definition rejects the step with a dictionary lookup instead of
+a match. Match results are memoized per distinct step text.
+
+They can be used for your own steps too:
+
+>>> from behave import use_step_matcher
+>>> import behave_webdriver.matchers
+>>> use_step_matcher(behave_webdriver.matchers.INDEXED_RE)
+"""
+from behave import matchers as _matchers
+
+INDEXED_PARSE = 'indexed-parse'
+INDEXED_RE = 'indexed-re'
+
+_REGEX_SPECIAL = '.^$*+?{}[]\\|()'
+
+
+def _has_top_level_alternation(pattern):
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+    return False
+
+
+def regex_prefix(pattern):
+    """
+    The literal text every match of a regular expression starts with.
+
+    >>> regex_prefix('I expect that element "([^"]*)?" is( not)* visible')
+    'I expect that element "'
+    """
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    if _has_top_level_alternation(pattern):
+        return ''
+    prefix = []
+    for char in pattern:
+        if char in _REGEX_SPECIAL:
+            if char in '*?{' and prefix:
+                prefix.pop()  # the quantified character is optional
+            break
+        prefix.append(char)
+    return ''.join(prefix)
+
+
+def parse_prefix(pattern):
+    """
+    The literal text every match of a parse expression starts with.
+
+    >>> parse_prefix('I click on the element "{element}"')
+    'I click on the element "'
+    """
+    return pattern.split('{', 1)[0]
+
+
+class StepIndex(object):
+    """
+    Indexes matchers by the leading literal text of their pattern, keyed by its first complete words (up to
+    ``KEY_WORDS``). Comparisons are case insensitive, so the candidates of a step text are a superset of the matchers
+    matching it.
+
+    :param memo_size: the number of distinct step texts whose candidates are memoized
+    """
+    KEY_WORDS = 3
+
+    def __init__(self, memo_size=10000):
+        self.memo_size = memo_size
+        self._by_words = {}
+        self._unindexed = []
+        self._candidates = {}
+        self._last_text = None
+        self._last_candidates = frozenset()
+        self.lookups = 0
+        self.memo_hits = 0
+
+    def add(self, matcher, prefix):
+        prefix = prefix.lower()
+        words = prefix.split(' ')[:-1][:self.KEY_WORDS]  # the last one may be incomplete
+        if words:
+            self._by_words.setdefault(' '.join(words), []).append((prefix, matcher))
+        else:
+            self._unindexed.append((prefix, matcher))  # no complete first word to index it by
+        self._candidates.clear()
+        self._last_text = None
+
+    def candidates(self, step_text):
+        """
+        :return: the matchers that may match a step text
+        :rtype: frozenset
+        """
+        if step_text is self._last_text:
+            return self._last_candidates  # every definition is tried on the same step text in turn
+        self.lookups += 1
+        found = self._candidates.get(step_text)
+        if found is None:
+            found = self._find_candidates(step_text)
+        else:
+            self.memo_hits += 1
+        self._last_text, self._last_candidates = step_text, found
+        return found
+
+    def _find_candidates(self, step_text):
+        text = step_text.lower()
+        words = text.split(' ', self.KEY_WORDS)
+        entries = list(self._unindexed)
+        for count in range(1, min(len(words) - 1, self.KEY_WORDS) + 1):
+            entries.extend(self._by_words.get(' '.join(words[:count]), ()))
+        found = frozenset(matcher for prefix, matcher in entries if text.startswith(prefix))
+        if len(self._candidates) >= self.memo_size:
+            self._candidates.clear()
+        self._candidates[step_text] = found
+        return found
+
+    def matchers(self):
+        return [matcher for entries in list(self._by_words.values()) + [self._unindexed] for _, matcher in entries]
+
+    def clear_memo(self):
+        """
+        Forget the memoized candidates and match results.
+        """
+        self._candidates.clear()
+        self._last_text = None
+        for matcher in self.matchers():
+            matcher._memo.clear()
+
+    def stats(self):
+        return {'patterns': sum(len(entries) for entries in self._by_words.values()) + len(self._unindexed),
+                'unindexed': len(self._unindexed),
+                'lookups': self.lookups,
+                'memo_hits': self.memo_hits}
+
+
+#: The index shared by every indexed matcher
+step_index = StepIndex()
+
+
+class IndexedMatcherMixin(object):
+    """
+    Rejects the step texts of other index entries without matching them, and memoizes matches.
+
+    Subclasses override :py:meth:`literal_prefix` for their pattern syntax.
+    """
+    index = step_index
+
+    def __init__(self, func, pattern, *args, **kwargs):
+        super(IndexedMatcherMixin, self).__init__(func, pattern, *args, **kwargs)
+        self._memo = {}
+        self.index.add(self, self.literal_prefix(pattern))
+
+    def literal_prefix(self, pattern):
+        """
+        The literal text every step text matching the pattern starts with. The default, '', indexes nothing: the
+        matcher is a candidate for every step text.
+        """
+        return ''
+
+    def match(self, step_text):
+        if self not in self.index.candidates(step_text):
+            return None
+        try:
+            return self._memo[step_text]
+        except KeyError:
+            pass
+        result = super(IndexedMatcherMixin, self).match(step_text)
+        if isinstance(result, _matchers.MatchWithError):
+            return result  # e.g. a failed type conversion, reported afresh each time
+        if len(self._memo) >= self.index.memo_size:
+            self._memo.clear()
+        self._memo[step_text] = result
+        return result
+
+
+def _matcher_class(name):
+    try:
+        return _matchers.get_step_matcher_factory().step_matcher_class_mapping[name]
+    except AttributeError:  # behave < 1.2.7
+        return _matchers.matcher_mapping[name]
+
+
+def _register(name, matcher_class):
+    try:
+        _matchers.register_step_matcher_class(name, matcher_class, override=True)
+    except AttributeError:  # behave < 1.2.7
+        _matchers.matcher_mapping[name] = matcher_class
+
+
+class IndexedParseMatcher(IndexedMatcherMixin, _matcher_class('parse')):
+    NAME = INDEXED_PARSE
+
+    def literal_prefix(self, pattern):
+        return parse_prefix(pattern)
+
+
+class IndexedRegexMatcher(IndexedMatcherMixin, _matcher_class('re')):
+    NAME = INDEXED_RE
+
+    def literal_prefix(self, pattern):
+        return regex_prefix(pattern)
+
+
+_register(INDEXED_PARSE, IndexedParseMatcher)
+_register(INDEXED_RE, IndexedRegexMatcher)
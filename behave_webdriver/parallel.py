@@ -0,0 +1,231 @@
+"""
+Runs behave features in parallel worker processes, each with its own driver.
+
+Usage::
+
+    python -m behave_webdriver.parallel [paths ...] [--workers N] [--driver NAME] [--outfile FILE] [-- behave args]
+
+Feature files found under ``paths`` (default: ``features``) are split across the workers, balancing their durations
+recorded by previous runs in a timings file (see :py:mod:`behave_webdriver.timings`). Every worker is a separate
+``behave`` process and gets its own driver through the usual ``from_env``/``fixture_browser`` machinery: ``--driver``
+is passed to the workers as the ``BEHAVE_WEBDRIVER`` environment variable, and ``BEHAVE_WEBDRIVER_WORKER`` holds the
+worker index, for environments that need to pick e.g. a port per worker.
+
+The JSON reports of the workers are merged into a single behave JSON report (``--outfile``) and the exit code is
+non-zero when any worker failed.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from behave_webdriver.timings import DEFAULT_TIMINGS_FILE, Timings, shard_by_duration
+
+
+def discover_features(paths):
+    """
+    Find feature files.
+
+    :param paths: feature files and/or directories to search recursively
+    :type paths: list
+    :return: sorted list of feature file paths
+    :rtype: list
+    """
+    features = []
+    for path in paths:
+        if os.path.isfile(path):
+            features.append(path)
+            continue
+        if not os.path.isdir(path):
+            raise ValueError('No such feature file or directory "{}"'.format(path))
+        for dirpath, dirnames, filenames in os.walk(path):
+            features.extend(os.path.join(dirpath, filename)
+                            for filename in filenames if filename.endswith('.feature'))
+    return sorted(features)
+
+
+def shard_features(features, workers):
+    """
+    Split features across workers, round-robin.
+
+    :param features: feature file paths
+    :param workers: number of workers
+    :return: a list of ``workers`` lists of feature file paths (some possibly empty)
+    :rtype: list
+    """
+    shards = [[] for _ in range(workers)]
+    for index, feature in enumerate(features):
+        shards[index % workers].append(feature)
+    return shards
+
+
+class Worker(object):
+    """
+    A behave process running one shard of features, writing its JSON report and console output to ``workdir``.
+    """
+    def __init__(self, index, features, behave_args, workdir, driver=None):
+        self.index = index
+        self.features = features
+        self.report_path = os.path.join(workdir, 'worker{}.json'.format(index))
+        self.log_path = os.path.join(workdir, 'worker{}.log'.format(index))
+        self.command = ([sys.executable, '-m', 'behave'] + list(behave_args) +
+                        ['--format', 'json', '--outfile', self.report_path, '--format', 'progress'] + list(features))
+        self.env = dict(os.environ, BEHAVE_WEBDRIVER_WORKER=str(index))
+        if driver:
+            self.env['BEHAVE_WEBDRIVER'] = driver
+        self.process = None
+        self.returncode = None
+
+    def start(self):
+        self._log = open(self.log_path, 'wb')
+        self.process = subprocess.Popen(self.command, env=self.env, stdout=self._log, stderr=subprocess.STDOUT)
+
+    def wait(self):
+        self.returncode = self.process.wait()
+        self._log.close()
+        return self.returncode
+
+    @property
+    def output(self):
+        with open(self.log_path, 'rb') as f:
+            return f.read().decode('utf-8', 'replace')
+
+    @property
+    def report(self):
+        """
+        :return: the features of the worker's JSON report, or an empty list if the worker wrote none
+        :rtype: list
+        """
+        try:
+            with open(self.report_path) as f:
+                content = f.read()
+        except IOError:
+            return []
+        return json.loads(content) if content.strip() else []
+
+
+def run_workers(shards, behave_args=(), driver=None, workdir=None):
+    """
+    Run one behave process per non-empty shard, concurrently, and wait for all of them.
+
+    :return: the finished workers
+    :rtype: list
+    """
+    workers = [Worker(index, shard, behave_args, workdir, driver)
+               for index, shard in enumerate(shards) if shard]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.wait()
+    return workers
+
+
+def merge_reports(reports):
+    """
+    Merge behave JSON reports (lists of features) into one, in order.
+    """
+    merged = []
+    for report in reports:
+        merged.extend(report)
+    return merged
+
+
+def summarize(features):
+    """
+    Count features, scenarios and steps by status in a behave JSON report.
+
+    :return: a dict of dicts, e.g. ``{'features': {'passed': 2}, 'scenarios': {...}, 'steps': {...}}``
+    :rtype: dict
+    """
+    summary = {'features': {}, 'scenarios': {}, 'steps': {}}
+
+    def count(kind, status):
+        summary[kind][status] = summary[kind].get(status, 0) + 1
+
+    for feature in features:
+        count('features', feature.get('status', 'untested'))
+        for element in feature.get('elements', []):
+            if element.get('type') == 'scenario':
+                count('scenarios', element.get('status', 'untested'))
+            for step in element.get('steps', []):
+                count('steps', step.get('result', {}).get('status', 'skipped'))
+    return summary
+
+
+def format_summary(summary):
+    lines = []
+    for kind in ('features', 'scenarios', 'steps'):
+        counts = summary[kind]
+        parts = ['{} failed'.format(counts.get('failed', 0)), '{} skipped'.format(counts.get('skipped', 0))]
+        parts.extend('{} {}'.format(number, status) for status, number in sorted(counts.items())
+                     if status not in ('passed', 'failed', 'skipped'))
+        lines.append('{} {} passed, {}'.format(counts.get('passed', 0), kind, ', '.join(parts)))
+    return '\n'.join(lines)
+
+
+def parse_args(argv):
+    if '--' in argv:
+        split = argv.index('--')
+        argv, behave_args = argv[:split], argv[split + 1:]
+    else:
+        behave_args = []
+    parser = argparse.ArgumentParser(prog='python -m behave_webdriver.parallel',
+                                     description='Run behave features in parallel worker processes.')
+    parser.add_argument('paths', nargs='*', default=['features'],
+                        help='feature files or directories (default: features)')
+    parser.add_argument('-n', '--workers', type=int, default=2,
+                        help='number of worker processes (default: 2)')
+    parser.add_argument('--driver', default=None,
+                        help='driver name for the workers, passed as the BEHAVE_WEBDRIVER environment variable')
+    parser.add_argument('-o', '--outfile', default=None,
+                        help='write the merged behave JSON report to this file')
+    parser.add_argument('--timings', default=DEFAULT_TIMINGS_FILE,
+                        help='file to read and record feature durations (default: {})'.format(DEFAULT_TIMINGS_FILE))
+    parser.add_argument('--shard-by', choices=('duration', 'count'), default='duration',
+                        help='balance workers by recorded durations or by number of feature files (default: duration)')
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    args.behave_args = behave_args
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    features = discover_features(args.paths)
+    if not features:
+        print('No feature files found in {}'.format(', '.join(args.paths)), file=sys.stderr)
+        return 1
+    timings = Timings.load(args.timings)
+    if args.shard_by == 'duration':
+        shards, loads = shard_by_duration(features, args.workers, timings.estimate)
+        print('estimated duration per worker: {}'.format(', '.join('{:.1f}s'.format(load) for load in loads)))
+    else:
+        shards = shard_features(features, args.workers)
+    workdir = tempfile.mkdtemp(prefix='behave_webdriver_parallel')
+    try:
+        workers = run_workers(shards, args.behave_args, args.driver, workdir)
+        for worker in workers:
+            print('=== worker {} ({} features, exit code {}) ==='.format(worker.index,
+                                                                       len(worker.features),
+                                                                       worker.returncode))
+            print(worker.output)
+        report = merge_reports(worker.report for worker in workers)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if args.outfile:
+        with open(args.outfile, 'w') as f:
+            json.dump(report, f, indent=2)
+    timings.record(report)
+    timings.save()
+    print(format_summary(summarize(report)))
+    return 1 if any(worker.returncode for worker in workers) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
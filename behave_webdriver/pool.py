@@ -0,0 +1,225 @@
+"""
+Provides a pool of warm driver sessions that are reset between uses instead of being quit and relaunched.
+"""
+import atexit
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from behave_webdriver import scripts
+
+
+def reset_windows(driver):
+    """
+    Close every window but the first one and switch to it.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+
+def reset_storage(driver):
+    """
+    Clear local and session storage of the current origin.
+    """
+    driver.execute_script(scripts.CLEAR_STORAGE)
+
+
+def reset_cookies(driver):
+    """
+    Delete cookies. Chrome clears the cookies of every domain through the DevTools protocol, other drivers can only
+    clear the cookies visible from the current page.
+    """
+    execute_cdp_cmd = getattr(driver, 'execute_cdp_cmd', None)
+    if execute_cdp_cmd is not None:
+        try:
+            execute_cdp_cmd('Network.clearBrowserCookies', {})
+            return
+        except WebDriverException:
+            pass
+    driver.delete_all_cookies()
+
+
+def reset_navigation(driver):
+    """
+    Leave the current page for a blank one.
+    """
+    driver.get('about:blank')
+
+
+#: Reset steps available by name, in the order they run. Storage must be cleared before navigating away from the page.
+RESET_STEPS = (
+    ('windows', reset_windows),
+    ('storage', reset_storage),
+    ('cookies', reset_cookies),
+    ('navigation', reset_navigation),
+)
+
+
+class DriverPool(object):
+    """
+    Keeps up to ``size`` live driver sessions and hands them out one at a time.
+
+    When a session is released it is reset (see ``reset``) and kept for the next use, unless it has been used
+    ``max_uses`` times, in which case it is quit and replaced by a fresh one when needed. With ``health_check`` enabled,
+    an idle session is probed before it is handed out and replaced if it no longer responds.
+
+    :param size: the maximum number of live sessions
+    :type size: int
+    :param max_uses: recycle a session after this many uses. None never recycles.
+    :type max_uses: int
+    :param reset: how to reset a session between uses: 'full' for every step in ``RESET_STEPS``, an iterable of step
+                  names (e.g. ``('cookies', 'navigation')``), a callable taking the driver, or None to not reset at all.
+    :param health_check: whether or not to probe idle sessions before handing them out
+    :type health_check: bool
+
+    >>> from behave import use_fixture
+    >>> from behave_webdriver import fixture_browser
+    >>> from behave_webdriver.pool import DriverPool
+    >>> pool = DriverPool(size=1, max_uses=50)
+    >>> def before_scenario(ctx, scenario):
+    ...     use_fixture(fixture_browser, ctx, webdriver_name='chrome.headless', pool=pool)
+    """
+    def __init__(self, size=1, max_uses=None, reset='full', health_check=True):
+        if size < 1:
+            raise ValueError('The pool size must be at least 1, got {}'.format(size))
+        self.size = size
+        self.max_uses = max_uses
+        self.reset_policy = reset
+        self._reset_steps(reset)  # fail on unknown step names now rather than at the first release
+        self.health_check = health_check
+        self._idle = []
+        self._uses = {}
+        self._live = 0
+        self._condition = threading.Condition()
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+        self._closed = False
+        atexit.register(self.close)
+
+    def acquire(self, factory):
+        """
+        Hand out an idle session, or create one with ``factory`` if fewer than ``size`` sessions are live.
+        Blocks until a session is released when all of them are in use.
+
+        :param factory: a callable returning a new driver
+        :return: a driver
+        """
+        while True:
+            with self._condition:
+                while not self._idle and self._live >= self.size:
+                    self._condition.wait()
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    self._live += 1
+                    driver = None
+            if driver is None:
+                return self._create(factory)
+            if self.health_check and not self.is_healthy(driver):
+                self._discard(driver)
+                continue
+            self.reused += 1
+            return driver
+
+    def _create(self, factory):
+        try:
+            driver = factory()
+        except Exception:
+            with self._condition:
+                self._live -= 1
+                self._condition.notify()
+            raise
+        self._uses[id(driver)] = 0
+        self.created += 1
+        return driver
+
+    def release(self, driver):
+        """
+        Give a session back to the pool. It is reset for its next use, or quit if it reached ``max_uses`` or could
+        not be reset.
+        """
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+        if self._closed or (self.max_uses is not None and uses >= self.max_uses):
+            self._discard(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._discard(driver)
+            return
+        except Exception:
+            self._discard(driver)  # not to leak the session, nor its slot in the pool
+            raise
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def reset(self, driver):
+        """
+        Reset a session according to the pool's reset policy.
+        """
+        for step in self._reset_steps(self.reset_policy):
+            step(driver)
+        element_cache = getattr(driver, 'element_cache', None)
+        if element_cache is not None:
+            element_cache.clear()
+
+    @staticmethod
+    def _reset_steps(policy):
+        if policy is None:
+            return []
+        if callable(policy):
+            return [policy]
+        if policy == 'full':
+            return [step for _, step in RESET_STEPS]
+        names = set(policy)
+        unknown = names.difference(name for name, _ in RESET_STEPS)
+        if unknown:
+            raise ValueError('Unknown reset steps: {}. Valid options are: {}'.format(
+                ', '.join(sorted(unknown)), ', '.join(name for name, _ in RESET_STEPS)))
+        return [step for name, step in RESET_STEPS if name in names]
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Whether or not the session still responds.
+        """
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver, recycled=True):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass  # the session may already be gone, which is usually why it is discarded
+        with self._condition:
+            self._live -= 1
+            if recycled:
+                self.recycled += 1
+            self._condition.notify()
+
+    def close(self):
+        """
+        Quit every idle session. Sessions still in use are quit when they are released.
+        """
+        self._closed = True
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver, recycled=False)
+
+    def stats(self):
+        """
+        :return: a dictionary with the number of sessions created, reused and recycled
+        :rtype: dict
+        """
+        return {'created': self.created, 'reused': self.reused, 'recycled': self.recycled}
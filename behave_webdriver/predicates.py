@@ -0,0 +1,48 @@
+"""
+Provides text predicates that are evaluated in the browser, so only the outcome and a short excerpt of the element
+text are transferred instead of the full text.
+"""
+
+TEXT_MODES = ('equals', 'contains', 'empty', 'any')
+
+
+class TextMatch(object):
+    """
+    The outcome of a text predicate evaluated in the browser.
+    Truthy when the predicate matched. ``excerpt`` is a slice of the element text (around the match, when there is
+    one) meant for failure messages; ``length`` is the length of the full text.
+    """
+    def __init__(self, matched, excerpt, start=0, length=0):
+        self.matched = matched
+        self.excerpt = excerpt
+        self.start = start
+        self.length = length
+
+    @classmethod
+    def from_script_result(cls, result):
+        """
+        Build an instance from the dictionary returned by ``behave_webdriver.scripts.TEXT_PREDICATE``
+        """
+        return cls(matched=result['matched'],
+                   excerpt=result['excerpt'],
+                   start=result['start'],
+                   length=result['length'])
+
+    @property
+    def truncated(self):
+        return self.start > 0 or self.start + len(self.excerpt) < self.length
+
+    def __bool__(self):
+        return bool(self.matched)
+    __nonzero__ = __bool__  # Python 2
+
+    def __str__(self):
+        text = self.excerpt
+        if self.start > 0:
+            text = '...' + text
+        if self.start + len(self.excerpt) < self.length:
+            text = text + '...'
+        return text
+
+    def __repr__(self):
+        return '<TextMatch matched={} excerpt="{}">'.format(self.matched, self)
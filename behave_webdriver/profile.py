@@ -0,0 +1,180 @@
+"""
+Provides a behave formatter profiling the step definitions of a run, to find the steps eating the run time::
+
+    behave -f behave_webdriver.profile:ProfileFormatter -f pretty
+
+or, to use it as ``-f profile``, register it in your behave configuration file::
+
+    [behave.formatters]
+    profile = behave_webdriver.profile:ProfileFormatter
+
+Wall time is aggregated per step definition (every step executed with the same step function) over the whole run.
+The slowest step definitions by total time are printed with their p50/p95/p99 latencies, and the full profile is
+written as JSON. WebDriver command counts and wait times are included when the hooks of
+:py:mod:`behave_webdriver.instrumentation` are used.
+
+Userdata options (``-D name=value``):
+
+- ``profile_json``: path of the JSON profile (default: ``behave_webdriver_profile.json``, empty to disable)
+- ``profile_top``: number of step definitions printed (default: 10)
+"""
+from __future__ import division
+
+import json
+import math
+
+from behave.formatter.base import Formatter
+
+DEFAULT_PROFILE_JSON = 'behave_webdriver_profile.json'
+DEFAULT_PROFILE_TOP = 10
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, percent):
+    """
+    The nearest-rank percentile of values.
+
+    :param values: a non-empty sorted list of numbers
+    :param percent: the percentile, between 0 and 100
+    """
+    rank = int(math.ceil(percent / 100 * len(values)))
+    return values[max(rank, 1) - 1]
+
+
+def _step_registries():
+    from behave import step_registry
+    registries = [step_registry.registry]
+    try:
+        from behave.runner import the_step_registry  # the registry steps are loaded into, on recent behave versions
+    except ImportError:
+        pass
+    else:
+        if the_step_registry is not step_registry.registry:
+            registries.append(the_step_registry)
+    return registries
+
+
+def _step_pattern(func):
+    for registry in _step_registries():
+        for matchers in registry.steps.values():
+            for matcher in matchers:
+                if matcher.func is func:
+                    return matcher.pattern
+    return None
+
+
+class StepProfile(object):
+    """
+    Timings of every executed step of a step definition.
+    """
+    def __init__(self, location, name, pattern=None):
+        self.location = location
+        self.name = name
+        self.pattern = pattern
+        self.durations = []
+        self.roundtrips = []
+        self.wait_times = []
+        self.failures = 0
+
+    def add(self, duration, roundtrips=None, wait_time=None, failed=False):
+        self.durations.append(duration)
+        if roundtrips is not None:
+            self.roundtrips.append(roundtrips)
+        if wait_time is not None:
+            self.wait_times.append(wait_time)
+        if failed:
+            self.failures += 1
+
+    @property
+    def calls(self):
+        return len(self.durations)
+
+    @property
+    def total(self):
+        return sum(self.durations)
+
+    def percentiles(self):
+        durations = sorted(self.durations)
+        return dict(('p{}'.format(percent), percentile(durations, percent)) for percent in PERCENTILES)
+
+    def to_dict(self):
+        data = {'location': self.location,
+                'name': self.name,
+                'pattern': self.pattern,
+                'calls': self.calls,
+                'failures': self.failures,
+                'total': self.total,
+                'mean': self.total / self.calls,
+                'max': max(self.durations),
+                'roundtrips': sum(self.roundtrips) if self.roundtrips else None,
+                'wait_time': sum(self.wait_times) if self.wait_times else None}
+        data.update(self.percentiles())
+        return data
+
+
+class ProfileFormatter(Formatter):
+    """
+    Aggregates wall time, WebDriver round trips and wait time per step definition, prints the slowest step definitions
+    at the end of the run and writes the whole profile as JSON.
+    """
+    name = 'profile'
+    description = 'Profiles step definitions: wall time percentiles, WebDriver round trips and wait time'
+
+    def __init__(self, stream_opener, config):
+        super(ProfileFormatter, self).__init__(stream_opener, config)
+        userdata = getattr(config, 'userdata', None) or {}
+        self.json_path = userdata.get('profile_json', DEFAULT_PROFILE_JSON)
+        self.top = int(userdata.get('profile_top', DEFAULT_PROFILE_TOP))
+        self.profiles = {}
+        self._match = None
+
+    def match(self, match):
+        self._match = match
+
+    def result(self, step):
+        match, self._match = self._match, None
+        func = getattr(match, 'func', None)
+        if func is None or step.status.name not in ('passed', 'failed', 'error', 'hook_error'):
+            return  # undefined or not executed
+        location = str(match.location)
+        profile = self.profiles.get(location)
+        if profile is None:
+            profile = StepProfile(location, func.__name__, _step_pattern(func))
+            self.profiles[location] = profile
+        profile.add(step.duration,
+                    roundtrips=getattr(step, 'roundtrips', None),
+                    wait_time=getattr(step, 'wait_time', None),
+                    failed=step.status.name != 'passed')
+
+    def ranked(self):
+        """
+        :return: the step profiles, slowest total time first
+        :rtype: list
+        """
+        return sorted(self.profiles.values(), key=lambda profile: (-profile.total, profile.location))
+
+    def report(self):
+        ranked = self.ranked()
+        stream = self.open()
+        stream.write(u'\nSlowest step definitions ({} of {}):\n'.format(min(self.top, len(ranked)), len(ranked)))
+        stream.write(u'{:>9} {:>6} {:>8} {:>8} {:>8} {:>9} {:>8}  {}\n'.format(
+            'total', 'calls', 'p50', 'p95', 'p99', 'commands', 'waited', 'step definition'))
+        for profile in ranked[:self.top]:
+            data = profile.to_dict()
+            stream.write(u'{total:8.3f}s {calls:6d} {p50:7.3f}s {p95:7.3f}s {p99:7.3f}s {commands:>9} {waited:>8}  '
+                         u'{label} ({location})\n'.format(
+                             commands='-' if data['roundtrips'] is None else data['roundtrips'],
+                             waited='-' if data['wait_time'] is None else '{:.3f}s'.format(data['wait_time']),
+                             label=profile.pattern or profile.name,
+                             **data))
+
+    def write_json(self):
+        with open(self.json_path, 'w') as f:
+            json.dump({'steps': [profile.to_dict() for profile in self.ranked()]}, f, indent=2)
+
+    def close(self):
+        if self.profiles:
+            self.report()
+            if self.json_path:
+                self.write_json()
+        self.close_stream()
@@ -0,0 +1,146 @@
+"""
+Provides the readiness conditions :py:meth:`~behave_webdriver.driver.BehaveDriverMixin.open_url` can wait for after
+navigating, typically with an 'eager' or 'none' page load strategy, to resume as soon as the page is usable instead of
+waiting for its load event.
+
+>>> from behave_webdriver import readiness
+>>> driver = Chrome(page_load_strategy='eager', ready=readiness.selector_present('#app'))
+>>> driver.open_url('http://localhost:8000/', ready=[readiness.network_idle(), readiness.js_predicate('window.appReady')])
+
+Conditions can also be given as text, as in the ``and wait for`` variants of the open steps:
+
+- ``selector:<css or xpath>``: an element is present
+- ``network idle`` or ``network idle:<ms>``: no fetch/XHR pending and no resource loaded for 500 (or ms) milliseconds
+- ``js:<expression>``: a JavaScript expression is truthy
+- ``document ready`` or ``document ready:interactive``: the document is complete (or interactive)
+
+All the conditions of a page are evaluated inside the browser, in a single round trip.
+"""
+from selenium.common.exceptions import TimeoutException
+
+from behave_webdriver import scripts
+from behave_webdriver.waits import ensure_script_timeout
+
+PAGE_LOAD_STRATEGIES = ('normal', 'eager', 'none')
+DEFAULT_NETWORK_IDLE_MS = 500
+
+
+class PageNotReady(TimeoutException):
+    """
+    Raised when readiness conditions are not met within the timeout.
+    """
+
+
+class ReadinessCondition(object):
+    """
+    A condition evaluated in the page by ``scripts.WAIT_FOR_READY``.
+
+    :param kind: 'selector', 'networkIdle', 'js' or 'documentReady'
+    :param value: the selector, idle milliseconds, expression or document state
+    """
+    def __init__(self, kind, value):
+        self.kind = kind
+        self.value = value
+
+    def js_spec(self):
+        return {'type': self.kind, 'value': self.value}
+
+    def __eq__(self, other):
+        return isinstance(other, ReadinessCondition) and self.js_spec() == other.js_spec()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.kind, self.value)
+
+
+def selector_present(selector):
+    """
+    :param selector: CSS Selector or XPATH of an element that must be present
+    """
+    return ReadinessCondition('selector', selector)
+
+
+def network_idle(idle_ms=DEFAULT_NETWORK_IDLE_MS):
+    """
+    :param idle_ms: milliseconds without pending fetch/XHR nor resource loaded
+    """
+    return ReadinessCondition('networkIdle', int(idle_ms))
+
+
+def js_predicate(expression):
+    """
+    :param expression: a JavaScript expression that must be truthy
+    """
+    return ReadinessCondition('js', expression)
+
+
+def document_ready(state='complete'):
+    """
+    :param state: the document readyState to reach, 'interactive' or 'complete'
+    """
+    if state not in ('interactive', 'complete'):
+        raise ValueError('Invalid document state "{}". Valid options are: interactive, complete'.format(state))
+    return ReadinessCondition('documentReady', state)
+
+
+_PARSERS = {
+    'selector': selector_present,
+    'network idle': network_idle,
+    'js': js_predicate,
+    'document ready': document_ready,
+}
+
+
+def parse(spec):
+    """
+    Parse a condition given as text, e.g. 'selector:#app' or 'network idle:250'.
+
+    :rtype: ReadinessCondition
+    """
+    name, _, argument = spec.partition(':')
+    name = name.strip().lower().replace('-', ' ').replace('_', ' ')
+    factory = _PARSERS.get(name)
+    if factory is None:
+        raise ValueError('Invalid readiness condition "{}". Valid conditions are: {}'.format(
+            spec, ', '.join(sorted(_PARSERS))))
+    argument = argument.strip()
+    if not argument:
+        if name in ('selector', 'js'):
+            raise ValueError('Readiness condition "{}" needs an argument, e.g. "{}:..."'.format(spec, name))
+        return factory()
+    return factory(argument)
+
+
+def conditions(ready):
+    """
+    Normalize readiness conditions: None, a condition, its text, or a list of them.
+
+    :rtype: list
+    """
+    if ready is None:
+        return []
+    if isinstance(ready, (list, tuple)):
+        return [condition for item in ready for condition in conditions(item)]
+    if isinstance(ready, ReadinessCondition):
+        return [ready]
+    return [parse(ready)]
+
+
+def wait_until_ready(driver, ready, timeout):
+    """
+    Wait until every condition holds in the current page.
+
+    :param ready: a list of readiness conditions
+    :param timeout: the maximum number of seconds to wait
+    :raises PageNotReady: when some conditions do not hold within the timeout
+    """
+    ensure_script_timeout(driver, timeout)
+    outcome = driver.execute_async_script(scripts.WAIT_FOR_READY,
+                                          [condition.js_spec() for condition in ready],
+                                          int(timeout * 1000))
+    if not outcome or not outcome.get('ok'):
+        failing = [ready[index] for index in (outcome or {}).get('failing', range(len(ready)))]
+        raise PageNotReady('Page not ready within {} seconds, waiting for {}'.format(
+            timeout, ', '.join(repr(condition) for condition in failing)))
@@ -0,0 +1,289 @@
+"""
+Provides recording of WebDriver traffic per scenario, and a browserless driver replaying it.
+
+Record with any selenium based driver by passing a directory as ``record``, e.g. through the fixture, and call the
+hooks of this module from your ``environment.py``:
+
+>>> from behave_webdriver import recording
+>>> def before_all(context):
+...     use_fixture(fixture_browser, context, record='recordings')
+>>> def before_scenario(context, scenario):
+...     recording.before_scenario(context, scenario)
+>>> def before_step(context, step):
+...     recording.before_step(context, step)
+>>> def after_scenario(context, scenario):
+...     recording.after_scenario(context, scenario)
+
+Every command sent during a scenario and its response are written to a gzipped JSON lines log in that directory, one
+file per scenario. Rerun the suite with the 'replay' driver to serve the responses from the logs instead of a browser::
+
+    BEHAVE_WEBDRIVER=replay BEHAVE_WEBDRIVER_RECORDINGS=recordings behave
+
+The replayed command stream must match the recorded one. When it diverges, the scenario fails with a
+:py:class:`ReplayDivergence` naming the log, the command index, the step it was recorded in and both commands.
+Identical consecutive commands (polling) may be repeated more or fewer times than recorded. Commands sent outside of
+scenarios (e.g. from ``before_all``) are not recorded and succeed with a null value on replay.
+"""
+import gzip
+import io
+import json
+import os
+import re
+import time
+
+from selenium import webdriver
+
+from behave_webdriver.driver import BehaveDriverMixin
+
+LOG_VERSION = 1
+DEFAULT_RECORDINGS = 'recordings'
+
+
+class ReplayDivergence(AssertionError):
+    """
+    Raised when the commands issued during a replay differ from the recorded ones.
+    """
+
+
+def scenario_log_name(scenario, compress=True):
+    """
+    File name of the log of a scenario: its feature file, line and name.
+    """
+    feature_file = os.path.splitext(os.path.basename(scenario.filename))[0]
+    slug = re.sub(r'[^\w]+', '-', scenario.name).strip('-').lower()[:60]
+    return '{}-{}-{}.jsonl{}'.format(feature_file, scenario.line, slug, '.gz' if compress else '')
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return io.TextIOWrapper(gzip.open(path, mode + 'b'), encoding='utf-8')
+    return io.open(path, mode, encoding='utf-8')
+
+
+def _normalize(params):
+    """
+    Command parameters without the session id, which differs between sessions.
+    """
+    return dict((name, value) for name, value in (params or {}).items() if name != 'sessionId')
+
+
+def read_log(path):
+    """
+    :return: the header and the list of entries of a log
+    :rtype: tuple
+    """
+    with _open(path, 'r') as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get('version') != LOG_VERSION:
+        raise ValueError('{} is not a version {} command log'.format(path, LOG_VERSION))
+    return lines[0], lines[1:]
+
+
+def _describe(command, params):
+    return '{} {}'.format(command, json.dumps(params, sort_keys=True))
+
+
+class RecordingConnection(object):
+    """
+    Wraps the command executor of a driver to write the commands of each scenario and their responses to a log.
+    Anything else is delegated to the wrapped executor.
+
+    :param executor: the ``RemoteConnection`` of the driver
+    :param directory: where logs are written
+    :param compress: whether or not to gzip the logs
+    """
+    def __init__(self, executor, directory, compress=True):
+        self._executor = executor
+        self.directory = directory
+        self.compress = compress
+        self.step = None
+        self._log = None
+        self.path = None
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+    def start(self, scenario):
+        """
+        Start the log of a scenario. Commands are not recorded outside of scenarios.
+        """
+        self.stop()
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        self.path = os.path.join(self.directory, scenario_log_name(scenario, self.compress))
+        self._log = _open(self.path, 'w')
+        self._write({'version': LOG_VERSION, 'feature': scenario.filename, 'scenario': scenario.name,
+                     'line': scenario.line})
+        self.step = None
+
+    def stop(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def close(self):
+        """
+        Stop the current log and close the wrapped executor, if it can be (e.g. a ``PooledRemoteConnection``).
+        """
+        self.stop()
+        close = getattr(self._executor, 'close', None)
+        if close is not None:
+            close()
+
+    def _write(self, entry):
+        self._log.write(json.dumps(entry, separators=(',', ':'), sort_keys=True))
+        self._log.write(u'\n')
+
+    def execute(self, command, params):
+        started = time.time()
+        response = self._executor.execute(command, params)
+        if self._log is not None:
+            self._write({'command': command,
+                         'params': _normalize(params),
+                         'response': response,
+                         'step': self.step,
+                         'ms': int((time.time() - started) * 1000)})
+        return response
+
+
+class ReplayConnection(object):
+    """
+    A command executor answering commands with the responses of recorded logs, checking that the commands issued are
+    the recorded ones.
+
+    :param directory: where the logs are read from
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.step = None
+        self.path = None
+        self._entries = None
+        self._position = 0
+        self._last = None
+        self.keep_alive = False
+
+    def load(self, scenario):
+        """
+        Replay the log of a scenario.
+        """
+        path = os.path.join(self.directory, scenario_log_name(scenario))
+        if not os.path.exists(path):
+            uncompressed = os.path.join(self.directory, scenario_log_name(scenario, compress=False))
+            if not os.path.exists(uncompressed):
+                raise ReplayDivergence('No recording of scenario "{}" in {}'.format(scenario.name, self.directory))
+            path = uncompressed
+        self.path = path
+        _, self._entries = read_log(path)
+        self._position = 0
+        self._last = None
+        self.step = None
+
+    def finish(self):
+        """
+        Stop replaying the current log.
+
+        :raises ReplayDivergence: when recorded commands were not issued
+        """
+        entries, position, self._entries = self._entries, self._position, None
+        if entries is None:
+            return
+        remaining = [entry for entry in entries[position:] if not self._same(entry, self._last)]
+        if remaining:
+            entry = remaining[0]
+            raise ReplayDivergence('Replay of {} ended {} recorded commands early, next was #{} (recorded in step '
+                                   '"{}"): {}'.format(self.path, len(remaining), entries.index(entry) + 1,
+                                                      entry.get('step'),
+                                                      _describe(entry['command'], entry['params'])))
+
+    @staticmethod
+    def _same(entry, other):
+        return (other is not None and entry['command'] == other['command'] and
+                entry['params'] == other['params'])
+
+    def execute(self, command, params):
+        params = _normalize(params)
+        if self._entries is None:
+            if command == 'newSession':
+                return {'value': {'sessionId': 'replay', 'capabilities': {'browserName': 'replay'}}}
+            return {'value': None}
+        issued = {'command': command, 'params': params}
+        entries = self._entries
+        while True:
+            entry = entries[self._position] if self._position < len(entries) else None
+            if entry is not None and self._same(issued, entry):
+                self._position += 1
+                self._last = entry
+                return entry['response']
+            if self._same(issued, self._last):
+                return self._last['response']  # polled more often than during the recording
+            if entry is not None and self._same(entry, self._last):
+                self._position += 1  # polled less often than during the recording
+                continue
+            break
+        if entry is None:
+            expected = 'the end of the recording'
+        else:
+            expected = '{} (recorded in step "{}")'.format(_describe(entry['command'], entry['params']),
+                                                          entry.get('step'))
+        raise ReplayDivergence('Replay of {} diverged at command #{} in step "{}": expected {}, got {}'.format(
+            self.path, self._position + 1, self.step, expected, _describe(command, params)))
+
+
+class Replay(BehaveDriverMixin, webdriver.Remote):
+    """
+    Browserless driver answering commands from recorded logs, registered as 'replay' for ``from_string``/``from_env``.
+
+    :param recordings: the directory of the logs. Defaults to the ``BEHAVE_WEBDRIVER_RECORDINGS`` environment variable,
+                       or 'recordings'.
+    """
+    def __init__(self, recordings=None, *args, **kwargs):
+        if recordings is None:
+            recordings = os.environ.get('BEHAVE_WEBDRIVER_RECORDINGS', DEFAULT_RECORDINGS)
+        kwargs.setdefault('desired_capabilities', {'browserName': 'replay'})
+        super(Replay, self).__init__(ReplayConnection(recordings), *args, **kwargs)
+
+
+def _executor(context):
+    driver = getattr(context, 'behave_driver', None)
+    executor = getattr(driver, 'command_executor', None)
+    if isinstance(executor, (RecordingConnection, ReplayConnection)):
+        return executor
+    return None
+
+
+def _forget_session_setup(driver):
+    """
+    Forget the setup a driver does once per session, such as raising the script timeout, so that every scenario sends
+    (and records) its own. A scenario then replays alone, without the scenarios before it.
+    """
+    driver._async_script_timeout = None
+    element_cache = getattr(driver, 'element_cache', None)
+    if element_cache is not None:
+        element_cache.clear()
+
+
+def before_scenario(context, scenario):
+    executor = _executor(context)
+    if executor is not None:
+        _forget_session_setup(context.behave_driver)
+    if isinstance(executor, RecordingConnection):
+        executor.start(scenario)
+    elif isinstance(executor, ReplayConnection):
+        executor.load(scenario)
+
+
+def before_step(context, step):
+    executor = _executor(context)
+    if executor is not None:
+        executor.step = '{} {}'.format(step.keyword, step.name)
+
+
+def after_scenario(context, scenario):
+    """
+    :raises ReplayDivergence: on replay, when recorded commands of the scenario were not issued
+    """
+    executor = _executor(context)
+    if isinstance(executor, RecordingConnection):
+        executor.stop()
+    elif isinstance(executor, ReplayConnection):
+        executor.finish()
@@ -0,0 +1,101 @@
+"""
+Provides a command executor for the ``Remote`` driver with a persistent, configurable HTTP connection pool.
+"""
+import socket
+
+import urllib3
+from urllib3.connection import HTTPConnection
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+
+class _ConnectionPool(urllib3.PoolManager):
+    """
+    A PoolManager applying the timeout of the command currently being executed to its requests.
+    """
+    request_timeout = None
+
+    def urlopen(self, method, url, redirect=True, **kw):
+        if self.request_timeout is not None:
+            kw.setdefault('timeout', self.request_timeout)
+        return super(_ConnectionPool, self).urlopen(method, url, redirect=redirect, **kw)
+
+
+def _tcp_keepalive_options(idle):
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (('TCP_KEEPIDLE', idle), ('TCP_KEEPINTVL', idle)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), int(value)))
+    return options
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """
+    A ``RemoteConnection`` that keeps its HTTP connections to the WebDriver server alive and reuses them across
+    commands, from a pool of configurable size.
+
+    :param remote_server_addr: the URL of the WebDriver server, e.g. 'http://grid:4444/wd/hub'
+    :param pool_size: the number of connections kept alive to the server
+    :type pool_size: int
+    :param timeout: the default read timeout of a command, in seconds. None waits indefinitely.
+    :param connect_timeout: the timeout to establish a connection, in seconds. None waits indefinitely.
+    :param command_timeouts: read timeouts by selenium command name (see
+                             ``selenium.webdriver.remote.command.Command``), overriding ``timeout``
+    :type command_timeouts: dict
+    :param tcp_keepalive: enable TCP keep-alive probes after this many idle seconds, so connections idling between
+                          steps are not silently dropped by proxies or load balancers. None leaves the OS default.
+    :param retries: passed to urllib3, None uses its default retry policy
+    :param resolve_ip: passed to ``RemoteConnection``
+
+    >>> from behave_webdriver import Remote
+    >>> executor = PooledRemoteConnection('http://grid:4444/wd/hub', pool_size=2, timeout=60,
+    ...                                   command_timeouts={'get': 120})
+    >>> driver = Remote(command_executor=executor, desired_capabilities={'browserName': 'chrome'})
+    >>> executor.connection_stats()
+    {'commands': 2, 'requests': 2, 'connections': 1, 'reused': 1}
+    """
+    def __init__(self, remote_server_addr, pool_size=1, timeout=None, connect_timeout=None, command_timeouts=None,
+                 tcp_keepalive=None, retries=None, resolve_ip=True):
+        super(PooledRemoteConnection, self).__init__(remote_server_addr, keep_alive=True, resolve_ip=resolve_ip)
+        self.timeout = urllib3.Timeout(connect=connect_timeout, read=timeout)
+        self.command_timeouts = dict(command_timeouts or {})
+        pool_kwargs = {'maxsize': pool_size, 'timeout': self.timeout}
+        if retries is not None:
+            pool_kwargs['retries'] = retries
+        if tcp_keepalive is not None:
+            pool_kwargs['socket_options'] = _tcp_keepalive_options(tcp_keepalive)
+        self._conn = _ConnectionPool(**pool_kwargs)
+        self.commands = 0
+        self._closed_requests = self._closed_connections = 0
+
+    def execute(self, command, params):
+        self.commands += 1
+        read_timeout = self.command_timeouts.get(command)
+        if read_timeout is None:
+            self._conn.request_timeout = None
+        else:
+            self._conn.request_timeout = urllib3.Timeout(connect=self.timeout.connect_timeout, read=read_timeout)
+        return super(PooledRemoteConnection, self).execute(command, params)
+
+    def connection_stats(self):
+        """
+        :return: the number of commands executed, HTTP requests sent, connections opened and requests that reused an
+                 already open connection.
+        :rtype: dict
+        """
+        requests, connections = self._closed_requests, self._closed_connections
+        for key in self._conn.pools.keys():
+            pool = self._conn.pools[key]
+            requests += pool.num_requests
+            connections += pool.num_connections
+        return {'commands': self.commands,
+                'requests': requests,
+                'connections': connections,
+                'reused': requests - connections}
+
+    def close(self):
+        """
+        Close every pooled connection. Their counts are kept in :py:meth:`connection_stats`.
+        """
+        stats = self.connection_stats()
+        self._closed_requests, self._closed_connections = stats['requests'], stats['connections']
+        self._conn.clear()
@@ -0,0 +1,443 @@
+"""
+JavaScript sources executed in the browser by :py:class:`~behave_webdriver.driver.BehaveDriverMixin`.
+
+Scripts resolve their target the same way ``BehaveDriverMixin.get_element`` does: a selector starting with ``/`` is
+evaluated as XPATH, anything else as a CSS selector. A WebElement may be passed in place of a selector.
+"""
+
+LOCATE_ELEMENT = """
+function locateElement(target) {
+    if (typeof target !== 'string') {
+        return target;
+    }
+    if (target.charAt(0) === '/') {
+        return document.evaluate(target, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(target);
+}
+"""
+
+CLEAR_STORAGE = 'try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}'
+
+ELEMENT_GEOMETRY = LOCATE_ELEMENT + """
+var elem = locateElement(arguments[0]);
+if (!elem) {
+    return null;
+}
+if (arguments[1]) {
+    var before = elem.getBoundingClientRect();
+    window.scrollTo(before.left + window.pageXOffset, before.top + window.pageYOffset);
+}
+var rect = elem.getBoundingClientRect();
+var root = document.documentElement;
+return {
+    x: rect.left + window.pageXOffset,
+    y: rect.top + window.pageYOffset,
+    width: rect.width,
+    height: rect.height,
+    scrollX: window.pageXOffset,
+    scrollY: window.pageYOffset,
+    viewportWidth: root.clientWidth,
+    viewportHeight: root.clientHeight
+};
+"""
+
+ELEMENT_TEXT_FUNCTION = """
+function visibleText(elem) {
+    if (!elem.getClientRects().length) {
+        return '';
+    }
+    return (elem.innerText || elem.textContent || '').replace(/\\u00a0/g, ' ').trim();
+}
+function elementText(elem) {
+    var value = elem.value;
+    if (value !== undefined && value !== null) {
+        return String(value);
+    }
+    return visibleText(elem);
+}
+"""
+
+ELEMENT_TEXT = LOCATE_ELEMENT + ELEMENT_TEXT_FUNCTION + """
+var elem = locateElement(arguments[0]);
+if (!elem) {
+    return null;
+}
+return elementText(elem);
+"""
+
+TEXT_PREDICATE = LOCATE_ELEMENT + ELEMENT_TEXT_FUNCTION + """
+var elem = locateElement(arguments[0]);
+if (!elem) {
+    return null;
+}
+var mode = arguments[1], expected = arguments[2], excerptLength = arguments[3];
+var text = elementText(elem);
+var index = -1, matched;
+if (mode === 'equals') {
+    matched = text === expected;
+} else if (mode === 'contains') {
+    index = text.indexOf(expected);
+    matched = index !== -1;
+} else if (mode === 'empty') {
+    matched = text.length === 0;
+} else {
+    matched = text.length > 0;
+}
+var start = Math.max(0, index - Math.floor(excerptLength / 2));
+return {matched: matched, excerpt: text.substr(start, excerptLength), start: start, length: text.length};
+"""
+
+SAME_TEXT = LOCATE_ELEMENT + ELEMENT_TEXT_FUNCTION + """
+var first = locateElement(arguments[0]), second = locateElement(arguments[1]), excerptLength = arguments[2];
+if (!first || !second) {
+    return {missing: first ? 1 : 0};
+}
+var texts = [elementText(first), elementText(second)];
+var matched = texts[0] === texts[1], index = 0;
+while (index < texts[0].length && texts[0].charAt(index) === texts[1].charAt(index)) {
+    index++;
+}
+var start = matched ? 0 : Math.max(0, index - Math.floor(excerptLength / 2));  // around the first difference
+return texts.map(function (text) {
+    return {matched: matched, excerpt: text.substr(start, excerptLength), start: start, length: text.length};
+});
+"""
+
+SET_VALUE_FUNCTION = """
+function setValue(elem, value) {
+    var tag = elem.tagName.toLowerCase(), type = (elem.type || '').toLowerCase();
+    if (elem.disabled || elem.readOnly) {
+        return 'is not editable';
+    }
+    if (tag === 'select') {
+        for (var i = 0; i < elem.options.length; i++) {
+            var option = elem.options[i];
+            if (option.value === value || option.text.trim() === value) {
+                if (elem.selectedIndex !== i) {
+                    elem.selectedIndex = i;
+                    elem.dispatchEvent(new Event('input', {bubbles: true}));
+                    elem.dispatchEvent(new Event('change', {bubbles: true}));
+                }
+                return null;
+            }
+        }
+        return 'has no option "' + value + '"';
+    }
+    if (type === 'checkbox' || type === 'radio') {
+        var checked = /^(true|yes|on|checked|1|x)$/i.test(value) || (type === 'radio' && elem.value === value);
+        if (elem.checked !== checked) {
+            elem.click();  // the click fires input and change events, and the page's own click handlers
+        }
+        return elem.checked === checked ? null : 'could not be ' + (checked ? 'checked' : 'unchecked');
+    }
+    if (type === 'file' || (tag !== 'input' && tag !== 'textarea')) {
+        return 'cannot be set to a value';
+    }
+    if (elem.maxLength >= 0 && value.length > elem.maxLength) {
+        value = value.substr(0, elem.maxLength);  // as typing would have been cut off
+    }
+    // the prototype's setter, rather than elem.value, is also seen by frameworks tracking the value (e.g. React)
+    var prototype = tag === 'textarea' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(elem, value);
+    elem.dispatchEvent(new Event('input', {bubbles: true}));
+    elem.dispatchEvent(new Event('change', {bubbles: true}));
+    return null;
+}
+"""
+
+SET_VALUE = LOCATE_ELEMENT + SET_VALUE_FUNCTION + """
+var elem = locateElement(arguments[0]), value = arguments[1], append = arguments[2];
+if (!elem) {
+    return null;
+}
+var tag = elem.tagName.toLowerCase();
+if ((tag !== 'input' && tag !== 'textarea') || String(elem.type).toLowerCase() === 'file') {
+    return false;  // e.g. a contenteditable editor, to be typed into
+}
+if (append) {
+    value = String(elem.value || '') + value;
+}
+var key = value.charAt(value.length - 1);
+elem.focus();
+elem.dispatchEvent(new KeyboardEvent('keydown', {key: key, bubbles: true}));
+var error = setValue(elem, value);
+elem.dispatchEvent(new KeyboardEvent('keyup', {key: key, bubbles: true}));
+return error || '';
+"""
+
+FILL_FORM = LOCATE_ELEMENT + SET_VALUE_FUNCTION + """
+function locateField(form, field, value) {
+    if (field.charAt(0) === '/') {
+        return document.evaluate(field, form, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    try {
+        var elem = form.querySelector(field);
+        if (elem) {
+            return elem;
+        }
+    } catch (e) {
+        // not a selector, e.g. the name user[email]
+    }
+    var named = form.querySelectorAll('[name="' + field.replace(/["\\\\]/g, '\\\\$&') + '"]');
+    for (var i = 0; i < named.length; i++) {
+        if (named[i].type !== 'radio' || named[i].value === value) {
+            return named[i];  // of a group of radio buttons, the one of the value
+        }
+    }
+    return null;
+}
+var form = locateElement(arguments[0]), fields = arguments[1];
+if (!form) {
+    return null;
+}
+var located = [], missing = [], errors = [];
+for (var i = 0; i < fields.length; i++) {
+    var elem = locateField(form, fields[i][0], fields[i][1]);
+    if (elem) {
+        located.push(elem);
+    } else {
+        missing.push(fields[i][0]);
+    }
+}
+if (missing.length) {
+    return {missing: missing, errors: errors};
+}
+for (var j = 0; j < fields.length; j++) {
+    var error = setValue(located[j], fields[j][1]);
+    if (error) {
+        errors.push(fields[j][0] + ' ' + error);
+    }
+}
+return {missing: missing, errors: errors};
+"""
+
+ELEMENT_PREDICATE_FUNCTION = ELEMENT_TEXT_FUNCTION + """
+function isDisplayed(elem) {
+    if (!elem.getClientRects().length) {
+        return false;
+    }
+    var style = window.getComputedStyle(elem);
+    return style.visibility !== 'hidden' && style.visibility !== 'collapse' && parseFloat(style.opacity) !== 0;
+}
+function isActionable(elem) {
+    if (!elem.isConnected || !isDisplayed(elem) || (elem.matches && elem.matches(':disabled'))) {
+        return false;
+    }
+    var rect = elem.getBoundingClientRect(), now = Date.now();
+    var box = [rect.left, rect.top, rect.width, rect.height].join(), previous = elem.__behaveWebdriverBox;
+    elem.__behaveWebdriverBox = {box: box, at: now};
+    if (!previous || previous.box !== box || now - previous.at > 500) {
+        return false;  // not known to be stable yet, the next check tells
+    }
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    if (x < 0 || y < 0 || x >= window.innerWidth || y >= window.innerHeight) {
+        return true;  // the driver scrolls it into view before acting on it
+    }
+    var hit = document.elementFromPoint(x, y);
+    return !!hit && (hit === elem || elem.contains(hit));
+}
+function evaluatePredicate(spec, elem) {
+    var result;
+    if (spec.predicate === 'present') {
+        result = !!elem;
+    } else if (spec.predicate === 'all' || spec.predicate === 'any') {
+        var all = spec.predicate === 'all';
+        result = all;
+        for (var i = 0; i < spec.conditions.length; i++) {
+            if (!!evaluatePredicate(spec.conditions[i], elem) !== all) {
+                result = !all;
+                break;
+            }
+        }
+    } else if (!elem) {
+        return null;
+    } else if (spec.predicate === 'visible') {
+        result = isDisplayed(elem);
+    } else if (spec.predicate === 'actionable') {
+        result = isActionable(elem);
+    } else if (spec.predicate === 'enabled') {
+        result = !(elem.matches && elem.matches(':disabled'));
+    } else if (spec.predicate === 'selected') {
+        result = !!(elem.selected || elem.checked);
+    } else if (spec.predicate === 'text') {
+        var text = visibleText(elem);
+        result = text.length > 0 && text.indexOf(spec.text) !== -1;
+    } else if (spec.predicate === 'value') {
+        var value = elem.value === undefined || elem.value === null ? '' : String(elem.value);
+        result = value.length > 0 && value.indexOf(spec.text) !== -1;
+    } else {
+        throw new Error('Unknown predicate: ' + spec.predicate);
+    }
+    return spec.negative ? !result : result;
+}
+"""
+
+WAIT_FOR_ELEMENT = LOCATE_ELEMENT + ELEMENT_PREDICATE_FUNCTION + """
+var done = arguments[arguments.length - 1];
+var target = arguments[0], spec = arguments[1], timeout = arguments[2];
+var finished = false, observer = null, frame = null, interval = null, timer = null;
+function finish(outcome) {
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    if (frame !== null) {
+        cancelAnimationFrame(frame);
+    }
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(outcome);
+}
+function check() {
+    frame = null;
+    if (finished) {
+        return;
+    }
+    var elem = locateElement(target);
+    if (evaluatePredicate(spec, elem)) {
+        finish({ok: true, element: elem && !spec.negative ? elem : null});
+    }
+}
+function schedule() {
+    if (frame === null && !finished) {
+        frame = requestAnimationFrame(check);
+    }
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(schedule);
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(check, 100);
+    timer = setTimeout(function () {
+        if (!finished) {
+            finish({ok: false});
+        }
+    }, timeout);
+    schedule();  // e.g. the stability of an element is known on the next frame
+}
+"""
+
+ACTIVITY_TRACKER = """
+(function () {
+    if (window.__behaveWebdriverActivity) {
+        return;
+    }
+    var activity = window.__behaveWebdriverActivity = {pending: 0, last: Date.now()};
+    function started() {
+        activity.pending += 1;
+        activity.last = Date.now();
+    }
+    function finished() {
+        activity.pending = Math.max(activity.pending - 1, 0);
+        activity.last = Date.now();
+    }
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return fetch.apply(this, arguments).then(function (response) {
+                finished();
+                return response;
+            }, function (error) {
+                finished();
+                throw error;
+            });
+        };
+    }
+    if (window.XMLHttpRequest) {
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            started();
+            this.addEventListener('loadend', finished);
+            return send.apply(this, arguments);
+        };
+    }
+})();
+"""
+
+WAIT_FOR_QUIESCENCE = ACTIVITY_TRACKER + """
+var done = arguments[arguments.length - 1];
+var settle = arguments[0], timeout = arguments[1];
+var activity = window.__behaveWebdriverActivity;
+var started = Date.now(), lastMutation = started, interval = null, timer = null;
+var observer = new MutationObserver(function () {
+    lastMutation = Date.now();
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+function finish(quiet) {
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done({quiet: quiet, elapsed: Date.now() - started});
+}
+function check() {
+    var quietSince = Math.max(lastMutation, activity.last, started);
+    if (document.readyState === 'complete' && activity.pending === 0 && Date.now() - quietSince >= settle) {
+        finish(true);
+    }
+}
+interval = setInterval(check, 25);
+timer = setTimeout(function () {
+    finish(false);
+}, timeout);
+"""
+
+WAIT_FOR_READY = LOCATE_ELEMENT + ACTIVITY_TRACKER + """
+var done = arguments[arguments.length - 1];
+var conditions = arguments[0], timeout = arguments[1];
+var activity = window.__behaveWebdriverActivity;
+var started = Date.now(), resources = -1, lastChange = started, interval = null, timer = null;
+function resourceCount() {
+    if (!window.performance || !performance.getEntriesByType) {
+        return 0;
+    }
+    return performance.getEntriesByType('resource').length;
+}
+function holds(condition) {
+    switch (condition.type) {
+    case 'selector':
+        return !!locateElement(condition.value);
+    case 'documentReady':
+        return condition.value === 'interactive' ? document.readyState !== 'loading' : document.readyState === 'complete';
+    case 'networkIdle':
+        return activity.pending === 0 && Date.now() - Math.max(lastChange, activity.last) >= condition.value;
+    case 'js':
+        try {
+            return !!(new Function('return (' + condition.value + ');'))();
+        } catch (e) {
+            return false;
+        }
+    }
+    return false;
+}
+function failing() {
+    var count = resourceCount();
+    if (count !== resources) {
+        resources = count;
+        lastChange = Date.now();
+    }
+    var result = [];
+    for (var i = 0; i < conditions.length; i++) {
+        if (!holds(conditions[i])) {
+            result.push(i);
+        }
+    }
+    return result;
+}
+function finish(outcome) {
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(outcome);
+}
+function check() {
+    if (!failing().length) {
+        finish({ok: true, elapsed: Date.now() - started});
+    }
+}
+interval = setInterval(check, 25);
+timer = setTimeout(function () {
+    finish({ok: false, failing: failing()});
+}, timeout);
+check();
+"""
@@ -0,0 +1,259 @@
+"""
+Provides a local site server for the pages under test, e.g. the demo app or a site fixture of your own.
+
+Files are read once into an in-memory cache (re-read when they change on disk) and served by a thread per connection,
+with keep-alive, ETag revalidation, Cache-Control and gzip for text content. Port 0 picks a free port, so every
+parallel worker can serve its own copy:
+
+>>> with SiteServer('tests/demo-app') as server:
+...     driver.open_url(server.url + 'page.html')
+
+From behave, use the ``fixture_site`` fixture, which sets ``ctx.base_url`` for the ``I open the site`` steps.
+"""
+import gzip
+import hashlib
+import io
+import mimetypes
+import os
+import posixpath
+import threading
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import unquote, urlsplit, urlunsplit
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urllib import unquote
+    from urlparse import urlsplit, urlunsplit
+
+#: Content types compressed when the client accepts gzip
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml')
+#: Bodies smaller than this are not worth compressing
+GZIP_MIN_SIZE = 512
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Whether or not an ``Accept-Encoding`` header accepts gzip, named or through ``*``, with a q-value above 0.
+    """
+    qualities = {}
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get('gzip', qualities.get('x-gzip', qualities.get('*', 0.0))) > 0
+
+
+class CachedFile(object):
+    """
+    A file of the site, as served.
+    """
+    def __init__(self, path, body, mtime, content_type):
+        self.path = path
+        self.body = body
+        self.mtime = mtime
+        self.content_type = content_type
+        self.etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        self._gzipped = None
+
+    @property
+    def compressible(self):
+        return len(self.body) >= GZIP_MIN_SIZE and self.content_type.startswith(COMPRESSIBLE_TYPES)
+
+    @property
+    def gzipped(self):
+        if self._gzipped is None:
+            buffer = io.BytesIO()
+            with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as f:
+                f.write(self.body)
+            self._gzipped = buffer.getvalue()
+        return self._gzipped
+
+
+class FileCache(object):
+    """
+    Files read from a directory, kept in memory and re-read when their modification time changes.
+
+    :param root: the directory of the site
+    """
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._files = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, url_path):
+        path = posixpath.normpath(unquote(url_path))
+        parts = [part for part in path.split('/') if part and part not in (os.curdir, os.pardir)]
+        full_path = os.path.join(self.root, *parts)
+        if not os.path.abspath(full_path).startswith(self.root):
+            return None
+        return full_path
+
+    def is_directory(self, url_path):
+        """
+        Whether or not a URL path names a directory of the site.
+        """
+        path = self._path(url_path)
+        return path is not None and os.path.isdir(path)
+
+    def resolve(self, url_path):
+        """
+        :return: the file path of a URL path (the index.html of a directory), None when outside of the root
+        """
+        full_path = self._path(url_path)
+        if full_path is not None and os.path.isdir(full_path):
+            full_path = os.path.join(full_path, 'index.html')
+        return full_path
+
+    def get(self, url_path):
+        """
+        :return: the cached file of a URL path, None when there is no such file
+        :rtype: CachedFile
+        """
+        path = self.resolve(url_path)
+        if path is None:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        cached = self._files.get(path)
+        if cached is not None and cached.mtime == mtime:
+            self.hits += 1
+            return cached
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except IOError:
+            return None
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/'):
+            content_type += '; charset=utf-8'
+        cached = CachedFile(path, body, mtime, content_type)
+        with self._lock:
+            self._files[path] = cached
+            self.misses += 1
+        return cached
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, headers, body, head):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head and body:
+            self.wfile.write(body)
+
+    def _serve(self, head=False):
+        site = self.server.site
+        parts = urlsplit(self.path)
+        if not parts.path.endswith('/') and site.cache.is_directory(parts.path):
+            # like SimpleHTTPRequestHandler, for relative links of the index to resolve against the directory
+            location = urlunsplit(('', '', parts.path + '/', parts.query, parts.fragment))
+            return self._send(301, [('Location', location)], b'', head)
+        cached = site.cache.get(parts.path)
+        if cached is None:
+            return self._send(404, [('Content-Type', 'text/plain; charset=utf-8')], b'Not Found', head)
+        headers = [('Content-Type', cached.content_type),
+                   ('ETag', cached.etag),
+                   ('Cache-Control', site.cache_control)]
+        if cached.compressible:
+            headers.append(('Vary', 'Accept-Encoding'))
+        if cached.etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            return self._send(304, headers, b'', head=True)
+        body = cached.body
+        if site.gzip and cached.compressible and accepts_gzip(self.headers.get('Accept-Encoding', '')):
+            body = cached.gzipped
+            headers.append(('Content-Encoding', 'gzip'))
+        self._send(200, headers, body, head)
+
+    def do_GET(self):
+        self._serve()
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class SiteServer(object):
+    """
+    A threaded HTTP server of the static files of a directory.
+
+    :param root: the directory to serve
+    :param host: the interface to listen on. Default to '127.0.0.1'.
+    :param port: the port to listen on. Default to 0 (a free port).
+    :param gzip: whether or not to compress text content for clients accepting it. Default to True.
+    :param max_age: seconds browsers may use their copy without revalidating it. Default to 0 (always revalidate,
+                    which is answered with a 304 while the file is unchanged).
+    """
+    def __init__(self, root='.', host='127.0.0.1', port=0, gzip=True, max_age=0):
+        self.cache = FileCache(root)
+        self.host = host
+        self.port = port
+        self.gzip = gzip
+        self.cache_control = 'max-age={}'.format(max_age) if max_age else 'no-cache'
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        The base URL of the site, ending with a slash.
+        """
+        host = self.host if self.host not in ('', '0.0.0.0') else '127.0.0.1'
+        return 'http://{}:{}/'.format(host, self.port)
+
+    def _bind(self):
+        self._server = _ThreadingServer((self.host, self.port), _SiteHandler)
+        self._server.site = self
+        self.port = self._server.server_address[1]
+
+    def start(self):
+        self._bind()
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Serve in the current thread, until interrupted.
+        """
+        self._bind()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,808 @@
+"""
+Provides a browserless driver running the steps on a parsed HTML DOM, for features that only check static markup
+(titles, urls, attributes, classes, element existence and text).
+
+Pages are fetched over HTTP(S) or read from the filesystem (``file://`` URLs or paths) and parsed with lxml; CSS
+selectors and XPath are evaluated in-process. No JavaScript runs and there is no layout: visibility only considers the
+markup (``hidden`` attributes, inline ``display``/``visibility`` styles, ``display: none`` rules of the page's
+``<style>`` elements -- linked stylesheets are not fetched -- and elements never rendered like ``<head>``), and text is
+an approximation of ``innerText``. Everything needing a browser -- typing, clicking anything but a link, scripts,
+geometry, alerts, frames -- raises :py:class:`UnsupportedOperation`, so route the features needing a browser
+elsewhere, e.g. with tags::
+
+    BEHAVE_WEBDRIVER=static behave --tags=@static
+    behave --tags=-@static
+
+Requires lxml and cssselect (``pip install behave-webdriver[static]``).
+
+>>> from behave_webdriver import from_string
+>>> driver = from_string('static')
+>>> driver.get('http://localhost:8000/')
+>>> driver.element_contains('h1', 'DEMO')
+True
+"""
+import os
+import re
+
+try:
+    from urllib.parse import urljoin, urlsplit
+    from urllib.request import Request, urlopen, pathname2url
+    from urllib.error import HTTPError, URLError
+    from http.cookies import SimpleCookie
+except ImportError:  # Python 2
+    from urlparse import urljoin, urlsplit
+    from urllib2 import Request, urlopen, HTTPError, URLError
+    from urllib import pathname2url
+    from Cookie import SimpleCookie
+
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector, SelectorError
+except ImportError:
+    lxml = None
+
+from selenium.common.exceptions import (InvalidSelectorException,
+                                        NoAlertPresentException,
+                                        NoSuchElementException,
+                                        NoSuchWindowException,
+                                        StaleElementReferenceException,
+                                        WebDriverException)
+from selenium.webdriver.common.by import By
+
+from behave_webdriver import scripts
+from behave_webdriver.conditions import evaluate_predicate
+from behave_webdriver.driver import BehaveDriverMixin
+
+BLANK_PAGE = b'<html><head></head><body></body></html>'
+
+#: elements that are never rendered
+HIDDEN_TAGS = frozenset(('head', 'script', 'style', 'template', 'title', 'meta', 'link', 'noscript', 'base'))
+#: elements starting and ending a line of text
+BLOCK_TAGS = frozenset(('address', 'article', 'aside', 'blockquote', 'dd', 'details', 'dialog', 'div', 'dl', 'dt',
+                        'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                        'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'tr',
+                        'ul', 'option', 'select', 'textarea'))
+BOOLEAN_ATTRIBUTES = frozenset(('async', 'autofocus', 'autoplay', 'checked', 'compact', 'complete', 'controls',
+                                'declare', 'defaultchecked', 'defaultselected', 'defer', 'disabled', 'ended',
+                                'formnovalidate', 'hidden', 'indeterminate', 'iscontenteditable', 'ismap',
+                                'itemscope', 'loop', 'multiple', 'muted', 'nohref', 'noresize', 'noshade',
+                                'novalidate', 'nowrap', 'open', 'paused', 'readonly', 'required', 'reversed',
+                                'scoped', 'seamless', 'seeking', 'selected', 'truespeed', 'willvalidate'))
+DISABLEABLE_TAGS = frozenset(('button', 'input', 'optgroup', 'option', 'select', 'textarea', 'fieldset'))
+URL_ATTRIBUTES = frozenset(('href', 'src', 'action'))
+
+_compiled_selectors = {}
+_whitespace = re.compile(r'[ \t\r\f\v\n]+')
+_css_comment = re.compile(r'/\*.*?\*/', re.DOTALL)
+_display_none = re.compile(r'(^|;)\s*display\s*:\s*none\b', re.IGNORECASE)
+
+
+class UnsupportedOperation(WebDriverException):
+    """
+    Raised for operations the static driver cannot perform without a browser.
+    """
+    def __init__(self, operation):
+        super(UnsupportedOperation, self).__init__(
+            '{} is not supported by the static driver (no browser: no JavaScript, layout or user input). '
+            'Run this feature with a browser driver.'.format(operation))
+
+
+def _compile(by, value):
+    """
+    Compile a CSS selector or an XPath expression to a (cached) lxml XPath evaluator.
+    """
+    key = (by, value)
+    compiled = _compiled_selectors.get(key)
+    if compiled is None:
+        try:
+            if by == By.CSS_SELECTOR:
+                compiled = CSSSelector(value, translator='html')
+            else:
+                compiled = etree.XPath(value)
+        except (SelectorError, etree.XPathSyntaxError) as e:
+            raise InvalidSelectorException('invalid selector: {} ({})'.format(value, e))
+        _compiled_selectors[key] = compiled
+    return compiled
+
+
+def _is_element(node):
+    return isinstance(node, etree._Element) and isinstance(node.tag, str)
+
+
+def _inline_style(node):
+    style = {}
+    for declaration in (node.get('style') or '').split(';'):
+        name, _, value = declaration.partition(':')
+        if value:
+            style[name.strip().lower()] = value.replace('!important', '').strip().lower()
+    return style
+
+
+def _style_rules(css):
+    """
+    The (selectors, declarations) of the top level rules of a stylesheet, at-rules (e.g. @media) excluded.
+    """
+    css = _css_comment.sub('', css)
+    rules, depth, start = [], 0, 0
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude, start = css[start:index].strip(), index + 1
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                if not prelude.startswith('@'):
+                    rules.append((prelude, css[start:index]))
+                start = index + 1
+            depth = max(depth, 0)
+    return rules
+
+
+def hidden_by_stylesheets(document):
+    """
+    The elements hidden by a ``display: none`` rule of the page's ``<style>`` elements.
+
+    :rtype: set
+    """
+    hidden = set()
+    for style in document.iter('style'):
+        for selectors, declarations in _style_rules(style.text_content()):
+            if not _display_none.search(declarations):
+                continue
+            for selector in selectors.split(','):
+                try:
+                    hidden.update(_compile(By.CSS_SELECTOR, selector.strip())(document))
+                except (InvalidSelectorException, NotImplementedError):
+                    pass  # e.g. pseudo-elements, which cannot hide an element anyway
+    return hidden
+
+
+def _rendered(node, hidden=frozenset()):
+    """
+    Whether or not an element generates boxes, according to its markup only.
+    """
+    if node.tag in HIDDEN_TAGS or node.get('hidden') is not None or node in hidden:
+        return False
+    if node.tag == 'input' and (node.get('type') or '').lower() == 'hidden':
+        return False
+    return _inline_style(node).get('display') != 'none'
+
+
+def is_displayed(node, hidden=frozenset()):
+    for ancestor in node.iterancestors():
+        if not _rendered(ancestor, hidden):
+            return False
+    if not _rendered(node, hidden):
+        return False
+    style = _inline_style(node)
+    if style.get('opacity') in ('0', '0.0'):
+        return False
+    for elem in [node] + list(node.iterancestors()):
+        visibility = _inline_style(elem).get('visibility')
+        if visibility:
+            return visibility not in ('hidden', 'collapse')
+    return True
+
+
+def _render_text(node, parts, hidden):
+    if not _rendered(node, hidden):
+        return
+    if node.tag == 'br':
+        parts.append('\n')
+    block = node.tag in BLOCK_TAGS
+    if block:
+        parts.append('\n')
+    if node.text:
+        parts.append(node.text)
+    for child in node:
+        if _is_element(child):
+            _render_text(child, parts, hidden)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append('\n')
+
+
+def visible_text(node, hidden=frozenset()):
+    """
+    An approximation of ``innerText``: the text of rendered elements, whitespace collapsed, one line per block.
+
+    :param hidden: elements hidden by stylesheets, see :py:func:`hidden_by_stylesheets`
+    """
+    if not is_displayed(node, hidden):
+        return ''
+    parts = []
+    _render_text(node, parts, hidden)
+    lines = (_whitespace.sub(' ', line).strip() for line in ''.join(parts).replace(u'\xa0', ' ').split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _select_options(select):
+    return [option for option in select.iter('option')]
+
+
+def is_selected(node):
+    if node.tag == 'option':
+        if node.get('selected') is not None:
+            return True
+        select = next((ancestor for ancestor in node.iterancestors() if ancestor.tag == 'select'), None)
+        if select is None or select.get('multiple') is not None:
+            return False
+        options = _select_options(select)
+        # a single select without a selected option selects its first option
+        return not any(option.get('selected') is not None for option in options) and options[0] is node
+    if node.tag == 'input' and (node.get('type') or '').lower() in ('checkbox', 'radio'):
+        return node.get('checked') is not None
+    return False
+
+
+def is_enabled(node):
+    if node.tag not in DISABLEABLE_TAGS:
+        return True
+    if node.get('disabled') is not None:
+        return False
+    for ancestor in node.iterancestors():
+        if ancestor.tag in ('optgroup', 'select') and node.tag == 'option' and ancestor.get('disabled') is not None:
+            return False
+        if ancestor.tag == 'fieldset' and ancestor.get('disabled') is not None:
+            legend = next((child for child in ancestor if _is_element(child) and child.tag == 'legend'), None)
+            if legend is None or node not in legend.iter():
+                return False
+    return True
+
+
+def element_value(node):
+    """
+    The ``value`` property of form controls, or None for elements without one.
+    """
+    if node.tag == 'input':
+        return node.get('value') or ''
+    if node.tag == 'textarea':
+        return node.text_content()
+    if node.tag == 'option':
+        value = node.get('value')
+        return value if value is not None else _whitespace.sub(' ', node.text_content()).strip()
+    if node.tag == 'select':
+        selected = [option for option in _select_options(node) if is_selected(option)]
+        return element_value(selected[0]) if selected else ''
+    if node.tag == 'button':
+        return node.get('value') or ''
+    return None
+
+
+def element_text(node, hidden=frozenset()):
+    value = element_value(node)
+    if value is not None:
+        return value
+    return visible_text(node, hidden)
+
+
+class StaticElement(object):
+    """
+    A ``WebElement`` look-alike for an element of a parsed page.
+    """
+    def __init__(self, parent, node, document):
+        self._parent = parent
+        self._element = node
+        self._document = document
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @property
+    def node(self):
+        """
+        The lxml element. Raises ``StaleElementReferenceException`` once the driver left the page.
+        """
+        if self._document is not self._parent._document:
+            raise StaleElementReferenceException('stale element reference: element is not attached to the page '
+                                                 'document')
+        return self._element
+
+    @property
+    def id(self):
+        return '{:x}'.format(id(self._element))
+
+    def __eq__(self, other):
+        return isinstance(other, StaticElement) and other._element is self._element
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._element)
+
+    def __repr__(self):
+        return '<{} {} {}>'.format(type(self).__name__, self._element.tag, self.id)
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return visible_text(self.node, self._parent._hidden)
+
+    def get_attribute(self, name):
+        """
+        Same as selenium's ``get_attribute``: some attributes are read as properties (e.g. 'value', 'checked', 'href').
+        """
+        node = self.node
+        name = name.lower()
+        if name == 'value':
+            value = element_value(node)
+            return value if value is not None else node.get('value')
+        if name in ('checked', 'selected'):
+            return 'true' if is_selected(node) else None
+        if name in BOOLEAN_ATTRIBUTES:
+            return 'true' if node.get(name) is not None else None
+        if name == 'class' or name == 'classname':
+            return node.get('class')
+        value = node.get(name)
+        if value is not None and name in URL_ATTRIBUTES:
+            return urljoin(self._parent.current_url, value)
+        return value
+
+    def get_property(self, name):
+        node = self.node
+        if name == 'value':
+            return element_value(node)
+        if name in ('checked', 'selected'):
+            return is_selected(node)
+        if name == 'disabled':
+            return not is_enabled(node)
+        if name == 'tagName':
+            return node.tag.upper()
+        if name == 'textContent':
+            return node.text_content()
+        return self.get_attribute(name)
+
+    def is_displayed(self):
+        return is_displayed(self.node, self._parent._hidden)
+
+    def is_enabled(self):
+        return is_enabled(self.node)
+
+    def is_selected(self):
+        return is_selected(self.node)
+
+    def find_element(self, by=By.ID, value=None):
+        return self._parent._find_element(by, value, self.node)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._parent._find_elements(by, value, self.node)
+
+    def find_element_by_css_selector(self, css_selector):
+        return self.find_element(By.CSS_SELECTOR, css_selector)
+
+    def find_element_by_xpath(self, xpath):
+        return self.find_element(By.XPATH, xpath)
+
+    def click(self):
+        """
+        Links are followed. Clicking anything else needs a browser.
+        """
+        node = self.node
+        href = node.get('href')
+        if node.tag != 'a' or href is None or href.lower().startswith('javascript:'):
+            raise UnsupportedOperation('Clicking on <{}>'.format(node.tag))
+        if href.startswith('#'):
+            return
+        self._parent.get(urljoin(self._parent.current_url, href))
+
+    def value_of_css_property(self, property_name):
+        raise UnsupportedOperation('Reading the computed css property "{}"'.format(property_name))
+
+    def send_keys(self, *value):
+        raise UnsupportedOperation('Typing')
+
+    def clear(self):
+        raise UnsupportedOperation('Clearing an input')
+
+    def submit(self):
+        raise UnsupportedOperation('Submitting a form')
+
+    @property
+    def size(self):
+        raise UnsupportedOperation('Element size (there is no layout)')
+
+    @property
+    def location(self):
+        raise UnsupportedOperation('Element location (there is no layout)')
+
+    @property
+    def rect(self):
+        raise UnsupportedOperation('Element rect (there is no layout)')
+
+
+class StaticSwitchTo(object):
+    def __init__(self, driver):
+        self._driver = driver
+
+    @property
+    def active_element(self):
+        driver = self._driver
+        autofocus = driver._document.xpath('//*[@autofocus]')
+        node = autofocus[0] if autofocus else driver._document.find('body')
+        if node is None:
+            node = driver._document
+        return StaticElement(driver, node, driver._document)
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException('no such alert (the static driver does not run JavaScript)')
+
+    def window(self, window_name):
+        if window_name not in self._driver.window_handles:
+            raise NoSuchWindowException('no such window: {}'.format(window_name))
+
+    def frame(self, frame_reference):
+        raise UnsupportedOperation('Switching to a frame')
+
+    def parent_frame(self):
+        pass
+
+    def default_content(self):
+        pass
+
+
+class StaticWebDriver(object):
+    """
+    The subset of selenium's ``WebDriver`` API used by ``BehaveDriverMixin``, on a parsed HTML DOM.
+
+    :param headers: extra HTTP headers sent with every request, e.g. {'Accept-Language': 'en'}
+    :type headers: dict
+    :param timeout: timeout of HTTP requests, in seconds
+    :param window_size: the reported window size, there is no layout
+    :type window_size: tuple
+    """
+    window_handle = 'static-window'
+
+    def __init__(self, headers=None, timeout=30, window_size=(1024, 768)):
+        if lxml is None:
+            raise WebDriverException('The static driver requires lxml and cssselect, '
+                                     'install them with: pip install behave-webdriver[static]')
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.capabilities = {'browserName': 'static', 'javascriptEnabled': False}
+        self.session_id = 'static'
+        self._window_size = {'width': window_size[0], 'height': window_size[1]}
+        self._cookies = {}
+        self._history = []
+        self._history_index = -1
+        self._window_open = True
+        self._url = 'about:blank'
+        self._document = lxml.html.document_fromstring(BLANK_PAGE)
+        self._hidden = frozenset()
+
+    # -- navigation
+
+    def _request(self, url):
+        headers = dict(self.headers)
+        if self._cookies:
+            headers['Cookie'] = '; '.join('{}={}'.format(cookie['name'], cookie['value'])
+                                          for cookie in self._cookies.values())
+        try:
+            response = urlopen(Request(url, headers=headers), timeout=self.timeout)
+        except HTTPError as e:
+            response = e  # browsers render error pages too
+        except URLError as e:
+            raise WebDriverException('unknown error: could not load {} ({})'.format(url, e.reason))
+        try:
+            info = response.info()
+            set_cookies = info.get_all('Set-Cookie') if hasattr(info, 'get_all') else info.getheaders('Set-Cookie')
+            for header in set_cookies or ():
+                self._store_cookies(header)
+            return response.geturl(), response.read(), info.get('Content-Type', '')
+        finally:
+            response.close()
+
+    def _load(self, url):
+        if url == 'about:blank':
+            final_url, content, content_type = url, BLANK_PAGE, ''
+        elif urlsplit(url).scheme in ('http', 'https', 'file'):
+            final_url, content, content_type = self._request(url)
+        elif os.path.exists(url):
+            final_url, content, content_type = self._request('file:' + pathname2url(os.path.abspath(url)))
+        else:
+            raise WebDriverException('invalid argument: {} is neither a URL nor an existing file'.format(url))
+        charset = re.search(r'charset=([\w-]+)', content_type)
+        parser = lxml.html.HTMLParser(encoding=charset.group(1)) if charset else None
+        self._document = lxml.html.document_fromstring(content or BLANK_PAGE, parser=parser)
+        self._hidden = hidden_by_stylesheets(self._document)
+        self._url = final_url
+
+    def get(self, url):
+        self._load(url)
+        del self._history[self._history_index + 1:]
+        self._history.append(self._url)
+        self._history_index = len(self._history) - 1
+
+    def back(self):
+        if self._history_index > 0:
+            self._history_index -= 1
+            self._load(self._history[self._history_index])
+
+    def forward(self):
+        if self._history_index < len(self._history) - 1:
+            self._history_index += 1
+            self._load(self._history[self._history_index])
+
+    def refresh(self):
+        self._load(self._url)
+
+    @property
+    def current_url(self):
+        return self._url
+
+    @property
+    def title(self):
+        title = self._document.find('.//title')
+        return '' if title is None else _whitespace.sub(' ', title.text_content()).strip()
+
+    @property
+    def page_source(self):
+        return lxml.html.tostring(self._document, encoding='unicode')
+
+    # -- windows
+
+    @property
+    def window_handles(self):
+        return [self.window_handle] if self._window_open else []
+
+    @property
+    def current_window_handle(self):
+        if not self._window_open:
+            raise NoSuchWindowException('no such window: window was already closed')
+        return self.window_handle
+
+    @property
+    def switch_to(self):
+        return StaticSwitchTo(self)
+
+    def close(self):
+        self._window_open = False
+
+    def quit(self):
+        self._window_open = False
+        self._document = None
+
+    def get_window_size(self, windowHandle='current'):
+        return dict(self._window_size)
+
+    def set_window_size(self, width, height, windowHandle='current'):
+        self._window_size = {'width': int(width), 'height': int(height)}
+
+    def maximize_window(self):
+        pass
+
+    # -- WebDriver protocol: there is no browser to send commands to
+
+    w3c = True
+
+    def execute(self, driver_command, params=None):
+        raise UnsupportedOperation('The WebDriver command "{}"'.format(driver_command))
+
+    def implicitly_wait(self, time_to_wait):
+        pass
+
+    def set_script_timeout(self, time_to_wait):
+        pass
+
+    def set_page_load_timeout(self, time_to_wait):
+        pass
+
+    # -- elements
+
+    def _find_nodes(self, by, value, context):
+        if by == By.ID:
+            by, value = By.XPATH, './/*[@id={}]'.format(_xpath_literal(value))
+        elif by == By.NAME:
+            by, value = By.XPATH, './/*[@name={}]'.format(_xpath_literal(value))
+        elif by == By.CLASS_NAME:
+            by, value = By.CSS_SELECTOR, '.' + value
+        elif by == By.TAG_NAME:
+            by, value = By.CSS_SELECTOR, value
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            links = context.iter('a')
+            if by == By.LINK_TEXT:
+                return [link for link in links if visible_text(link, self._hidden) == value]
+            return [link for link in links if value in visible_text(link, self._hidden)]
+        if by not in (By.CSS_SELECTOR, By.XPATH):
+            raise UnsupportedOperation('Locating elements by {}'.format(by))
+        nodes = _compile(by, value)(context)
+        if not isinstance(nodes, list) or not all(_is_element(node) for node in nodes):
+            raise InvalidSelectorException('invalid selector: the result of the xpath expression "{}" is not '
+                                           'an element'.format(value))
+        return nodes
+
+    def _find_elements(self, by, value, context=None):
+        document = self._document
+        nodes = self._find_nodes(by, value, document if context is None else context)
+        return [StaticElement(self, node, document) for node in nodes]
+
+    def _find_element(self, by, value, context=None):
+        elements = self._find_elements(by, value, context)
+        if not elements:
+            raise NoSuchElementException('no such element: Unable to locate element: '
+                                         '{{"method":"{}","selector":"{}"}}'.format(by, value))
+        return elements[0]
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find_element(by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find_elements(by, value)
+
+    def find_element_by_id(self, id_):
+        return self.find_element(By.ID, id_)
+
+    def find_element_by_name(self, name):
+        return self.find_element(By.NAME, name)
+
+    def find_element_by_xpath(self, xpath):
+        return self.find_element(By.XPATH, xpath)
+
+    def find_element_by_css_selector(self, css_selector):
+        return self.find_element(By.CSS_SELECTOR, css_selector)
+
+    def find_element_by_class_name(self, name):
+        return self.find_element(By.CLASS_NAME, name)
+
+    def find_element_by_tag_name(self, name):
+        return self.find_element(By.TAG_NAME, name)
+
+    def find_element_by_link_text(self, link_text):
+        return self.find_element(By.LINK_TEXT, link_text)
+
+    def find_element_by_partial_link_text(self, link_text):
+        return self.find_element(By.PARTIAL_LINK_TEXT, link_text)
+
+    # -- scripts: the scripts of behave_webdriver.scripts are run in Python, nothing else
+
+    def _locate(self, target):
+        if isinstance(target, StaticElement):
+            return target.node
+        by = By.XPATH if target.startswith('/') else By.CSS_SELECTOR
+        nodes = self._find_nodes(by, target, self._document)
+        return nodes[0] if nodes else None
+
+    def _element_text(self, target):
+        node = self._locate(target)
+        return None if node is None else element_text(node, self._hidden)
+
+    def _text_predicate(self, target, mode, expected, excerpt_length):
+        node = self._locate(target)
+        if node is None:
+            return None
+        text = element_text(node, self._hidden)
+        index = -1
+        if mode == 'equals':
+            matched = text == expected
+        elif mode == 'contains':
+            index = text.find(expected)
+            matched = index != -1
+        elif mode == 'empty':
+            matched = len(text) == 0
+        else:
+            matched = len(text) > 0
+        start = max(0, index - excerpt_length // 2)
+        return {'matched': matched, 'excerpt': text[start:start + excerpt_length], 'start': start,
+                'length': len(text)}
+
+    def _same_text(self, first, second, excerpt_length):
+        nodes = [self._locate(first), self._locate(second)]
+        if None in nodes:
+            return {'missing': nodes.index(None)}
+        texts = [element_text(node, self._hidden) for node in nodes]
+        matched = texts[0] == texts[1]
+        index = 0
+        while index < min(len(texts[0]), len(texts[1])) and texts[0][index] == texts[1][index]:
+            index += 1
+        start = 0 if matched else max(0, index - excerpt_length // 2)
+        return [{'matched': matched, 'excerpt': text[start:start + excerpt_length], 'start': start,
+                 'length': len(text)} for text in texts]
+
+    def _wait_for_element(self, target, spec, timeout_ms):
+        # the page never changes, the outcome is known right away
+        node = self._locate(target)
+        element = None if node is None else StaticElement(self, node, self._document)
+        ok = evaluate_predicate(spec, element) is True
+        return {'ok': ok, 'element': element if ok else None}
+
+    def _wait_for_ready(self, conditions, timeout_ms):
+        # a static document is complete and idle as soon as it is parsed, only selectors can fail
+        failing = []
+        for index, condition in enumerate(conditions):
+            if condition['type'] == 'js':
+                raise UnsupportedOperation('Running JavaScript ({!r})'.format(condition['value'][:60]))
+            if condition['type'] == 'selector' and self._locate(condition['value']) is None:
+                failing.append(index)
+        return {'ok': not failing, 'failing': failing}
+
+    def _script(self, script, scripts_table):
+        handler = scripts_table.get(script)
+        if handler is None:
+            raise UnsupportedOperation('Running JavaScript ({!r})'.format(script[:60]))
+        return handler
+
+    def execute_script(self, script, *args):
+        handler = self._script(script, {
+            scripts.ELEMENT_TEXT: self._element_text,
+            scripts.TEXT_PREDICATE: self._text_predicate,
+            scripts.SAME_TEXT: self._same_text,
+            scripts.CLEAR_STORAGE: lambda: None,  # no storage either
+            scripts.ACTIVITY_TRACKER: lambda: None,  # nor requests
+        })
+        return handler(*args)
+
+    def execute_async_script(self, script, *args):
+        handler = self._script(script, {
+            scripts.WAIT_FOR_ELEMENT: self._wait_for_element,
+            scripts.WAIT_FOR_QUIESCENCE: lambda settle_ms, timeout_ms: {'quiet': True, 'elapsed': 0},
+            scripts.WAIT_FOR_READY: self._wait_for_ready,
+        })
+        return handler(*args)
+
+    # -- cookies
+
+    def _store_cookies(self, header):
+        parsed = SimpleCookie()
+        parsed.load(header)
+        for name, morsel in parsed.items():
+            if morsel['max-age'] in ('0', '-1'):
+                self._cookies.pop(name, None)
+                continue
+            self._cookies[name] = {'name': name,
+                                   'value': morsel.value,
+                                   'path': morsel['path'] or '/',
+                                   'domain': morsel['domain'] or urlsplit(self._url).hostname,
+                                   'secure': bool(morsel['secure']),
+                                   'httpOnly': bool(morsel['httponly'])}
+
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self._cookies.values()]
+
+    def get_cookie(self, name):
+        cookie = self._cookies.get(name)
+        return None if cookie is None else dict(cookie)
+
+    def add_cookie(self, cookie_dict):
+        cookie = {'path': '/', 'domain': urlsplit(self._url).hostname, 'secure': False, 'httpOnly': False}
+        cookie.update(cookie_dict)
+        self._cookies[cookie['name']] = cookie
+
+    def delete_cookie(self, name):
+        self._cookies.pop(name, None)
+
+    def delete_all_cookies(self):
+        self._cookies.clear()
+
+
+def _xpath_literal(value):
+    if "'" not in value:
+        return "'{}'".format(value)
+    if '"' not in value:
+        return '"{}"'.format(value)
+    return 'concat({})'.format(', "\'", '.join("'{}'".format(part) for part in value.split("'")))
+
+
+class Static(BehaveDriverMixin, StaticWebDriver):
+    """
+    Browserless driver for static markup checks, registered as 'static' for ``from_string``/``from_env``.
+    """
+    @property
+    def has_alert(self):
+        return False  # no JavaScript, no alert: skip the polling
+
+    def doubleclick_element(self, element):
+        raise UnsupportedOperation('Double clicking')
+
+    def drag_element(self, element, to_element):
+        raise UnsupportedOperation('Dragging')
+
+    def move_to_element(self, element, offset=None):
+        raise UnsupportedOperation('Moving the mouse')
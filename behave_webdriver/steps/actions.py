@@ -1,13 +1,14 @@
 import string
-from behave import *
+from behave import given, step, use_step_matcher, when
 try:
     from urllib.parse import urljoin
 except ImportError:
     from urlparse import urljoin  # Python 2
 from ..parameter_transformations import transform_parameter
+from ..matchers import INDEXED_PARSE, INDEXED_RE
 
 
-use_step_matcher('parse')
+use_step_matcher(INDEXED_PARSE)
 
 
 @when('I pause for {milliseconds:d}ms')
@@ -37,21 +38,39 @@ def click_button(context, element):
 
 @when('I set "{value}" to the inputfield "{element}"')
 def set_input(context, value, element):
-    elem = context.behave_driver.get_element(element)
-    elem.clear()
-    elem.send_keys(value)
+    context.behave_driver.set_input(element, value)
 
 
 @when('I add "{value}" to the inputfield "{element}"')
 def add_input(context, value, element):
-    elem = context.behave_driver.get_element(element)
-    elem.send_keys(value)
+    context.behave_driver.add_input(element, value)
+
+
+@when('I quickly set "{value}" to the inputfield "{element}"')
+def set_input_fast(context, value, element):
+    context.behave_driver.set_input(element, value, fast=True)
+
+
+@when('I quickly add "{value}" to the inputfield "{element}"')
+def add_input_fast(context, value, element):
+    context.behave_driver.add_input(element, value, fast=True)
 
 
 @when('I clear the inputfield "{element}"')
 def clear_input(context, element):
-    elem = context.behave_driver.get_element(element)
-    elem.clear()
+    context.behave_driver.clear_input(element)
+
+
+@when('I fill in the form "{element}" with:')
+def fill_form(context, element):
+    fields = [(row[0], row[1]) for row in context.table]
+    context.behave_driver.fill_form(element, fields)
+
+
+@when('I fill in the form "{element}" with keystrokes:')
+def type_form(context, element):
+    fields = [(row[0], row[1]) for row in context.table]
+    context.behave_driver.fill_form(element, fields, keystrokes=True)
 
 
 @when('I drag element "{from_element}" to element "{to_element}"')
@@ -102,7 +121,7 @@ def move_to_element(context, element):
     context.behave_driver.move_to_element(element)
 
 
-use_step_matcher('re')
+use_step_matcher(INDEXED_RE)
 
 
 @when('I close the last opened (tab|window)')
@@ -150,6 +169,20 @@ def close_secondary_windows(context, window_or_tab):
     context.behave_driver.switch_to_window(context.behave_driver.primary_handle)
 
 
+@step('I open the url "([^"]*)?" and wait for "([^"]*)"')
+def open_url_when_ready(context, url, ready):
+    url = transform_parameter(context, url)
+    context.behave_driver.open_url(url, ready=transform_parameter(context, ready))
+
+
+@step('I open the site "([^"]*)?" and wait for "([^"]*)"')
+def open_site_when_ready(context, url, ready):
+    url = transform_parameter(context, url)
+    base_url = getattr(context, 'base_url', 'http://localhost:8000')
+    destination = urljoin(base_url, url)
+    context.behave_driver.open_url(destination, ready=transform_parameter(context, ready))
+
+
 @step('I open the url "([^"]*)?"')
 def open_url(context, url):
     url = transform_parameter(context, url)
@@ -192,4 +225,4 @@ def set_screen_dimension(context, size, how):
         context.behave_driver.screen_size = (size, None)
 
 
-use_step_matcher('parse')
+use_step_matcher('parse')  # behave's default, for the step modules loaded next
@@ -4,9 +4,10 @@ try:
 except ImportError:
     from urlparse import urlparse
 from behave_webdriver import transform_parameter
+from behave_webdriver.matchers import INDEXED_RE
 
 
-use_step_matcher('re')
+use_step_matcher(INDEXED_RE)
 
 
 @given('the element "([^"]*)?" is( not)* visible')
@@ -90,9 +91,8 @@ def check_element_exists(context, element, negative):
 @given('the element "([^"]*)?" contains( not)* the same text as element "([^"]*)?"')
 @then('I expect that element "([^"]*)?"( not)* contains the same text as element "([^"]*)?"')
 def elements_same_text(context, first_element, negative, second_element):
-    first_elem_text = context.behave_driver.get_element_text(first_element)
-    second_elem_text = context.behave_driver.get_element_text(second_element)
-    same = first_elem_text == second_elem_text
+    first_elem_text, second_elem_text = context.behave_driver.compare_element_texts(first_element, second_element)
+    same = bool(first_elem_text)
     if negative:
         assert not same, 'Element "{}" text "{}" is same as element "{}"'.format(first_element,
                                                                                  first_elem_text,
@@ -107,31 +107,30 @@ def elements_same_text(context, first_element, negative, second_element):
 @given('the element "([^"]*)?"( not)* matches the text "([^"]*)?"')
 @then('I expect that element "([^"]*)?"( not)* matches the text "([^"]*)?"')
 def element_matches_text(context, element, negative, text):
-    elem_text = context.behave_driver.get_element_text(element)
-    matches = elem_text == text
+    match = context.behave_driver.match_element_text(element, 'equals', text)
     if negative:
-        assert not matches, 'Element "{}" text matches "{}"'.format(element,
-                                                                    text)
+        assert not match, 'Element "{}" text matches "{}"'.format(element,
+                                                                  text)
     else:
-        assert matches, 'The text "{}" did not match the element text "{}"'.format(text, elem_text)
+        assert match, 'The text "{}" did not match the element text "{}"'.format(text, match)
 
 
 @given('the element "([^"]*)?"( not)* contains the text "([^"]*)?"')
 @then('I expect that element "([^"]*)?"( not)* contains the text "([^"]*)?"')
 def check_element_contains_text(context, element, negative, text):
-    contains = context.behave_driver.element_contains(element, text)
+    match = context.behave_driver.match_element_text(element, 'contains', text)
     if negative:
-        assert not contains, 'Element text does contain "{}"'.format(text)
+        assert not match, 'Element text does contain "{}": "{}"'.format(text, match)
     else:
-        assert contains, 'Element text does not contain "{}"'.format(text)
+        assert match, 'Element text does not contain "{}": "{}"'.format(text, match)
 
 
 @given('the element "([^"]*)?"( not)* contains any text')
 @then('I expect that element "([^"]*)?"( not)* contains any text')
 def element_any_text(context, element, negative):
-    any_text = bool(context.behave_driver.get_element_text(element))
+    any_text = context.behave_driver.match_element_text(element, 'any')
     if negative:
-        assert not any_text
+        assert not any_text, 'Element text was "{}"'.format(any_text)
     else:
         assert any_text
 
@@ -139,12 +138,11 @@ def element_any_text(context, element, negative):
 @given('the element "([^"]*)?" is( not)* empty')
 @then('I expect that element "([^"]*)?" is( not)* empty')
 def check_element_empty(context, element, negative):
-    elem_text = context.behave_driver.get_element_text(element)
-    any_text = bool(elem_text)
+    empty = context.behave_driver.match_element_text(element, 'empty')
     if negative:
-        assert any_text is True
+        assert not empty
     else:
-        assert any_text is False
+        assert empty, 'Element text was "{}"'.format(empty)
 
 
 @given('the page url is( not)* "([^"]*)?"')
@@ -308,13 +306,14 @@ def check_modal_text_contains(context, modal_type, negative, text):
         assert text in alert_text
 
 
-@then('I wait on element "([^"]*)?"(?: for (\d+)ms)*(?: to( not)* (be checked|be enabled|be selected|be visible|contain a text|contain a value|exist))*')
-def wait_for_element_condition(context, element, milliseconds, negative, condition):
+@then('I wait on element "([^"]*)?"(?: for (\d+)ms)*(?: to( not)* (be checked|be enabled|be selected|be visible|contain a text|contain a value|exist))*(?: with (fixed|backoff|fast-start) polling)*')
+def wait_for_element_condition(context, element, milliseconds, negative, condition, polling):
     if milliseconds:
         digits = ''.join(char for char in milliseconds if char.isdigit())
         milliseconds = int(digits)
 
-    result = context.behave_driver.wait_for_element_condition(element, milliseconds, negative, condition)
+    result = context.behave_driver.wait_for_element_condition(element, milliseconds, negative, condition,
+                                                              polling=polling)
     if not negative:
         negative = ''
     assert result, 'was expecting element "{element}" to {negative} {condition}, but the result was {result}'.format(
@@ -329,5 +328,5 @@ def check_screen_size(context, x, y):
     screen_x, screen_y = context.behave_driver.screen_size
 
 
-use_step_matcher('parse')
+use_step_matcher('parse')  # behave's default, for the step modules loaded next
 
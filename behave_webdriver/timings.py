@@ -0,0 +1,141 @@
+"""
+Provides persisted feature and scenario durations, and duration-aware sharding for :py:mod:`behave_webdriver.parallel`.
+"""
+import heapq
+import io
+import json
+import os
+import re
+
+DEFAULT_TIMINGS_FILE = '.behave_webdriver_timings.json'
+
+#: Seconds per step assumed for features without history, when no step has been timed yet either.
+DEFAULT_SECONDS_PER_STEP = 0.5
+
+_step_line = re.compile(r'^\s*(Given|When|Then|And|But|\*)\s', re.IGNORECASE)
+
+
+def feature_key(path):
+    """
+    Normalized key of a feature file, relative to the working directory like behave's report locations.
+    """
+    return os.path.relpath(os.path.abspath(path)).replace(os.sep, '/')
+
+
+def count_steps(path):
+    """
+    Count the step lines of a feature file, background and scenario outline steps included.
+    """
+    with io.open(path, encoding='utf-8') as f:
+        return sum(1 for line in f if _step_line.match(line))
+
+
+class Timings(object):
+    """
+    Feature and scenario durations (in seconds) from previous runs.
+
+    Durations are smoothed over runs with an exponentially weighted average, so a single slow run does not throw off
+    the next shard assignment.
+
+    >>> timings = Timings.load()
+    >>> timings.record(behave_json_report)
+    >>> timings.save()
+    """
+    #: Weight of the latest run in the smoothed durations.
+    smoothing = 0.5
+
+    def __init__(self, features=None, scenarios=None, steps=0, step_seconds=0.0, path=DEFAULT_TIMINGS_FILE):
+        self.features = features or {}
+        self.scenarios = scenarios or {}
+        self.steps = steps
+        self.step_seconds = step_seconds
+        self.path = path
+
+    @classmethod
+    def load(cls, path=DEFAULT_TIMINGS_FILE):
+        """
+        Load timings from a file. A missing file gives empty timings.
+        """
+        if not os.path.exists(path):
+            return cls(path=path)
+        with io.open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(features=data.get('features'),
+                   scenarios=data.get('scenarios'),
+                   steps=data.get('steps', 0),
+                   step_seconds=data.get('step_seconds', 0.0),
+                   path=path)
+
+    def save(self, path=None):
+        data = {'features': self.features,
+                'scenarios': self.scenarios,
+                'steps': self.steps,
+                'step_seconds': self.step_seconds}
+        with open(path or self.path, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    def _smooth(self, durations, key, seconds):
+        previous = durations.get(key)
+        if previous is None:
+            durations[key] = seconds
+        else:
+            durations[key] = self.smoothing * seconds + (1 - self.smoothing) * previous
+
+    def record(self, report):
+        """
+        Record the durations of a behave JSON report (a list of features).
+        Features and scenarios that did not run (e.g. filtered out by tags) are left untouched.
+        """
+        for feature in report:
+            key = feature_key(feature['location'].rsplit(':', 1)[0])
+            feature_seconds = 0.0
+            for element in feature.get('elements', []):
+                durations = [step['result'].get('duration', 0.0)
+                             for step in element.get('steps', []) if 'result' in step]
+                seconds = sum(durations)
+                self.steps += len(durations)
+                self.step_seconds += seconds
+                feature_seconds += seconds
+                if element.get('type') == 'scenario' and durations:
+                    self._smooth(self.scenarios, '{}::{}'.format(key, element.get('name')), seconds)
+            if feature_seconds:
+                self._smooth(self.features, key, feature_seconds)
+
+    @property
+    def seconds_per_step(self):
+        if not self.steps:
+            return DEFAULT_SECONDS_PER_STEP
+        return self.step_seconds / self.steps
+
+    def estimate(self, path):
+        """
+        Estimated duration of a feature file: its recorded duration, or its step count times the average step
+        duration when it has no history.
+        """
+        seconds = self.features.get(feature_key(path))
+        if seconds is not None:
+            return seconds
+        return count_steps(path) * self.seconds_per_step
+
+
+def shard_by_duration(features, workers, estimate):
+    """
+    Assign features to workers with longest-processing-time-first bin packing: the longest features are placed first,
+    each on the currently least loaded worker. This keeps the makespan (the slowest worker) within 4/3 of the optimum.
+
+    :param features: feature file paths
+    :param workers: number of workers
+    :param estimate: callable returning the estimated duration of a feature file
+    :return: a tuple of the list of ``workers`` shards and the list of their estimated durations
+    :rtype: tuple
+    """
+    shards = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    heap = [(0.0, index) for index in range(workers)]
+    estimates = dict((feature, estimate(feature)) for feature in features)
+    for feature in sorted(features, key=lambda feature: (-estimates[feature], feature)):
+        load, index = heapq.heappop(heap)
+        shards[index].append(feature)
+        loads[index] = load + estimates[feature]
+        heapq.heappush(heap, (loads[index], index))
+    return shards, loads
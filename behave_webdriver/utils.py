@@ -1,27 +1,65 @@
+import sys
 from os import getenv
-from behave_webdriver.driver import (Chrome,
-                                     Firefox,
-                                     Ie,
-                                     Edge,
-                                     Opera,
-                                     Safari,
-                                     BlackBerry,
-                                     PhantomJS,
-                                     Android,
-                                     Remote)
+from importlib import import_module
+
+_driver_names = ('Chrome', 'Firefox', 'Ie', 'Edge', 'Opera', 'Safari', 'BlackBerry', 'PhantomJS', 'Android', 'Remote')
+_driver_registry = None
+
+if sys.version_info < (3, 7):
+    # no module __getattr__, the driver classes are imported right away
+    _driver_module = import_module('behave_webdriver.driver')
+    globals().update((name, getattr(_driver_module, name)) for name in _driver_names)
+else:
+    def __getattr__(name):
+        # driver classes are imported (and selenium with them) when first used
+        if name not in _driver_names:
+            raise AttributeError("module 'behave_webdriver.utils' has no attribute '{}'".format(name))
+        value = getattr(import_module('behave_webdriver.driver'), name)
+        globals()[name] = value
+        return value
+
+
+def _registry():
+    global _driver_registry
+    if _driver_registry is None:
+        _driver_registry = dict((name.upper(), name) for name in _driver_names)
+        _driver_registry['CHROME.HEADLESS'] = 'Chrome.headless'
+        _driver_registry['STATIC'] = 'behave_webdriver.static:Static'
+        _driver_registry['REPLAY'] = 'behave_webdriver.recording:Replay'
+    return _driver_registry
+
+
+def register_driver(name, target):
+    """
+    Make a driver available by name to ``from_string``, ``from_env`` and the fixtures.
+
+    :param name: the (case insensitive) name of the driver
+    :type name: str
+    :param target: where to find the driver: an attribute path in this module (e.g. 'Chrome.headless') or a
+                   'module:attribute.path' string, resolved when the driver is first requested.
+    :type target: str
+    """
+    _registry()[name.upper()] = target
+
+
+def _resolve(target):
+    if ':' in target:
+        module_name, path = target.split(':', 1)
+        obj = import_module(module_name)
+    else:
+        obj, path = sys.modules[__name__], target
+    for attr in path.split('.'):
+        obj = getattr(obj, attr)
+    return obj
 
 
 def _from_string(webdriver_string):
-    def get_driver_name(driver):
-        return driver.__name__.upper()
-    drivers = [Chrome, Firefox, Ie, Edge, Opera, Safari, BlackBerry, PhantomJS, Android, Remote]
-    driver_map = {get_driver_name(d): d for d in drivers}
-    driver_map['CHROME.HEADLESS'] = Chrome.headless
-    Driver = driver_map.get(webdriver_string.upper(), None)
-    if Driver is None:
+    driver_map = _registry()
+    target = driver_map.get(webdriver_string.upper(), None)
+    if target is None:
         raise ValueError('No such driver "{}". Valid options are: {}'.format(webdriver_string,
                                                                              ', '.join(driver_map.keys())))
-    return Driver
+    return _resolve(target)
 
 
 def from_string(webdriver_string, *args, **kwargs):
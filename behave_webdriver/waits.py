@@ -0,0 +1,247 @@
+"""
+Provides the in-browser wait engine used by :py:meth:`~behave_webdriver.driver.BehaveDriverMixin.wait_for_element_condition`,
+the polling strategies of the waits that poll from the test process instead, and the page quiescence wait of smart
+pauses.
+"""
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from behave_webdriver import scripts
+
+try:
+    _string_types = basestring  # Python 2, where step arguments are unicode
+except NameError:
+    _string_types = str
+
+#: Extra seconds granted to the driver's script timeout, on top of the wait timeout, for the round trip itself.
+SCRIPT_TIMEOUT_MARGIN = 2
+
+
+def ensure_script_timeout(driver, timeout, margin=SCRIPT_TIMEOUT_MARGIN):
+    """
+    Raise the driver's async script timeout, if needed, to let a script wait up to ``timeout`` seconds.
+    """
+    needed = timeout + margin
+    current = getattr(driver, '_async_script_timeout', None)
+    if current is None or current < needed:
+        driver.set_script_timeout(needed)
+        driver._async_script_timeout = needed
+
+
+def wait_for_quiescence(driver, timeout, settle):
+    """
+    Wait until the page is quiescent: the document is loaded, no fetch or XMLHttpRequest is pending and the DOM did
+    not change for ``settle`` seconds. Only requests started after the page's activity tracker was installed (see
+    ``scripts.ACTIVITY_TRACKER``) are known.
+
+    :param timeout: the maximum number of seconds to wait
+    :param settle: the number of seconds without DOM mutations nor requests
+    :return: whether or not the page became quiescent within the timeout
+    :rtype: bool
+    :raises WebDriverException: when the script could not run, e.g. the page navigated during the wait
+    """
+    ensure_script_timeout(driver, timeout)
+    outcome = driver.execute_async_script(scripts.WAIT_FOR_QUIESCENCE, int(settle * 1000), int(timeout * 1000))
+    return bool(outcome and outcome.get('quiet'))
+
+
+class FixedPolling(object):
+    """
+    Polls at a fixed interval, like selenium's ``WebDriverWait``.
+
+    :param interval: the seconds between polls
+    """
+    name = 'fixed'
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+
+    def intervals(self):
+        """
+        :return: an endless iterator of the seconds to sleep after each poll
+        """
+        while True:
+            yield self.interval
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, self.interval)
+
+
+class BackoffPolling(object):
+    """
+    Polls quickly at first, then less and less often: each interval is ``factor`` times the previous one, up to
+    ``cap``. Conditions that hold early are noticed early, and long waits put little load on the browser (or grid).
+
+    :param initial: the seconds slept after the first poll
+    :param factor: the growth of the interval after each poll
+    :param cap: the longest interval
+    """
+    name = 'backoff'
+
+    def __init__(self, initial=0.05, factor=2, cap=1.0):
+        self.initial = initial
+        self.factor = factor
+        self.cap = cap
+
+    def intervals(self):
+        interval = self.initial
+        while True:
+            yield min(interval, self.cap)
+            interval = min(interval * self.factor, self.cap)
+
+    def __repr__(self):
+        return '{}({}, {}, {})'.format(type(self).__name__, self.initial, self.factor, self.cap)
+
+
+class FastStartPolling(object):
+    """
+    Polls after each interval of a fixed schedule, then at a steady interval.
+
+    :param schedule: the seconds slept after the first polls
+    :param then: the seconds slept after every later poll
+    """
+    name = 'fast-start'
+
+    def __init__(self, schedule=(0.01, 0.025, 0.05), then=0.25):
+        self.schedule = tuple(schedule)
+        self.then = then
+
+    def intervals(self):
+        for interval in self.schedule:
+            yield interval
+        while True:
+            yield self.then
+
+    def __repr__(self):
+        return '{}({}, {})'.format(type(self).__name__, self.schedule, self.then)
+
+
+#: The polling strategies by name
+POLLING_STRATEGIES = {strategy.name: strategy for strategy in (FixedPolling, BackoffPolling, FastStartPolling)}
+
+
+def polling_strategy(polling):
+    """
+    Get a polling strategy from its description.
+
+    :param polling: a strategy, the name of one (see ``POLLING_STRATEGIES``) or a number of seconds between polls.
+        None gets selenium's fixed half second.
+    :return: an object whose ``intervals()`` iterates the seconds to sleep after each poll
+    """
+    if polling is None:
+        return FixedPolling()
+    if isinstance(polling, _string_types):
+        try:
+            return POLLING_STRATEGIES[polling]()
+        except KeyError:
+            raise ValueError('Invalid polling strategy "{}". Valid options are: {}'.format(
+                polling, ', '.join(sorted(POLLING_STRATEGIES))))
+    if isinstance(polling, (int, float)):
+        return FixedPolling(polling)
+    return polling
+
+
+class PollingWait(WebDriverWait):
+    """
+    A ``WebDriverWait`` that sleeps between polls as told by a polling strategy (see :py:func:`polling_strategy`) and
+    records the number of polls and the time to success of each wait in a
+    :py:class:`~behave_webdriver.instrumentation.WaitLog`.
+
+    >>> PollingWait(driver, 5, polling='fast-start', log=driver.waits).until(element_is_visible(locator))
+    """
+    def __init__(self, driver, timeout, polling=None, log=None, ignored_exceptions=None):
+        super(PollingWait, self).__init__(driver, timeout, ignored_exceptions=ignored_exceptions)
+        self.polling = polling_strategy(polling)
+        self.log = log
+
+    def until(self, method, message=''):
+        screen = None
+        stacktrace = None
+        polls = 0
+        started = time.time()
+        end_time = started + self._timeout
+        intervals = self.polling.intervals()
+        while True:
+            polls += 1
+            try:
+                value = method(self._driver)
+                if value:
+                    self._record(polls, started, True)
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, 'screen', None)
+                stacktrace = getattr(exc, 'stacktrace', None)
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(next(intervals), remaining))
+        self._record(polls, started, False)
+        raise TimeoutException(message, screen, stacktrace)
+
+    def _record(self, polls, started, succeeded):
+        if self.log is not None:
+            self.log.record(getattr(self.polling, 'name', type(self.polling).__name__), polls, time.time() - started, succeeded)
+
+
+class BrowserWait(object):
+    """
+    Waits for a condition from :py:mod:`behave_webdriver.conditions` by evaluating its in-page predicate inside the
+    browser with ``execute_async_script``.
+
+    The predicate is re-evaluated on DOM mutations (batched with requestAnimationFrame) and on a short interval for
+    changes that don't mutate the DOM, such as layout or style changes. The script resolves as soon as the condition
+    holds or the timeout expires, so the whole wait is a single round trip.
+
+    Only conditions with a ``js_predicate`` and CSS or XPATH locators are supported, see :py:meth:`supports`.
+    Callers should fall back to selenium's ``WebDriverWait`` for anything else.
+
+    >>> wait = BrowserWait(driver, timeout=5)
+    >>> condition = element_is_visible((By.CSS_SELECTOR, '#banner'))
+    >>> if wait.supports(condition):
+    ...     element = wait.until(condition)
+    """
+    script_timeout_margin = SCRIPT_TIMEOUT_MARGIN
+
+    def __init__(self, driver, timeout):
+        self._driver = driver
+        self._timeout = timeout
+
+    def supports(self, condition):
+        """
+        Whether or not the condition can be evaluated in the browser by this driver.
+
+        :param condition: an expected condition instance
+        :rtype: bool
+        """
+        if not getattr(condition, 'js_predicate', None):
+            return False
+        if not callable(getattr(self._driver, 'execute_async_script', None)):
+            return False
+        locator = getattr(condition, 'locator', None)
+        if not locator or locator[0] not in (By.CSS_SELECTOR, By.XPATH):
+            return False
+        # the page resolves selectors like get_element does, by their leading slash
+        return (locator[0] == By.XPATH) == locator[1].startswith('/')
+
+    def until(self, condition):
+        """
+        Wait until the condition holds.
+
+        :param condition: an expected condition supported by this engine
+        :return: the located element when a positive presence/visibility condition holds, otherwise True
+        :raises TimeoutException: when the condition does not hold within the timeout
+        :raises WebDriverException: when the script could not run, e.g. the page navigated during the wait
+        """
+        ensure_script_timeout(self._driver, self._timeout, self.script_timeout_margin)
+        by, selector = condition.locator
+        outcome = self._driver.execute_async_script(scripts.WAIT_FOR_ELEMENT,
+                                                    selector,
+                                                    condition.js_spec(),
+                                                    int(self._timeout * 1000))
+        if not outcome or not outcome.get('ok'):
+            raise TimeoutException('Condition {} was not met within {} seconds'.format(condition.js_spec(),
+                                                                                       self._timeout))
+        return outcome.get('element') or True
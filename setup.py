@@ -18,6 +18,9 @@ setup(
         'selenium',
         'behave'
     ],
+    extras_require={
+        'static': ['lxml', 'cssselect'],
+    },
     classifiers=[
         'Intended Audience :: Developers',
         'Topic :: Software Development :: Testing',
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""compare two result files of tests/benchmarks/step_latency.py
+
+Operations are listed by their change in time per call. Any change in the number of WebDriver round trips is flagged,
+since it is independent of the machine and the injected latency.
+
+Usage: python tests/benchmarks/compare.py BEFORE.json AFTER.json
+"""
+from __future__ import print_function
+
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(before, after):
+    """
+    :return: a list of (operation, before result, after result) for operations found in both runs
+    """
+    names = sorted(set(before['operations']).intersection(after['operations']))
+    return [(name, before['operations'][name], after['operations'][name]) for name in names]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print(__doc__.strip().splitlines()[-1], file=sys.stderr)
+        return 2
+    before, after = load(argv[0]), load(argv[1])
+    if before.get('latency') != after.get('latency'):
+        print('warning: the runs used different latencies ({} and {})'.format(before.get('latency'),
+                                                                              after.get('latency')))
+    rows = compare(before, after)
+    rows.sort(key=lambda row: row[2]['seconds'] - row[1]['seconds'])
+    print('{:>10} {:>10} {:>8} {:>9} {:>9}  {}'.format('before ms', 'after ms', 'change', 'commands', 'was', 'operation'))
+    for name, old, new in rows:
+        change = (new['seconds'] - old['seconds']) / old['seconds'] * 100 if old['seconds'] else 0.0
+        flag = '' if new['roundtrips'] == old['roundtrips'] else '  <- round trips changed'
+        print('{:>10.2f} {:>10.2f} {:>+7.1f}% {:>9.1f} {:>9.1f}  {}{}'.format(
+            old['seconds'] * 1000, new['seconds'] * 1000, change, new['roundtrips'], old['roundtrips'], name, flag))
+    total_before = sum(old['seconds'] for _, old, _ in rows)
+    total_after = sum(new['seconds'] for _, _, new in rows)
+    print('total: {:.1f} ms -> {:.1f} ms per iteration of every operation'.format(total_before * 1000,
+                                                                                 total_after * 1000))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
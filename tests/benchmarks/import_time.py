@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""measure the import time of behave_webdriver modules
+
+Each import runs in a fresh interpreter, the median of several runs is reported.
+Usage: python tests/benchmarks/import_time.py [runs]
+"""
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..'))
+
+statements = [
+    'import behave_webdriver',
+    'import behave_webdriver.parallel',
+    'from behave_webdriver import Chrome',
+    'from behave_webdriver import fixture_browser',
+    'import behave_webdriver.steps',
+]
+
+runs = 7
+try:
+    runs = int(sys.argv[1])
+except (IndexError, ValueError):
+    pass
+
+
+def import_time(statement):
+    code = 'import time; start = time.time(); {}; print(time.time() - start)'.format(statement)
+    timings = sorted(float(subprocess.check_output([sys.executable, '-c', code], cwd=root_dir))
+                     for _ in range(runs))
+    return timings[len(timings) // 2]
+
+
+for statement in statements:
+    print('{:>10.1f} ms  {}'.format(import_time(statement) * 1000, statement))
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""measure the latency and WebDriver round trips of every driver method and step
+
+No browser is involved: a local stub WebDriver server (tests/unittests/webdriver_stub.py) answers every command after
+an injected latency, emulating a remote grid. Each operation runs several times and its mean time and round trips per
+call are reported. Steps are matched by behave's step registry from sample step texts, like in a feature file.
+
+Results can be saved and two runs compared with tests/benchmarks/compare.py:
+
+    python tests/benchmarks/step_latency.py --latency 0.005 --output before.json
+    python tests/benchmarks/step_latency.py --latency 0.005 --output after.json
+    python tests/benchmarks/compare.py before.json after.json
+
+Usage: python tests/benchmarks/step_latency.py [--latency SECONDS] [--iterations N] [--output FILE] [--driver-kwarg
+NAME=VALUE ...]
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from importlib import import_module
+
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, os.path.join(root_dir, 'tests', 'unittests'))
+
+from behave.step_registry import registry
+from behave_webdriver import scripts
+from behave_webdriver.driver import BehaveDriverMixin, Remote
+from webdriver_stub import StubWebDriverServer
+
+import_module('behave_webdriver.steps')  # registers the steps
+
+
+def script_handler(script, args, state):
+    """
+    Canned results for the scripts of behave_webdriver.scripts: every element exists, is visible and has text.
+    """
+    if script == scripts.ELEMENT_GEOMETRY:
+        return dict(state.element_rect, scrollX=0, scrollY=0, viewportWidth=1024, viewportHeight=768)
+    if script == scripts.ELEMENT_TEXT:
+        return state.element_text
+    if script == scripts.SAME_TEXT:
+        text = {'matched': True, 'excerpt': state.element_text, 'start': 0, 'length': len(state.element_text)}
+        return [text, text]
+    if script == scripts.TEXT_PREDICATE:
+        return {'matched': True, 'excerpt': state.element_text, 'start': 0, 'length': len(state.element_text)}
+    if script == scripts.WAIT_FOR_ELEMENT:
+        return {'ok': True, 'element': state.new_element()}
+    if script == scripts.WAIT_FOR_READY:
+        return {'ok': True, 'elapsed': 0}
+    if script == scripts.WAIT_FOR_QUIESCENCE:
+        return {'quiet': True, 'elapsed': 0}
+    if script == scripts.SET_VALUE:
+        return ''
+    if script == scripts.FILL_FORM:
+        return {'missing': [], 'errors': []}
+    if 'apply(null, arguments)' in script:
+        # selenium's getAttribute(element, name) and isDisplayed(element) atoms
+        return 'stub' if len(args) == 2 else True
+    return None
+
+
+class Context(object):
+    """
+    Stands in for behave's context when calling step functions directly.
+    """
+    def __init__(self, behave_driver):
+        self.behave_driver = behave_driver
+        self.base_url = 'http://localhost:8000'
+        self.table = [['#name', 'stub'], ['#notes', 'stub text']]  # of the form steps
+
+
+METHODS = [
+    ('get_element', lambda driver: driver.get_element('#element')),
+    ('get_element_text', lambda driver: driver.get_element_text('#element')),
+    ('match_element_text', lambda driver: driver.match_element_text('#element', 'contains', 'stub')),
+    ('compare_element_texts', lambda driver: driver.compare_element_texts('#element', '#other')),
+    ('get_element_attribute', lambda driver: driver.get_element_attribute('#element', 'class')),
+    ('get_element_attribute css', lambda driver: driver.get_element_attribute('#element', 'color', css=True)),
+    ('get_element_geometry', lambda driver: driver.get_element_geometry('#element')),
+    ('get_element_size', lambda driver: driver.get_element_size('#element')),
+    ('get_element_location', lambda driver: driver.get_element_location('#element')),
+    ('open_url', lambda driver: driver.open_url('http://localhost:8000/')),
+    ('open_url ready', lambda driver: driver.open_url('http://localhost:8000/', ready='selector:#element')),
+    ('element_exists', lambda driver: driver.element_exists('#element')),
+    ('element_visible', lambda driver: driver.element_visible('#element')),
+    ('element_in_viewport', lambda driver: driver.element_in_viewport('#element')),
+    ('element_enabled', lambda driver: driver.element_enabled('#element')),
+    ('element_focused', lambda driver: driver.element_focused('#element')),
+    ('element_selected', lambda driver: driver.element_selected('#element')),
+    ('element_contains', lambda driver: driver.element_contains('#element', 'stub')),
+    ('element_has_class', lambda driver: driver.element_has_class('#element', 'stub')),
+    ('click_element', lambda driver: driver.click_element('#element')),
+    ('doubleclick_element', lambda driver: driver.doubleclick_element('#element')),
+    ('click_link_text', lambda driver: driver.click_link_text('a link')),
+    ('drag_element', lambda driver: driver.drag_element('#source', '#target')),
+    ('submit', lambda driver: driver.submit('#form')),
+    ('get_actionable_element', lambda driver: driver.get_actionable_element('#element')),
+    ('set_input', lambda driver: driver.set_input('#input', 'text')),
+    ('set_input fast', lambda driver: driver.set_input('#input', 'text', fast=True)),
+    ('add_input', lambda driver: driver.add_input('#input', 'text')),
+    ('add_input fast', lambda driver: driver.add_input('#input', 'text', fast=True)),
+    ('clear_input', lambda driver: driver.clear_input('#input')),
+    ('fill_form', lambda driver: driver.fill_form('#form', [('#name', 'stub'), ('#notes', 'stub text')])),
+    ('fill_form keystrokes', lambda driver: driver.fill_form('#form', [('#name', 'stub'), ('#notes', 'stub text')],
+                                                             keystrokes=True)),
+    ('send_keys', lambda driver: driver.send_keys('text')),
+    ('press_button', lambda driver: driver.press_button('enter')),
+    ('scroll_to_bottom', lambda driver: driver.scroll_to_bottom()),
+    ('scroll_to_element', lambda driver: driver.scroll_to_element('#element')),
+    ('scroll_to', lambda driver: driver.scroll_to(0, 100)),
+    ('move_to_element', lambda driver: driver.move_to_element('#element')),
+    ('pause', lambda driver: driver.pause(0)),
+    ('wait_for_element_condition', lambda driver: driver.wait_for_element_condition('#element', 100, None,
+                                                                                    'be visible')),
+    ('select_option', lambda driver: driver.select_option('#select', 'index', 0)),
+    ('switch_to_window', lambda driver: driver.switch_to_window('window-0')),
+    ('has_alert', lambda driver: driver.has_alert),
+    ('primary_handle', lambda driver: driver.primary_handle),
+    ('secondary_handles', lambda driver: driver.secondary_handles),
+    ('last_opened_handle', lambda driver: driver.last_opened_handle),
+    ('screen_size', lambda driver: driver.screen_size),
+    ('cookies', lambda driver: driver.cookies),
+]
+
+#: operations run against a <select> element
+SELECT_OPERATIONS = ('select_option', 'When I select the 1st option for element "#select"',
+                     'When I select the option with the text "stub" for element "#select"')
+
+STEPS = [
+    'When I pause for 0ms',
+    'When I click on the element "#element"',
+    'When I doubleclick on the element "#element"',
+    'When I click on the link "a link"',
+    'When I click on the button "#button"',
+    'When I set "text" to the inputfield "#input"',
+    'When I add "text" to the inputfield "#input"',
+    'When I quickly set "text" to the inputfield "#input"',
+    'When I quickly add "text" to the inputfield "#input"',
+    'When I fill in the form "#form" with:',
+    'When I fill in the form "#form" with keystrokes:',
+    'When I clear the inputfield "#input"',
+    'When I drag element "#source" to element "#target"',
+    'When I submit the form "#form"',
+    'When I set a cookie "name" with the content "value"',
+    'When I delete the cookie "name"',
+    'When I press "enter"',
+    'When I scroll to element "#element"',
+    'When I select the 1st option for element "#select"',
+    'When I move to element "#element" with an offset of 1,2',
+    'When I move to element "#element"',
+    'When I close the last opened window',
+    'When I focus the last opened tab',
+    'When I select the option with the text "stub" for element "#select"',
+    'When I accept the alertbox',
+    'When I dismiss the confirmbox',
+    'When I enter "text" into the prompt',
+    'Given I have closed all but the first window',
+    'Given I open the url "http://localhost:8000/"',
+    'Given I open the site "/page.html"',
+    'Given I open the url "http://localhost:8000/" and wait for "selector:#element"',
+    'Given I open the site "/page.html" and wait for "selector:#element"',
+    'Given the base url is "http://localhost:8000"',
+    'Given I pause for 0ms',
+    'Given I have a screen that is 800 by 600 pixels',
+    'Given I have a screen that is 800 pixels broad',
+    'Then I expect that element "#element" is visible',
+    'Then I expect that element "#element" becomes visible',
+    'Then I expect that the title is "Stub page"',
+    'Then I expect that element "#element" is within the viewport',
+    'Then I expect that element "#element" is enabled',
+    'Then I expect that element "#element" is selected',
+    'Then I expect that checkbox "#element" is checked',
+    'Given there is an element "#element" on the page',
+    'Then I expect that element "#element" does exist',
+    'Then I expect that element "#element" contains the same text as element "#other"',
+    'Then I expect that element "#element" matches the text "stub text"',
+    'Then I expect that element "#element" contains the text "stub"',
+    'Then I expect that element "#element" contains any text',
+    'Then I expect that element "#element" is not empty',
+    'Then I expect that the url is "http://localhost:8000/"',
+    'Then I expect the url to contain "localhost"',
+    'Then I expect that the attribute "class" from element "#element" is "stub"',
+    'Then I expect that cookie "name" contains "value"',
+    'Given the cookie "name" does exist',
+    'Then I expect that cookie "name" exists',
+    'Then I expect that element "#element" is 100px broad',
+    'Then I expect that element "#element" is positioned at 10px on the x axis',
+    'Then I expect that a alertbox is not opened',
+    'Then I expect that the path is "/"',
+    'Then I expect that element "#element" has the class "stub"',
+    'Then I expect a new window has not been opened',
+    'Then I expect the url "http://localhost:8000/" is opened in a new tab',
+    'Then I expect that element "#element" is focused',
+    'Then I expect that a alertbox contains the text "stub"',
+    'Then I wait on element "#element" for 100ms to be visible',
+    'Then I expect the screen is 1024 by 768 pixels',
+]
+
+
+def find_step(text):
+    """
+    Match a step text like behave does, e.g. 'When I click on the element "#element"'.
+
+    :return: the step function and its arguments
+    """
+    keyword, step_text = text.split(' ', 1)
+    step_type = {'given': 'given', 'when': 'when', 'then': 'then'}[keyword.lower()]
+    for matcher in registry.steps[step_type] + registry.steps['step']:
+        match = matcher.match(step_text)
+        if match is not None:
+            args = [argument.value for argument in match.arguments if argument.name is None]
+            kwargs = dict((argument.name, argument.value) for argument in match.arguments
+                          if argument.name is not None)
+            return match.func, args, kwargs
+    raise LookupError('No step matches "{}"'.format(text))
+
+
+def step_operation(text):
+    func, args, kwargs = find_step(text)
+    return lambda driver: func(Context(driver), *args, **kwargs)
+
+
+def missing_methods():
+    """
+    Public BehaveDriverMixin methods and properties not benchmarked.
+    """
+    benchmarked = set(name.split(' ')[0] for name, _ in METHODS)
+    public = set(name for name in vars(BehaveDriverMixin) if not name.startswith('_'))
+    return sorted(public - benchmarked - set(('get', 'back', 'forward', 'refresh', 'close', 'execute', 'switch_to',
+                                               'alert', 'is_color', 'element_cache', 'roundtrips', 'quit', 'polling',
+                                               'ready', 'ready_timeout', 'smart_pause', 'pauses', 'waits', 'blocker',
+                                               'auto_wait', 'fast_input_threshold')))
+
+
+def missing_steps():
+    """
+    Step functions of behave_webdriver.steps without a sample step text.
+    """
+    covered = set(find_step(text)[0] for text in STEPS)
+    defined = set(matcher.func for matchers in registry.steps.values() for matcher in matchers
+                  if matcher.func.__module__.startswith('behave_webdriver.steps'))
+    return sorted('{}.{}'.format(func.__module__, func.__name__) for func in defined - covered)
+
+
+def measure(stub, driver, name, operation, iterations):
+    stub.state.tag_name = 'select' if name in SELECT_OPERATIONS else 'div'
+    outcome = 'ok'
+    roundtrips_before = driver.roundtrips.commands
+    started = time.time()
+    for _ in range(iterations):
+        try:
+            operation(driver)
+        except Exception as e:
+            outcome = type(e).__name__  # the stub does not answer like a real page would, we time it regardless
+    seconds = time.time() - started
+    return {'seconds': seconds / iterations,
+            'roundtrips': (driver.roundtrips.commands - roundtrips_before) / float(iterations),
+            'outcome': outcome}
+
+
+def run(latency, iterations, driver_kwargs):
+    results = {}
+    with StubWebDriverServer(latency=latency, script_handler=script_handler) as stub:
+        driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, **driver_kwargs)
+        try:
+            operations = METHODS + [(text, step_operation(text)) for text in STEPS]
+            for name, operation in operations:
+                results[name] = measure(stub, driver, name, operation, iterations)
+        finally:
+            driver.quit()
+    return results
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python tests/benchmarks/step_latency.py',
+                                     description='Measure every driver method and step against a stub WebDriver.')
+    parser.add_argument('--latency', type=float, default=0.002,
+                        help='seconds added to every WebDriver command (default: 0.002)')
+    parser.add_argument('--iterations', type=int, default=5, help='runs of every operation (default: 5)')
+    parser.add_argument('--output', default=None, help='save the results as JSON to this file')
+    parser.add_argument('--driver-kwarg', action='append', default=[], metavar='NAME=VALUE',
+                        help='driver keyword argument, the value is parsed as JSON when possible, '
+                             'e.g. element_cache=true')
+    return parser.parse_args(argv)
+
+
+def _driver_kwargs(pairs):
+    kwargs = {}
+    for pair in pairs:
+        name, _, value = pair.partition('=')
+        try:
+            kwargs[name] = json.loads(value)
+        except ValueError:
+            kwargs[name] = value
+    return kwargs
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    for name in missing_methods():
+        print('warning: BehaveDriverMixin.{} is not benchmarked'.format(name), file=sys.stderr)
+    for name in missing_steps():
+        print('warning: step {} is not benchmarked'.format(name), file=sys.stderr)
+    driver_kwargs = _driver_kwargs(args.driver_kwarg)
+    results = run(args.latency, args.iterations, driver_kwargs)
+    print('{:>10} {:>10}  {}'.format('ms/call', 'commands', 'operation'))
+    for name in sorted(results, key=lambda name: -results[name]['seconds']):
+        result = results[name]
+        outcome = '' if result['outcome'] == 'ok' else '  ({})'.format(result['outcome'])
+        print('{:>10.2f} {:>10.1f}  {}{}'.format(result['seconds'] * 1000, result['roundtrips'], name, outcome))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'latency': args.latency,
+                       'iterations': args.iterations,
+                       'driver_kwargs': driver_kwargs,
+                       'python': platform.python_version(),
+                       'operations': results}, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
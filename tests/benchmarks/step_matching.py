@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""measure the cost of matching step texts to the step definitions of the library
+
+Every step of the feature files (tests/features by default) is matched by behave's step registry, once with the
+library's indexed step matchers (behave_webdriver.matchers) and once with the same patterns registered with behave's
+plain 'parse' and 're' matchers. Indexed matching is measured cold (first time a step text is seen) and warm
+(memoized step texts, as for the repeated steps of a large suite).
+
+Usage: python tests/benchmarks/step_matching.py [--iterations N] [FEATURES_DIR]
+"""
+from __future__ import print_function
+
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import namedtuple
+from importlib import import_module
+
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+
+from behave import matchers
+from behave.parser import parse_file
+from behave.step_registry import StepRegistry, registry
+from behave_webdriver.matchers import IndexedParseMatcher, step_index
+
+import_module('behave_webdriver.steps')  # registers the steps
+
+Step = namedtuple('Step', ('step_type', 'name'))
+
+
+def feature_steps(features_dir):
+    steps = []
+    for path in sorted(glob.glob(os.path.join(features_dir, '*.feature'))):
+        feature = parse_file(path)
+        for scenario in feature.walk_scenarios():
+            for step in scenario.all_steps:
+                steps.append(Step(step.step_type, step.name))
+    return steps
+
+
+def plain_registry():
+    """
+    The library's step definitions, registered with behave's own matchers.
+    """
+    plain = StepRegistry()
+    for step_type, definitions in registry.steps.items():
+        for matcher in definitions:
+            pattern = matcher.pattern
+            if isinstance(matcher, IndexedParseMatcher):
+                matchers.use_step_matcher('parse')
+            else:
+                matchers.use_step_matcher('re')
+                if pattern.startswith('^') and pattern.endswith('$'):
+                    pattern = pattern[1:-1]  # anchored by the matcher itself
+            plain.add_step_definition(step_type, pattern, matcher.func)
+    matchers.use_step_matcher('parse')
+    return plain
+
+
+def measure(step_registry, steps, iterations, before_each=None):
+    """
+    :return: the mean seconds to match every step
+    """
+    total = 0.0
+    for _ in range(iterations):
+        if before_each is not None:
+            before_each()
+        started = time.time()
+        for step in steps:
+            step_registry.find_match(step)
+        total += time.time() - started
+    return total / iterations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure the cost of matching step texts to step definitions')
+    parser.add_argument('features_dir', nargs='?', default=os.path.join(root_dir, 'tests', 'features'))
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    steps = feature_steps(args.features_dir)
+    plain = plain_registry()
+    for step in steps:
+        indexed_match, plain_match = registry.find_match(step), plain.find_match(step)
+        if getattr(indexed_match, 'func', None) is not getattr(plain_match, 'func', None):
+            print('warning: "{}" is matched differently'.format(step.name), file=sys.stderr)
+    candidates = sum(len(step_index.candidates(step.name)) for step in steps) / float(len(steps) or 1)
+    before = measure(plain, steps, args.iterations)
+    cold = measure(registry, steps, args.iterations, before_each=step_index.clear_memo)
+    warm = measure(registry, steps, args.iterations)
+    distinct = len(set(step.name for step in steps))
+    print('{} steps ({} distinct), {} step definitions, {:.1f} candidates per step'.format(
+        len(steps), distinct, step_index.stats()['patterns'], candidates))
+    print('{:>10} {:>10}  {}'.format('us/step', 'speedup', 'matchers'))
+    for label, seconds in (('plain parse/re', before), ('indexed, cold', cold), ('indexed, memoized', warm)):
+        print('{:>10.2f} {:>9.1f}x  {}'.format(seconds / len(steps) * 1e6, before / seconds if seconds else 0, label))
+
+
+if __name__ == '__main__':
+    main()
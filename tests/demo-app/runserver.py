@@ -1,29 +1,27 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """launch small http server
+
+Serves the files of the current directory with behave_webdriver's threaded, caching site server.
+Usage: python runserver.py [PORT]
 """
 
+import os
 import sys
 
-try:
-    from SimpleHTTPServer import SimpleHTTPRequestHandler
-except ImportError:
-    from http.server import SimpleHTTPRequestHandler
-
-try:
-    from SocketServer import TCPServer as HTTPServer
-except ImportError:
-    from http.server import HTTPServer
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..')))
 
-# simple web server
-# serves files relative to the current directory.
+from behave_webdriver.server import SiteServer
 
 server_port = 8000
 try:
     server_port = int(sys.argv[1])
-except:
+except (IndexError, ValueError):
     pass
 
-httpd = HTTPServer(("", server_port), SimpleHTTPRequestHandler)
+server = SiteServer('.', host='', port=server_port)
 print("serving at port {0}".format(server_port))
-httpd.serve_forever()
\ No newline at end of file
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    pass
@@ -23,3 +23,22 @@ Feature: Test input fields on a page
         And   I expect that element "#testInput" contains the text "test"
         When  I clear the inputfield "#testInput"
         Then  I expect that element "#testInput" not contains any text
+
+    Scenario: Fill in several fields at once
+        When  I fill in the form "body" with:
+            | field                   | value |
+            | #testInput              | test  |
+            | #waitForSelectedElement | 2     |
+        Then  I expect that element "#testInput" contains the text "test"
+        And   I expect that element "#waitForSelectedElement option:nth-child(2)" is selected
+
+    Scenario: Fill in a field with keystrokes
+        When  I fill in the form "body" with keystrokes:
+            | field      | value |
+            | #testInput | test  |
+        Then  I expect that element "#testInput" contains the text "test"
+
+    Scenario: Set and add content to a input field in one operation
+        When  I quickly set "test" to the inputfield "#testInput"
+        And   I quickly add " more tests" to the inputfield "#testInput"
+        Then  I expect that element "#testInput" contains the text "test more tests"
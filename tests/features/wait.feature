@@ -16,6 +16,12 @@ Feature: Test waiting for actions
         When  I click on the button "#waitForCheckedBtn"
         Then  I wait on element "#waitForCheckedElement" for 1000ms to be checked
 
+    # browsers that run the wait in the page do not poll, see test_browser_wait.py for the polling itself
+    Scenario: Test if element becomes checked with fast-start polling
+        Given the checkbox "#waitForCheckedElement" is not checked
+        When  I click on the button "#waitForCheckedBtn"
+        Then  I wait on element "#waitForCheckedElement" for 1000ms to be checked with fast-start polling
+
     Scenario: Test if element becomes enabled
         Given the element "#waitForEnabledElement" is not enabled
         When  I click on the button "#waitForEnabledBtn"
@@ -0,0 +1,163 @@
+import pytest
+import sys
+import os
+import json
+import threading
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, present_dir)
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from urllib.request import ProxyHandler, build_opener
+    from urllib.error import HTTPError
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from urllib2 import ProxyHandler, build_opener, HTTPError
+import mock
+from selenium.webdriver.remote.webdriver import WebDriver
+from behave_webdriver import blocking
+from behave_webdriver.blocking import Blocklist, BlockingProxy, CdpBlocker
+from behave_webdriver.driver import Remote
+from webdriver_stub import StubWebDriverServer
+
+
+class _Site(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = 'served {}'.format(self.path).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def site():
+    server = HTTPServer(('127.0.0.1', 0), _Site)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('url, blocked', [
+    ('http://example.com/logo.PNG', True),
+    ('http://example.com/logo.png?v=2', True),
+    ('http://example.com/font.woff2', True),
+    ('https://www.google-analytics.com/analytics.js', True),
+    ('http://example.com/app.js', False),
+    ('http://example.com/png', False),
+    ('http://cdn.example.com/ads/banner.html', True),
+])
+def test_blocklist(url, blocked):
+    blocklist = Blocklist(['images', 'fonts', 'analytics', '*cdn.example.com/ads/*'])
+    assert blocklist.matches(url) is blocked
+
+
+def test_blocklist_from_string():
+    assert Blocklist('fonts, *.css').patterns[-1] == '*.css'
+    assert Blocklist(u'images').patterns == Blocklist(['images']).patterns
+    assert not Blocklist([])
+
+
+def test_proxy(site):
+    proxy = BlockingProxy(Blocklist(['images'])).start()
+    opener = build_opener(ProxyHandler({'http': 'http://' + proxy.address}))
+    try:
+        assert opener.open(site + '/page.html').read() == b'served /page.html'
+        with pytest.raises(HTTPError) as excinfo:
+            opener.open(site + '/logo.png')
+        assert excinfo.value.code == 403
+        assert proxy.blocked == 1
+        assert proxy.urls == [site + '/logo.png']
+    finally:
+        proxy.close()
+
+
+def test_cdp_blocker():
+    driver = mock.Mock()
+    driver.get_log.return_value = [
+        {'message': json.dumps({'message': {'method': 'Network.requestWillBeSent',
+                                            'params': {'requestId': '1', 'request': {'url': 'http://x/a.png'}}}})},
+        {'message': json.dumps({'message': {'method': 'Network.loadingFailed',
+                                            'params': {'requestId': '1', 'blockedReason': 'inspector'}}})},
+        {'message': json.dumps({'message': {'method': 'Network.loadingFailed',
+                                            'params': {'requestId': '2', 'errorText': 'net::ERR_FAILED'}}})},
+    ]
+    blocker = CdpBlocker(Blocklist(['*.png']))
+    blocker.attach(driver)
+    driver.execute_cdp_cmd.assert_called_with('Network.setBlockedURLs', {'urls': ['*.png']})
+    assert blocker.blocked == 1
+    assert blocker.urls == ['http://x/a.png']
+
+
+def test_cdp_blocker_events_in_separate_batches():
+    driver = mock.Mock()
+    driver.get_log.side_effect = [
+        [{'message': json.dumps({'message': {'method': 'Network.requestWillBeSent',
+                                             'params': {'requestId': '1', 'request': {'url': 'http://x/a.png'}}}})}],
+        [{'message': json.dumps({'message': {'method': 'Network.loadingFailed',
+                                             'params': {'requestId': '1', 'blockedReason': 'inspector'}}})}],
+    ]
+    blocker = CdpBlocker(Blocklist(['*.png']))
+    blocker.attach(driver)
+    assert blocker.blocked == 0
+    assert blocker.blocked == 1
+    assert blocker.urls == ['http://x/a.png']
+    assert blocker._requested == {}
+    blocker.close()
+
+
+def test_driver_without_cdp_uses_proxy():
+    with StubWebDriverServer() as stub:
+        with mock.patch.object(WebDriver, 'start_session', autospec=True,
+                               side_effect=WebDriver.start_session) as start_session:
+            driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'},
+                            block=['images'])
+        assert isinstance(driver.blocker, BlockingProxy)
+        capabilities = start_session.call_args[0][1]
+        assert capabilities['proxy']['httpProxy'] == driver.blocker.address
+        driver.quit()
+        assert driver.blocker._server is None
+
+
+def test_remote_browser_needs_a_reachable_proxy():
+    with pytest.raises(ValueError) as excinfo:
+        Remote(command_executor='http://grid.example.com:4444/wd/hub', desired_capabilities={'browserName': 'stub'},
+               block=['images'])
+    assert 'block_proxy_host' in str(excinfo.value)
+
+
+def test_proxy_host():
+    proxy = BlockingProxy(Blocklist(['images']), host='0.0.0.0', advertised_host='10.0.0.12').start()
+    try:
+        assert proxy.address == '10.0.0.12:{}'.format(proxy._server.server_address[1])
+        assert proxy.capabilities['proxy']['httpProxy'] == proxy.address
+    finally:
+        proxy.close()
+
+
+def test_remote_driver_with_proxy_host():
+    with StubWebDriverServer() as stub:
+        with mock.patch.object(WebDriver, 'start_session', autospec=True,
+                               side_effect=WebDriver.start_session) as start_session:
+            driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'},
+                            block=['images'], block_proxy_host='10.0.0.12')
+        assert start_session.call_args[0][1]['proxy']['httpProxy'].startswith('10.0.0.12:')
+        assert driver.blocker.host == '0.0.0.0'
+        driver.quit()
+
+
+def test_scenario_counts():
+    blocker = mock.Mock(blocked=3)
+    context = mock.Mock(behave_driver=mock.Mock(blocker=blocker))
+    scenario = mock.Mock()
+    blocking.before_scenario(context, scenario)
+    blocker.blocked = 5
+    blocking.after_scenario(context, scenario)
+    assert scenario.blocked_requests == 2
@@ -0,0 +1,361 @@
+import pytest
+import mock
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver.driver import BehaveDriverMixin
+from behave_webdriver.waits import (BrowserWait, PollingWait, FixedPolling, BackoffPolling, FastStartPolling,
+                                    polling_strategy)
+from behave_webdriver.instrumentation import WaitLog
+from behave_webdriver import scripts
+from behave_webdriver.steps.expectations import wait_for_element_condition
+from behave_webdriver.conditions import (element_is_present,
+                                         element_is_visible,
+                                         element_is_enabled,
+                                         element_contains_text,
+                                         element_contains_value,
+                                         element_is_selected,
+                                         element_is_actionable,
+                                         all_of,
+                                         any_of,
+                                         not_)
+from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException, TimeoutException,
+                                        WebDriverException)
+from selenium.webdriver.common.by import By
+
+
+def _init_async_driver(outcome=None, side_effect=None):
+    class DriverTest(BehaveDriverMixin):
+        pass
+    DriverTest.execute_async_script = mock.MagicMock(name='execute_async_script',
+                                                     return_value=outcome,
+                                                     side_effect=side_effect)
+    DriverTest.set_script_timeout = mock.MagicMock(name='set_script_timeout')
+    return DriverTest()
+
+
+@pytest.mark.parametrize('condition, predicate', [
+    (element_is_present, 'present'),
+    (element_is_visible, 'visible'),
+    (element_is_enabled, 'enabled'),
+    (element_is_selected, 'selected'),
+    (element_contains_text, 'text'),
+    (element_contains_value, 'value'),
+])
+def test_conditions_describe_predicates(condition, predicate):
+    spec = condition((By.CSS_SELECTOR, '#elem'), negative=True).js_spec()
+    assert spec == {'predicate': predicate, 'negative': True, 'text': ''}
+
+
+def test_supports():
+    wait = BrowserWait(_init_async_driver(), 1)
+    assert wait.supports(element_is_visible((By.CSS_SELECTOR, '#elem')))
+    assert wait.supports(element_is_visible((By.XPATH, '//div')))
+    assert not wait.supports(element_is_visible((By.ID, 'elem')))
+    assert not wait.supports(element_is_visible((By.XPATH, '(//div)[1]')))
+    assert not BrowserWait(object(), 1).supports(element_is_visible((By.CSS_SELECTOR, '#elem')))
+
+
+def test_wait_resolves_in_one_round_trip():
+    mock_el = mock.MagicMock(name='Html element')
+    driver = _init_async_driver({'ok': True, 'element': mock_el})
+    result = driver.wait_for_element_condition('#elem', 2000, None, 'be visible')
+    assert result is mock_el
+    driver.execute_async_script.assert_called_once_with(scripts.WAIT_FOR_ELEMENT,
+                                                        '#elem',
+                                                        {'predicate': 'visible', 'negative': False, 'text': ''},
+                                                        2000)
+    driver.set_script_timeout.assert_called_once_with(2 + BrowserWait.script_timeout_margin)
+
+
+def test_script_timeout_is_only_raised_when_needed():
+    driver = _init_async_driver({'ok': True, 'element': None})
+    driver.wait_for_element_condition('#elem', 2000, ' not', 'be enabled')
+    driver.wait_for_element_condition('#elem', 1000, None, 'exist')
+    assert driver.set_script_timeout.call_count == 1
+
+
+def test_negative_wait_returns_true():
+    driver = _init_async_driver({'ok': True, 'element': None})
+    assert driver.wait_for_element_condition('#elem', 100, ' not', 'exist') is True
+    assert driver.execute_async_script.call_args[0][2]['negative'] is True
+
+
+def test_wait_timeout_returns_none():
+    driver = _init_async_driver({'ok': False})
+    assert driver.wait_for_element_condition('#elem', 100, None, 'contain a text') is None
+
+
+def test_falls_back_to_webdriverwait():
+    driver = _init_async_driver(side_effect=WebDriverException('javascript error'))
+    with mock.patch('behave_webdriver.driver.PollingWait') as mock_PollingWait:
+        mock_PollingWait.return_value.until.return_value = True
+        assert driver.wait_for_element_condition('#elem', 1000, None, 'be checked') is True
+        assert mock_PollingWait.called
+
+
+LOCATOR = (By.CSS_SELECTOR, '#elem')
+
+
+def test_composite_describes_predicates():
+    condition = all_of(element_is_visible(LOCATOR),
+                       any_of(element_contains_text(LOCATOR, text_='Go'), element_is_selected(LOCATOR, negative=True)))
+    assert condition.locator == LOCATOR
+    assert condition.js_spec() == {
+        'predicate': 'all', 'negative': False, 'text': '', 'conditions': [
+            {'predicate': 'visible', 'negative': False, 'text': ''},
+            {'predicate': 'any', 'negative': False, 'text': '', 'conditions': [
+                {'predicate': 'text', 'negative': False, 'text': 'Go'},
+                {'predicate': 'selected', 'negative': True, 'text': ''}]}]}
+    assert not_(condition).js_spec()['negative'] is True
+
+
+def test_composite_requires_one_locator():
+    with pytest.raises(ValueError):
+        all_of(element_is_visible(LOCATOR), element_is_enabled((By.CSS_SELECTOR, '#other')))
+    with pytest.raises(ValueError):
+        any_of()
+
+
+def _polling_driver(element):
+    driver = mock.MagicMock(name='driver')
+    driver.find_elements.return_value = [element] if element else []
+    return driver
+
+
+def test_composite_locates_once_per_poll():
+    element = mock.MagicMock(name='Html element', text='Go')
+    element.is_displayed.return_value = True
+    element.is_enabled.return_value = True
+    driver = _polling_driver(element)
+    condition = all_of(element_is_visible(LOCATOR), element_is_enabled(LOCATOR), element_contains_text(LOCATOR))
+    assert condition(driver) is element
+    driver.find_elements.assert_called_once_with(*LOCATOR)
+    assert not driver.find_element.called
+
+
+def test_composite_short_circuits():
+    element = mock.MagicMock(name='Html element')
+    element.is_displayed.return_value = False
+    condition = all_of(element_is_visible(LOCATOR), element_is_enabled(LOCATOR))
+    assert condition(_polling_driver(element)) is False
+    assert not element.is_enabled.called
+    assert any_of(element_is_visible(LOCATOR), element_is_enabled(LOCATOR))(_polling_driver(element)) is element
+
+
+def test_composite_negation():
+    element = mock.MagicMock(name='Html element')
+    element.is_displayed.return_value = True
+    element.is_enabled.return_value = False
+    condition = all_of(element_is_visible(LOCATOR), element_is_enabled(LOCATOR), negative=True)
+    assert condition(_polling_driver(element)) is True
+    assert not_(element_is_enabled(LOCATOR))(_polling_driver(element)) is True
+    assert not_(element_is_visible(LOCATOR))(_polling_driver(element)) is False
+
+
+def test_composite_missing_element():
+    condition = all_of(element_is_present(LOCATOR, negative=True), element_is_visible(LOCATOR, negative=True))
+    assert condition(_polling_driver(None)) is False
+    assert any_of(element_is_present(LOCATOR, negative=True), element_is_visible(LOCATOR))(_polling_driver(None))
+
+
+def test_composite_stale_element():
+    element = mock.MagicMock(name='Html element')
+    element.is_displayed.side_effect = StaleElementReferenceException()
+    assert all_of(element_is_visible(LOCATOR))(_polling_driver(element)) is False
+    assert all_of(element_is_visible(LOCATOR), negative=True)(_polling_driver(element)) is False
+
+
+def test_wait_for_combined_conditions():
+    driver = _init_async_driver({'ok': True, 'element': None})
+    driver.wait_for_element_condition('#elem', 1000, ' not', 'be visible or contain a text')
+    spec = driver.execute_async_script.call_args[0][2]
+    assert spec['predicate'] == 'any'
+    assert spec['negative'] is True
+    assert [condition['predicate'] for condition in spec['conditions']] == ['visible', 'text']
+    with pytest.raises(ValueError):
+        driver.wait_for_element_condition('#elem', 1000, None, 'be visible and be enabled or exist')
+
+
+def test_wait_for_callable_condition():
+    driver = _init_async_driver({'ok': True, 'element': None})
+
+    def visible_and_enabled(locator, negative):
+        return all_of(element_is_visible(locator), element_is_enabled(locator), negative=negative)
+
+    assert driver.wait_for_element_condition('#elem', 1000, None, visible_and_enabled) is True
+    assert driver.execute_async_script.call_args[0][2]['predicate'] == 'all'
+    driver.wait_for_element_condition('#elem', 1000, None, element_is_selected)
+    assert driver.execute_async_script.call_args[0][2]['predicate'] == 'selected'
+
+
+def test_condition_reuses_located_element():
+    element = mock.MagicMock(name='Html element')
+    element.is_enabled.side_effect = [False, False, True]
+    driver = mock.MagicMock(name='driver')
+    driver.find_element.return_value = element
+    condition = element_is_enabled(LOCATOR)
+    assert [condition(driver) for _ in range(3)] == [False, False, True]
+    assert (condition.lookups, condition.polls) == (1, 3)
+    driver.find_element.assert_called_once_with(*LOCATOR)
+
+
+def test_condition_relocates_stale_element():
+    stale = mock.MagicMock(name='stale element')
+    stale.is_displayed.side_effect = StaleElementReferenceException()
+    fresh = mock.MagicMock(name='fresh element')
+    fresh.is_displayed.return_value = True
+    driver = mock.MagicMock(name='driver')
+    driver.find_element.side_effect = [stale, fresh]
+    condition = element_is_visible(LOCATOR)
+    assert condition(driver) is False
+    assert condition(driver) is fresh
+    assert (condition.lookups, condition.polls) == (2, 2)
+
+
+def test_condition_relocates_missing_element():
+    element = mock.MagicMock(name='Html element', text='Welcome back')
+    driver = mock.MagicMock(name='driver')
+    driver.find_element.side_effect = [NoSuchElementException(), element]
+    condition = element_contains_text(LOCATOR, text_='Welcome')
+    with pytest.raises(NoSuchElementException):
+        condition(driver)  # ignored by WebDriverWait, which polls again
+    assert condition(driver) is True
+    assert condition(driver) is True
+    assert (condition.lookups, condition.polls) == (2, 3)
+
+
+def test_presence_is_located_on_every_poll():
+    driver = mock.MagicMock(name='driver')
+    driver.find_element.side_effect = [mock.MagicMock(name='Html element'), NoSuchElementException()]
+    condition = element_is_present(LOCATOR, negative=True)
+    assert condition(driver) is False
+    assert condition(driver) is True
+    assert condition.lookups == 2
+
+
+def test_cached_conditions_honor_negation_and_text():
+    element = mock.MagicMock(name='Html element', text='')
+    element.get_attribute.return_value = 'jane'
+    driver = mock.MagicMock(name='driver')
+    driver.find_element.return_value = element
+    assert element_contains_text(LOCATOR, negative=True)(driver) is True
+    assert element_contains_value(LOCATOR, text_='jan')(driver) is True
+    assert element_contains_value(LOCATOR, text_='joe')(driver) is False
+    element.is_selected.return_value = True
+    assert element_is_selected(LOCATOR, negative=True)(driver) is False
+
+
+def _first(intervals, count):
+    return [next(intervals) for _ in range(count)]
+
+
+def test_polling_strategies():
+    assert _first(FixedPolling().intervals(), 3) == [0.5, 0.5, 0.5]
+    assert _first(BackoffPolling(0.1, 2, 0.5).intervals(), 5) == [0.1, 0.2, 0.4, 0.5, 0.5]
+    assert _first(FastStartPolling().intervals(), 5) == [0.01, 0.025, 0.05, 0.25, 0.25]
+
+
+def test_polling_strategy():
+    assert isinstance(polling_strategy(None), FixedPolling)
+    assert isinstance(polling_strategy('backoff'), BackoffPolling)
+    assert isinstance(polling_strategy('fast-start'), FastStartPolling)
+    assert polling_strategy(0.1).interval == 0.1
+    strategy = BackoffPolling(cap=2)
+    assert polling_strategy(strategy) is strategy
+    assert isinstance(polling_strategy(u'backoff'), BackoffPolling)
+    with pytest.raises(ValueError):
+        polling_strategy('eventually')
+
+
+def test_polling_wait_records_polls():
+    log = WaitLog()
+    condition = mock.MagicMock(name='condition', side_effect=[False, NoSuchElementException(), 'done'])
+    with mock.patch('behave_webdriver.waits.time.sleep') as sleep:
+        assert PollingWait(mock.MagicMock(), 5, 'fast-start', log).until(condition) == 'done'
+    assert [call[0][0] for call in sleep.call_args_list] == [0.01, 0.025]
+    assert log.entries[0].polling == 'fast-start'
+    assert log.entries[0].polls == 3
+    assert log.polls == 3
+    assert log.timeouts == 0
+
+
+def test_polling_wait_records_timeouts():
+    log = WaitLog()
+    with pytest.raises(TimeoutException):
+        PollingWait(mock.MagicMock(), 0.05, 0.01, log).until(lambda driver: False)
+    assert log.timeouts == 1
+    assert log.entries[0].polls > 1
+    assert log.time_to_success == 0
+
+
+def test_driver_polling():
+    driver = _init_async_driver(side_effect=WebDriverException('javascript error'))
+    assert isinstance(driver.polling, FixedPolling)
+    assert isinstance(BehaveDriverMixin(polling='backoff').polling, BackoffPolling)
+    with mock.patch('behave_webdriver.driver.PollingWait') as mock_PollingWait:
+        driver.wait_for_element_condition('#elem', 1000, None, 'be checked', polling='backoff')
+        assert mock_PollingWait.call_args[0][2] == 'backoff'
+        driver.polling = polling_strategy('fast-start')
+        driver.wait_for_element_condition('#elem', 1000, None, 'be checked')
+        assert mock_PollingWait.call_args[0][2] is driver.polling
+
+
+def test_wait_step_polls_with_the_strategy():
+    driver = _init_async_driver(side_effect=WebDriverException('javascript error'))
+    element = mock.MagicMock(name='Html element')
+    element.is_selected.side_effect = [False, False, True]
+    driver.find_element = mock.MagicMock(name='find_element', return_value=element)
+    context = mock.MagicMock(behave_driver=driver)
+    with mock.patch('behave_webdriver.waits.time.sleep') as sleep:
+        wait_for_element_condition(context, u'#elem', u'1000', None, u'be checked', u'fast-start')
+    assert [call[0][0] for call in sleep.call_args_list] == [0.01, 0.025]
+    assert driver.waits.entries[-1].polling == 'fast-start'
+
+
+def test_auto_wait_acts_on_actionable_element():
+    mock_el = mock.MagicMock(name='Html element')
+    driver = _init_async_driver({'ok': True, 'element': mock_el})
+    driver.auto_wait = True
+    driver.click_element('#elem')
+    mock_el.click.assert_called_once_with()
+    assert driver.execute_async_script.call_args[0][2]['predicate'] == 'actionable'
+    driver.set_input('#elem', 'jane')
+    mock_el.clear.assert_called_once_with()
+    mock_el.send_keys.assert_called_once_with('jane')
+
+
+def test_auto_wait_timeout_acts_anyway():
+    mock_el = mock.MagicMock(name='Html element')
+    driver = _init_async_driver({'ok': False})
+    driver.auto_wait = True
+    driver.default_wait = 0.1
+    with mock.patch.object(BehaveDriverMixin, 'get_element', return_value=mock_el) as get_element:
+        driver.clear_input('#elem')
+    get_element.assert_called_once_with('#elem')
+    mock_el.clear.assert_called_once_with()
+
+
+def test_no_auto_wait_by_default():
+    mock_el = mock.MagicMock(name='Html element')
+    driver = _init_async_driver()
+    with mock.patch.object(BehaveDriverMixin, 'get_element', return_value=mock_el):
+        driver.add_input('#elem', 'x')
+    assert not driver.execute_async_script.called
+    mock_el.send_keys.assert_called_once_with('x')
+
+
+def test_actionable_condition():
+    element = mock.MagicMock(name='Html element')
+    element.is_displayed.return_value = True
+    element.is_enabled.return_value = False
+    driver = _polling_driver(element)
+    driver.find_element.return_value = element
+    condition = element_is_actionable(LOCATOR)
+    assert condition.js_spec()['predicate'] == 'actionable'
+    assert condition(driver) is False
+    element.is_enabled.return_value = True
+    assert condition(driver) is element
+    assert condition.lookups == 1
@@ -48,33 +48,33 @@ def test_get_element_with_css_selector():
 
 def _init_wait_for_element_condition_mocks():
     with mock.patch('behave_webdriver.driver.element_is_present') as mock_element_is_present:
-        with mock.patch('behave_webdriver.driver.WebDriverWait') as mock_WebDriverWait:
+        with mock.patch('behave_webdriver.driver.PollingWait') as mock_PollingWait:
             mock_el = mock.MagicMock(name='Html element')
             mock_web_driver_wait = mock.MagicMock(name='web_driver_wait')
             mock_web_driver_wait.until.return_value = mock_el
-            mock_WebDriverWait.return_value = mock_web_driver_wait
+            mock_PollingWait.return_value = mock_web_driver_wait
             class DriverTest(BehaveDriverMixin):
                 pass
-            yield DriverTest, mock_el, mock_WebDriverWait, mock_web_driver_wait, mock_element_is_present
+            yield DriverTest, mock_el, mock_PollingWait, mock_web_driver_wait, mock_element_is_present
 
 
 def test_wait_for_element_condition_with_xpath_expression():
-    for DriverTest, mock_el, mock_WebDriverWait, mock_web_driver_wait, mock_element_is_present \
+    for DriverTest, mock_el, mock_PollingWait, mock_web_driver_wait, mock_element_is_present \
         in _init_wait_for_element_condition_mocks():
         driver_test = DriverTest()
         el = driver_test.wait_for_element_condition('/my_xpath/expression', None, None, None)
         assert el is mock_el
-        assert mock_WebDriverWait.called_with(driver_test, driver_test.default_wait)
+        assert mock_PollingWait.called_with(driver_test, driver_test.default_wait)
         assert mock_web_driver_wait.until.called
         assert mock_element_is_present.called_with((By.XPATH, '/my_xpath/expression'), False)
 
 
 def test_wait_for_element_condition_with_css_selector():
-    for DriverTest, mock_el, mock_WebDriverWait, mock_web_driver_wait, mock_element_is_present \
+    for DriverTest, mock_el, mock_PollingWait, mock_web_driver_wait, mock_element_is_present \
         in _init_wait_for_element_condition_mocks():
         driver_test = DriverTest()
         el = driver_test.wait_for_element_condition('div.specific-class[title="tooltip"]', None, None, None)
         assert el is mock_el
-        assert mock_WebDriverWait.called_with(driver_test, driver_test.default_wait)
+        assert mock_PollingWait.called_with(driver_test, driver_test.default_wait)
         assert mock_web_driver_wait.until.called
         assert mock_element_is_present.called_with((By.CSS_SELECTOR, '/my_xpath/expression'), False)
@@ -0,0 +1,115 @@
+import pytest
+import mock
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver.driver import BehaveDriverMixin
+from behave_webdriver.cache import ElementCache
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+class _BaseDriver(object):
+    def __init__(self, *args, **kwargs):
+        self._switch_to = mock.MagicMock(name='switch_to')
+        self.navigations = []
+
+    @property
+    def switch_to(self):
+        return self._switch_to
+
+    def get(self, url):
+        self.navigations.append(url)
+
+
+def _init_cached_driver():
+    class DriverTest(BehaveDriverMixin, _BaseDriver):
+        pass
+    mock_el = mock.MagicMock(name='Html element')
+    DriverTest.find_element_by_css_selector = mock.MagicMock(name='find_element_by_css_selector',
+                                                             return_value=mock_el)
+    return DriverTest(element_cache=True), mock_el
+
+
+def test_cache_disabled_by_default():
+    class DriverTest(BehaveDriverMixin, _BaseDriver):
+        pass
+    assert DriverTest().element_cache is None
+
+
+def test_consecutive_lookups_hit_cache():
+    driver, mock_el = _init_cached_driver()
+    assert driver.get_element('#elem') is mock_el
+    assert driver.element_visible('#elem')
+    driver.click_element('#elem')
+    assert driver.find_element_by_css_selector.call_count == 1
+    assert driver.element_cache.hits == 2
+    assert driver.element_cache.misses == 1
+
+
+def test_navigation_invalidates_cache():
+    driver, mock_el = _init_cached_driver()
+    driver.get_element('#elem')
+    driver.open_url('http://localhost:8000/')
+    driver.get_element('#elem')
+    assert driver.find_element_by_css_selector.call_count == 2
+    assert driver.navigations == ['http://localhost:8000/']
+
+
+def test_window_switch_invalidates_cache():
+    driver, mock_el = _init_cached_driver()
+    driver.get_element('#elem')
+    driver.switch_to_window('second')
+    driver._switch_to.window.assert_called_once_with('second')
+    driver.get_element('#elem')
+    assert driver.find_element_by_css_selector.call_count == 2
+    assert driver.element_cache.window == 'second'
+
+
+def test_frames_are_part_of_the_key():
+    driver, mock_el = _init_cached_driver()
+    driver.get_element('#elem')
+    driver.switch_to.frame('inner')
+    driver.get_element('#elem')
+    driver.switch_to.default_content()
+    driver.get_element('#elem')
+    assert driver.find_element_by_css_selector.call_count == 2
+    assert driver.element_cache.hits == 1
+
+
+def test_stale_element_is_relocated():
+    driver, stale_el = _init_cached_driver()
+    stale_el.is_displayed.side_effect = StaleElementReferenceException()
+    driver.get_element('#elem')
+    fresh_el = mock.MagicMock(name='Fresh element')
+    fresh_el.is_displayed.return_value = True
+    driver.find_element_by_css_selector.return_value = fresh_el
+    assert driver.element_visible('#elem') is True
+    assert driver.find_element_by_css_selector.call_count == 2
+    assert driver.element_cache.get('#elem') is fresh_el
+
+
+def test_stale_element_without_cache_raises():
+    class DriverTest(BehaveDriverMixin, _BaseDriver):
+        pass
+    mock_el = mock.MagicMock(name='Html element')
+    mock_el.is_displayed.side_effect = StaleElementReferenceException()
+    DriverTest.find_element_by_css_selector = mock.MagicMock(return_value=mock_el)
+    with pytest.raises(StaleElementReferenceException):
+        DriverTest().element_visible('#elem')
+
+
+def test_element_exists_does_not_trust_cache():
+    driver, mock_el = _init_cached_driver()
+    driver.get_element('#elem')
+    assert driver.element_exists('#elem')
+    assert driver.find_element_by_css_selector.call_count == 2
+
+
+def test_cache_stats():
+    cache = ElementCache()
+    cache.put('#a', 'element')
+    cache.get('#a')
+    cache.get('#b')
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'invalidations': 0, 'hit_ratio': 0.5}
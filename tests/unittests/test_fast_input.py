@@ -0,0 +1,149 @@
+import pytest
+import mock
+import json
+import subprocess
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from selenium.common.exceptions import InvalidElementStateException
+from behave_webdriver.driver import BehaveDriverMixin, FAST_INPUT_THRESHOLD
+from behave_webdriver import scripts
+
+
+def _init_driver(**kwargs):
+    class DriverTest(BehaveDriverMixin):
+        pass
+    DriverTest.execute_script = mock.MagicMock(name='execute_script', return_value='')
+    driver = DriverTest(**kwargs)
+    mock_el = mock.MagicMock(name='Html element')
+    driver.get_element = mock.MagicMock(name='get_element', return_value=mock_el)
+    return driver, mock_el
+
+
+def test_short_values_are_typed():
+    driver, mock_el = _init_driver()
+    driver.set_input('#elem', 'jane')
+    mock_el.clear.assert_called_once_with()
+    mock_el.send_keys.assert_called_once_with('jane')
+    assert not driver.execute_script.called
+
+
+def test_long_values_are_entered_at_once():
+    driver, mock_el = _init_driver()
+    value = 'x' * FAST_INPUT_THRESHOLD
+    driver.set_input('#elem', value)
+    driver.add_input('#elem', value)
+    assert driver.execute_script.call_args_list == [mock.call(scripts.SET_VALUE, mock_el, value, False),
+                                                    mock.call(scripts.SET_VALUE, mock_el, value, True)]
+    assert not mock_el.send_keys.called
+    assert not mock_el.clear.called
+
+
+@pytest.mark.parametrize('fast_input, fast', [
+    (True, True),
+    (False, False),
+    (3, True),
+])
+def test_fast_input_setting(fast_input, fast):
+    driver, mock_el = _init_driver(fast_input=fast_input)
+    driver.add_input('#elem', 'jane')
+    assert driver.execute_script.called is fast
+    assert mock_el.send_keys.called is not fast
+
+
+def test_fast_per_call():
+    driver, mock_el = _init_driver(fast_input=False)
+    driver.set_input('#elem', 'jane', fast=True)
+    driver.execute_script.assert_called_once_with(scripts.SET_VALUE, mock_el, 'jane', False)
+    driver, mock_el = _init_driver(fast_input=True)
+    driver.set_input('#elem', 'jane', fast=False)
+    mock_el.send_keys.assert_called_once_with('jane')
+
+
+def test_fast_input_error():
+    driver, mock_el = _init_driver(fast_input=True)
+    driver.execute_script.return_value = 'is not editable'
+    with pytest.raises(InvalidElementStateException):
+        driver.set_input('#elem', 'jane')
+
+
+def test_form_typing_enters_long_values_at_once():
+    driver, form = _init_driver(fast_input=3)
+    field = mock.MagicMock(name='textarea', tag_name='textarea')
+    field.get_attribute.return_value = None
+    form.find_element_by_css_selector.return_value = field
+    driver.fill_form('#form', [('#notes', 'a long note')], keystrokes=True)
+    driver.execute_script.assert_called_once_with(scripts.SET_VALUE, field, 'a long note', False)
+
+
+def test_elements_without_a_value_are_typed_into():
+    driver, mock_el = _init_driver(fast_input=True)
+    driver.execute_script.return_value = False  # e.g. a contenteditable editor
+    driver.set_input('#editor', 'jane')
+    mock_el.clear.assert_called_once_with()
+    mock_el.send_keys.assert_called_once_with('jane')
+    driver.add_input('#editor', ' doe')
+    mock_el.send_keys.assert_called_with(' doe')
+
+
+def test_form_typing_falls_back_to_keystrokes():
+    driver, form = _init_driver(fast_input=True)
+    field = mock.MagicMock(name='div', tag_name='div')
+    field.get_attribute.return_value = None
+    form.find_element_by_css_selector.return_value = field
+    driver.execute_script.return_value = False
+    driver.fill_form('#form', [('#editor', 'a long note')], keystrokes=True)
+    field.send_keys.assert_called_once_with('a long note')
+
+
+NODE_HARNESS = '''
+function HTMLInputElement() {}
+Object.defineProperty(HTMLInputElement.prototype, 'value', {
+    get: function () { return this._value; },
+    set: function (value) { this._value = value; }
+});
+function HTMLTextAreaElement() {}
+function Event(type) { this.type = type; }
+function KeyboardEvent(type) { this.type = type; }
+var elem = Object.create(HTMLInputElement.prototype);
+var spec = JSON.parse(process.argv[1]);
+Object.keys(spec.element).forEach(function (key) { elem[key] = spec.element[key]; });
+elem.events = [];
+elem.focus = function () {};
+elem.dispatchEvent = function (event) { this.events.push(event.type); };
+var result = (function () { %s }).apply(null, [elem].concat(spec.args));
+console.log(JSON.stringify({result: result, value: elem._value, events: elem.events}));
+'''
+
+
+def _run_set_value(element, *args):
+    spec = json.dumps({'element': element, 'args': list(args)})
+    output = subprocess.check_output(['node', '-e', NODE_HARNESS % scripts.SET_VALUE, spec])
+    return json.loads(output.decode('utf-8'))
+
+
+def _has_node():
+    try:
+        subprocess.check_output(['node', '--version'])
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+@pytest.mark.skipif('not _has_node()')
+def test_set_value_script_honors_maxlength():
+    field = {'tagName': 'INPUT', 'type': 'text', 'maxLength': 5, '_value': 'ab'}
+    outcome = _run_set_value(field, 'cdefgh', True)
+    assert outcome['result'] == ''
+    assert outcome['value'] == 'abcde'
+    assert outcome['events'] == ['keydown', 'input', 'change', 'keyup']
+    assert _run_set_value(dict(field, maxLength=-1), 'cdefgh', False)['value'] == 'cdefgh'
+
+
+@pytest.mark.skipif('not _has_node()')
+def test_set_value_script_declines_other_elements():
+    outcome = _run_set_value({'tagName': 'DIV', 'type': None, 'isContentEditable': True}, 'jane', False)
+    assert outcome['result'] is False
+    assert outcome['events'] == []
@@ -0,0 +1,91 @@
+import pytest
+import mock
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from selenium.common.exceptions import InvalidElementStateException, NoSuchElementException
+from behave_webdriver.driver import BehaveDriverMixin
+from behave_webdriver import scripts
+
+
+def _init_driver(outcome=None):
+    class DriverTest(BehaveDriverMixin):
+        pass
+    DriverTest.execute_script = mock.MagicMock(name='execute_script', return_value=outcome)
+    return DriverTest()
+
+
+def test_fill_form_in_one_script_call():
+    driver = _init_driver({'missing': [], 'errors': []})
+    driver.fill_form('#signup', [('email', 'jane@example.com'), ('#terms', 'yes')])
+    driver.execute_script.assert_called_once_with(scripts.FILL_FORM, '#signup',
+                                                  [['email', 'jane@example.com'], ['#terms', 'yes']])
+
+
+def test_fill_form_accepts_a_dictionary():
+    driver = _init_driver({'missing': [], 'errors': []})
+    driver.fill_form('#signup', {'email': 'jane@example.com'})
+    assert driver.execute_script.call_args[0][2] == [['email', 'jane@example.com']]
+
+
+def test_fill_form_missing_form():
+    with pytest.raises(NoSuchElementException):
+        _init_driver(None).fill_form('#signup', [('email', 'jane@example.com')])
+
+
+def test_fill_form_missing_fields():
+    driver = _init_driver({'missing': ['email'], 'errors': []})
+    with pytest.raises(NoSuchElementException) as excinfo:
+        driver.fill_form('#signup', [('email', 'jane@example.com')])
+    assert 'email' in str(excinfo.value)
+
+
+def test_fill_form_errors():
+    driver = _init_driver({'missing': [], 'errors': ['#country has no option "Atlantis"']})
+    with pytest.raises(InvalidElementStateException) as excinfo:
+        driver.fill_form('#signup', [('#country', 'Atlantis')])
+    assert 'Atlantis' in str(excinfo.value)
+
+
+def _field(tag_name='input', input_type='text', value='', selected=False):
+    elem = mock.MagicMock(name='{} {}'.format(tag_name, input_type), tag_name=tag_name)
+    elem.get_attribute.side_effect = {'type': input_type, 'value': value}.get
+    elem.is_selected.return_value = selected
+    return elem
+
+
+def test_fill_form_with_keystrokes():
+    email = _field()
+    terms = _field(input_type='checkbox', selected=True)
+    red = _field(input_type='radio', value='red')
+    blue = _field(input_type='radio', value='blue')
+    fields = {'#email': email, '#terms': terms}
+
+    def find_element_by_css_selector(selector):
+        if selector not in fields:
+            raise NoSuchElementException()
+        return fields[selector]
+    form = mock.MagicMock(name='form')
+    form.find_element_by_css_selector.side_effect = find_element_by_css_selector
+    form.find_elements_by_name.return_value = [red, blue]
+    driver = _init_driver()
+    with mock.patch.object(BehaveDriverMixin, 'get_element', return_value=form):
+        driver.fill_form('#signup', [('#email', 'jane'), ('#terms', 'no'), ('color', 'blue')], keystrokes=True)
+    email.clear.assert_called_once_with()
+    email.send_keys.assert_called_once_with('jane')
+    terms.click.assert_called_once_with()
+    assert not red.click.called
+    blue.click.assert_called_once_with()
+    assert not driver.execute_script.called
+
+
+def test_fill_form_with_keystrokes_missing_field():
+    form = mock.MagicMock(name='form')
+    form.find_element_by_css_selector.side_effect = NoSuchElementException()
+    form.find_elements_by_name.return_value = []
+    driver = _init_driver()
+    with mock.patch.object(BehaveDriverMixin, 'get_element', return_value=form):
+        with pytest.raises(NoSuchElementException):
+            driver.fill_form('#signup', [('email', 'jane')], keystrokes=True)
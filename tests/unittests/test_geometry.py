@@ -0,0 +1,72 @@
+import pytest
+import mock
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver.driver import BehaveDriverMixin
+from behave_webdriver.geometry import ElementGeometry
+from behave_webdriver import scripts
+from selenium.common.exceptions import NoSuchElementException
+
+
+def _geometry_result(**overrides):
+    result = {'x': 10.4, 'y': 20.6, 'width': 100, 'height': 50,
+              'scrollX': 0, 'scrollY': 0, 'viewportWidth': 800, 'viewportHeight': 600}
+    result.update(overrides)
+    return result
+
+
+def _init_geometry_mocks(result):
+    class DriverTest(BehaveDriverMixin):
+        pass
+    DriverTest.execute_script = mock.MagicMock(name='execute_script', return_value=result)
+    DriverTest.find_element = mock.MagicMock(name='find_element')
+    return DriverTest
+
+
+def test_geometry_location_and_size():
+    geometry = ElementGeometry.from_script_result(_geometry_result())
+    assert geometry.location == {'x': 10, 'y': 21}
+    assert geometry.size == {'width': 100, 'height': 50}
+
+
+@pytest.mark.parametrize('overrides, expected', [
+    ({}, True),
+    ({'scrollY': 30}, False),
+    ({'x': 750}, False),
+    ({'y': 580, 'scrollY': 100}, True),
+    ({'viewportHeight': 60}, False),
+])
+def test_geometry_in_viewport(overrides, expected):
+    geometry = ElementGeometry.from_script_result(_geometry_result(**overrides))
+    assert geometry.in_viewport is expected
+
+
+def test_element_in_viewport_uses_single_script_call():
+    DriverTest = _init_geometry_mocks(_geometry_result())
+    assert DriverTest().element_in_viewport('#elem') is True
+    DriverTest.execute_script.assert_called_once_with(scripts.ELEMENT_GEOMETRY, '#elem', False)
+    assert not DriverTest.find_element.called
+
+
+def test_size_and_location_use_geometry():
+    DriverTest = _init_geometry_mocks(_geometry_result())
+    driver = DriverTest()
+    assert driver.get_element_size('#elem') == {'width': 100, 'height': 50}
+    assert driver.get_element_location('//div') == {'x': 10, 'y': 21}
+    assert DriverTest.execute_script.call_count == 2
+
+
+def test_scroll_to_element_scrolls_in_script():
+    DriverTest = _init_geometry_mocks(_geometry_result())
+    DriverTest().scroll_to_element('#elem')
+    DriverTest.execute_script.assert_called_once_with(scripts.ELEMENT_GEOMETRY, '#elem', True)
+
+
+def test_missing_element_raises():
+    DriverTest = _init_geometry_mocks(None)
+    with pytest.raises(NoSuchElementException) as excinfo:
+        DriverTest().get_element_size('#missing')
+    assert '#missing' in str(excinfo.value)
@@ -0,0 +1,91 @@
+import pytest
+import sys
+import os
+import warnings
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, present_dir)
+from mock import Mock
+from behave_webdriver.driver import Remote
+from behave_webdriver import instrumentation
+from behave_webdriver.instrumentation import RoundTripBudgetExceeded, RoundTripBudgetWarning
+from webdriver_stub import StubWebDriverServer
+
+
+@pytest.fixture
+def driver():
+    with StubWebDriverServer() as stub:
+        behave_driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'})
+        yield behave_driver
+        behave_driver.quit()
+
+
+def _context(driver, scenario_tags=(), feature_tags=(), **userdata):
+    feature = Mock(tags=list(feature_tags))
+    scenario = Mock(effective_tags=None, tags=list(scenario_tags), feature=feature)
+    return Mock(behave_driver=driver, scenario=scenario, config=Mock(userdata=userdata))
+
+
+def _run_step(context, action):
+    step = Mock(keyword='When', spec=['keyword', 'name'])
+    step.name = 'I do something'
+    instrumentation.before_step(context, step)
+    action()
+    instrumentation.after_step(context, step)
+    return step
+
+
+def test_commands_are_counted(driver):
+    assert driver.roundtrips.by_command == {'newSession': 1}
+    driver.current_url
+    driver.get_element('#foo').is_displayed()
+    assert driver.roundtrips.commands == 4
+    assert driver.roundtrips.by_command['findElement'] == 1
+    assert driver.roundtrips.seconds > 0
+
+
+def test_step_and_scenario_usage(driver):
+    context = _context(driver)
+    instrumentation.before_scenario(context, context.scenario)
+    step = _run_step(context, lambda: driver.element_visible('#foo'))
+    assert step.roundtrips == 2
+    assert step.roundtrip_time > 0
+    assert step.wait_time == 0
+    _run_step(context, lambda: driver.pause(20))
+    instrumentation.after_scenario(context, context.scenario)
+    assert context.scenario.roundtrips == 2
+    assert context.scenario.wait_time >= 0.02
+
+
+def test_budget_from_scenario_tag_fails(driver):
+    context = _context(driver, scenario_tags=['roundtrip_budget=1'], feature_tags=['roundtrip_budget=5'])
+    with pytest.raises(RoundTripBudgetExceeded) as excinfo:
+        _run_step(context, lambda: driver.element_visible('#foo'))
+    assert 'issued 2 WebDriver commands' in str(excinfo.value)
+
+
+def test_budget_from_feature_tag(driver):
+    context = _context(driver, feature_tags=['roundtrip_budget=2'])
+    _run_step(context, lambda: driver.element_visible('#foo'))
+
+
+def test_budget_from_userdata_warns(driver):
+    context = _context(driver, roundtrip_budget='1', roundtrip_budget_action='warn')
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        step = _run_step(context, lambda: driver.element_visible('#foo'))
+    assert step.roundtrips == 2
+    assert [warning.category for warning in caught if warning.category is RoundTripBudgetWarning]
+
+
+def test_invalid_budget_action(driver):
+    context = _context(driver, roundtrip_budget='0', roundtrip_budget_action='explode')
+    with pytest.raises(ValueError):
+        _run_step(context, lambda: driver.current_url)
+
+
+def test_no_driver_is_ignored():
+    context = Mock(spec=['config'])
+    step = _run_step(context, lambda: None)
+    assert not hasattr(step, 'roundtrips')
@@ -0,0 +1,62 @@
+import pytest
+import json
+import subprocess
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+import behave_webdriver
+import behave_webdriver.utils
+
+lazy = pytest.mark.skipif(sys.version_info < (3, 7), reason='lazy attributes need module __getattr__ (PEP 562)')
+
+
+def _imported_after(statement):
+    code = ('import sys, json; {}; '
+            'print(json.dumps(sorted(m for m in ("selenium", "behave") if m in sys.modules)))').format(statement)
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=root_dir)
+    return json.loads(output.decode('utf-8'))
+
+
+@lazy
+@pytest.mark.parametrize('statement', [
+    'import behave_webdriver',
+    'from behave_webdriver import transform_parameter, FormatTransformation',
+    'import behave_webdriver.utils',
+    'import behave_webdriver.parallel',
+])
+def test_import_does_not_load_selenium_or_behave(statement):
+    assert _imported_after(statement) == []
+
+
+@lazy
+def test_fixture_import_loads_behave():
+    assert _imported_after('from behave_webdriver import fixture_browser') == ['behave', 'selenium']
+
+
+def test_lazy_attributes_resolve():
+    from behave_webdriver.driver import Chrome, Remote
+    from behave_webdriver.fixtures import fixture_browser
+    assert behave_webdriver.Chrome is Chrome
+    assert behave_webdriver.Remote is Remote
+    assert behave_webdriver.fixture_browser is fixture_browser
+    assert all(name in dir(behave_webdriver) for name in behave_webdriver.__all__)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        behave_webdriver.NoSuchThing
+
+
+def test_registry_is_built_once():
+    assert behave_webdriver.utils._registry() is behave_webdriver.utils._registry()
+
+
+def test_register_driver_by_path():
+    behave_webdriver.utils.register_driver('MyChrome', 'behave_webdriver.driver:Chrome.headless')
+    try:
+        from behave_webdriver.driver import Chrome
+        assert behave_webdriver.utils._from_string('mychrome') == Chrome.headless
+    finally:
+        del behave_webdriver.utils._registry()['MYCHROME']
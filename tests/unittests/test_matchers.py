@@ -0,0 +1,112 @@
+import pytest
+import sys
+import os
+from importlib import import_module
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave import matchers
+from behave.step_registry import StepRegistry
+from behave_webdriver.matchers import (INDEXED_PARSE, INDEXED_RE, IndexedMatcherMixin, IndexedParseMatcher,
+                                       IndexedRegexMatcher, StepIndex, parse_prefix, regex_prefix)
+
+import_module('behave_webdriver.steps')  # registers the steps
+
+
+@pytest.mark.parametrize('pattern, prefix', [
+    ('I expect that element "([^"]*)?" is( not)* visible', 'I expect that element "'),
+    ('I pause for (\\d+)*ms', 'I pause for '),
+    ('the( css)* attribute "([^"]*)?"', 'the'),
+    ('^I open the url "([^"]*)?"$', 'I open the url "'),
+    ('I (accept|dismiss) the alertbox', 'I '),
+    ('I accept|I dismiss the alertbox', ''),
+    ('I accept (a|b)', 'I accept '),
+    ('I wait ?for it', 'I wait'),
+    ('I press \\.', 'I press '),
+    ('a [|] b', 'a '),
+])
+def test_regex_prefix(pattern, prefix):
+    assert regex_prefix(pattern) == prefix
+
+
+def test_parse_prefix():
+    assert parse_prefix('I click on the element "{element}"') == 'I click on the element "'
+    assert parse_prefix('I delete all cookies') == 'I delete all cookies'
+
+
+def _index(*prefixes):
+    index = StepIndex()
+    for prefix in prefixes:
+        index.add(prefix, prefix)  # the prefix stands in for its matcher
+    return index
+
+
+def test_candidates():
+    index = _index('I click on the element "', 'I click on the link "', 'I pause for ', 'the', 'I ')
+    assert index.candidates('I click on the element "#a"') == {'I click on the element "', 'I '}
+    assert index.candidates('i pause for 10ms') == {'I pause for ', 'I '}
+    assert index.candidates('there is an element "#a"') == {'the'}
+    assert index.candidates('nothing') == frozenset()
+
+
+def test_matcher_without_prefix_is_always_a_candidate():
+    class Matcher(IndexedMatcherMixin, matchers.Matcher):
+        index = _index('I pause for ')
+
+        def check_match(self, step_text):
+            return None
+    matcher = Matcher(lambda context: None, 'I {anything}')
+    assert matcher in Matcher.index.candidates('I pause for 10ms')
+    assert matcher in Matcher.index.candidates('there is an element')
+
+
+def test_candidates_are_memoized():
+    index = _index('I pause for ')
+    index.candidates('I pause for 10ms')
+    index.candidates(''.join(['I pause for ', '10ms']))
+    assert index.stats()['memo_hits'] == 1
+
+
+def test_library_uses_indexed_matchers():
+    from behave.step_registry import registry
+    from behave.runner import the_step_registry
+    found = set(type(matcher) for step_registry in (registry, the_step_registry)
+                for definitions in step_registry.steps.values() for matcher in definitions
+                if matcher.func.__module__.startswith('behave_webdriver.steps'))
+    assert found == {IndexedParseMatcher, IndexedRegexMatcher}
+
+
+class Step(object):
+    def __init__(self, step_type, name):
+        self.step_type = step_type
+        self.name = name
+
+
+def _registry():
+    step_registry = StepRegistry()
+    matchers.use_step_matcher(INDEXED_PARSE)
+    step_registry.add_step_definition('when', 'I click on the element "{element}"', lambda context, element: None)
+    step_registry.add_step_definition('when', 'I click on the link "{text}"', lambda context, text: None)
+    matchers.use_step_matcher(INDEXED_RE)
+    step_registry.add_step_definition('then', 'I expect that element "([^"]*)?" is( not)* visible',
+                                      lambda context, element, negative: None)
+    step_registry.add_step_definition('step', 'I pause for (\\d+)*ms', lambda context, ms: None)
+    matchers.use_step_matcher('parse')
+    return step_registry
+
+
+def test_matching():
+    step_registry = _registry()
+    match = step_registry.find_match(Step('when', 'I click on the link "Home"'))
+    assert [argument.value for argument in match.arguments] == ['Home']
+    match = step_registry.find_match(Step('then', 'I expect that element "#a" is not visible'))
+    assert [argument.value for argument in match.arguments] == ['#a', ' not']
+    assert step_registry.find_match(Step('then', 'I pause for 10ms')) is not None
+    assert step_registry.find_match(Step('when', 'I click on the button "#a"')) is None
+    assert step_registry.find_match(Step('then', 'I click on the link "Home"')) is None
+
+
+def test_matches_are_memoized():
+    step_registry = _registry()
+    first = step_registry.find_match(Step('when', 'I click on the link "Home"'))
+    assert step_registry.find_match(Step('when', 'I click on the link "Home"')) is first
@@ -0,0 +1,93 @@
+import pytest
+import json
+import sys
+import os
+import textwrap
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver import parallel
+
+
+STEPS = textwrap.dedent('''
+    import os
+    from behave import step
+
+    @step('the worker has a driver name')
+    def worker_driver(context):
+        assert os.environ['BEHAVE_WEBDRIVER'] == 'Chrome.headless'
+        assert os.environ['BEHAVE_WEBDRIVER_WORKER'].isdigit()
+
+    @step('the step {outcome}')
+    def outcome(context, outcome):
+        assert outcome == 'passes'
+''')
+
+
+def _write_features(tmpdir, outcomes):
+    features_dir = tmpdir.mkdir('features')
+    features_dir.mkdir('steps').join('steps.py').write(STEPS)
+    for index, outcome in enumerate(outcomes):
+        features_dir.join('feature{}.feature'.format(index)).write(textwrap.dedent('''
+            Feature: feature {index}
+              Scenario: scenario {index}
+                Given the worker has a driver name
+                Then the step {outcome}
+        ''').format(index=index, outcome=outcome))
+    return features_dir
+
+
+def test_discover_features(tmpdir):
+    features_dir = _write_features(tmpdir, ['passes', 'passes'])
+    features_dir.mkdir('nested').join('other.feature').write('Feature: other')
+    features_dir.join('notes.txt').write('')
+    found = parallel.discover_features([str(features_dir)])
+    assert [os.path.basename(feature) for feature in found] == ['feature0.feature', 'feature1.feature', 'other.feature']
+
+
+def test_discover_missing_path_raises(tmpdir):
+    with pytest.raises(ValueError):
+        parallel.discover_features([str(tmpdir.join('missing'))])
+
+
+def test_shard_features():
+    shards = parallel.shard_features(['a', 'b', 'c', 'd', 'e'], 2)
+    assert shards == [['a', 'c', 'e'], ['b', 'd']]
+    assert parallel.shard_features(['a'], 3) == [['a'], [], []]
+
+
+def test_summarize():
+    report = [{'status': 'passed', 'elements': [
+                  {'type': 'background', 'steps': [{'result': {'status': 'passed'}}]},
+                  {'type': 'scenario', 'status': 'passed', 'steps': [{'result': {'status': 'passed'}}]}]},
+              {'status': 'failed', 'elements': [
+                  {'type': 'scenario', 'status': 'failed', 'steps': [{'result': {'status': 'failed'}}, {}]}]}]
+    summary = parallel.summarize(report)
+    assert summary == {'features': {'passed': 1, 'failed': 1},
+                       'scenarios': {'passed': 1, 'failed': 1},
+                       'steps': {'passed': 2, 'failed': 1, 'skipped': 1}}
+    assert '1 scenarios passed, 1 failed, 0 skipped' in parallel.format_summary(summary)
+
+
+def test_parse_args_passes_behave_args_through():
+    args = parallel.parse_args(['tests/features', '-n', '4', '--driver', 'firefox', '--', '--tags', '@fast'])
+    assert args.paths == ['tests/features']
+    assert args.workers == 4
+    assert args.driver == 'firefox'
+    assert args.behave_args == ['--tags', '@fast']
+
+
+@pytest.mark.parametrize('outcomes, exit_code', [
+    (['passes', 'passes', 'passes'], 0),
+    (['passes', 'fails', 'passes'], 1),
+])
+def test_main_merges_worker_reports(tmpdir, outcomes, exit_code):
+    features_dir = _write_features(tmpdir, outcomes)
+    outfile = tmpdir.join('report.json')
+    timings = tmpdir.join('timings.json')
+    result = parallel.main([str(features_dir), '-n', '2', '--driver', 'Chrome.headless', '-o', str(outfile),
+                            '--timings', str(timings)])
+    assert result == exit_code
+    report = json.loads(outfile.read())
+    assert sorted(feature['name'] for feature in report) == ['feature 0', 'feature 1', 'feature 2']
+    assert len(json.loads(timings.read())['features']) == 3
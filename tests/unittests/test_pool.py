@@ -0,0 +1,166 @@
+import pytest
+import mock
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+import behave_webdriver.fixtures
+from behave_webdriver.pool import DriverPool
+from selenium.common.exceptions import WebDriverException
+
+
+def _driver_factory():
+    drivers = []
+
+    def factory():
+        driver = mock.MagicMock(name='driver{}'.format(len(drivers)))
+        driver.window_handles = ['primary']
+        del driver.execute_cdp_cmd
+        drivers.append(driver)
+        return driver
+    return factory, drivers
+
+
+def test_released_driver_is_reset_and_reused():
+    factory, drivers = _driver_factory()
+    pool = DriverPool(size=1)
+    first = pool.acquire(factory)
+    pool.release(first)
+    assert pool.acquire(factory) is first
+    assert len(drivers) == 1
+    assert not first.quit.called
+    first.delete_all_cookies.assert_called_once_with()
+    first.get.assert_called_once_with('about:blank')
+    assert first.execute_script.called
+    assert pool.stats() == {'created': 1, 'reused': 1, 'recycled': 0}
+
+
+def test_reset_closes_secondary_windows():
+    factory, drivers = _driver_factory()
+    pool = DriverPool(reset=('windows',))
+    driver = pool.acquire(factory)
+    driver.window_handles = ['primary', 'popup']
+    pool.release(driver)
+    driver.switch_to.window.assert_called_with('primary')
+    assert driver.close.call_count == 1
+    assert not driver.get.called
+
+
+def test_unknown_reset_step_raises():
+    with pytest.raises(ValueError) as excinfo:
+        DriverPool(reset=('cookies', 'history'))
+    assert 'Unknown reset steps: history' in str(excinfo.value)
+
+
+def test_driver_is_recycled_after_max_uses():
+    factory, drivers = _driver_factory()
+    pool = DriverPool(max_uses=2)
+    first = pool.acquire(factory)
+    pool.release(first)
+    assert pool.acquire(factory) is first
+    pool.release(first)
+    assert first.quit.called
+    second = pool.acquire(factory)
+    assert second is not first
+    assert pool.stats() == {'created': 2, 'reused': 1, 'recycled': 1}
+
+
+def test_unhealthy_driver_is_replaced():
+    factory, drivers = _driver_factory()
+    pool = DriverPool()
+    first = pool.acquire(factory)
+    pool.release(first)
+    type(first).window_handles = mock.PropertyMock(side_effect=WebDriverException('session deleted'))
+    second = pool.acquire(factory)
+    assert second is not first
+    assert first.quit.called
+
+
+def test_failed_reset_discards_driver():
+    factory, drivers = _driver_factory()
+    pool = DriverPool(reset=lambda driver: driver.execute_script('boom'))
+    driver = pool.acquire(factory)
+    driver.execute_script.side_effect = WebDriverException('no such window')
+    pool.release(driver)
+    assert driver.quit.called
+    assert pool.acquire(factory) is not driver
+
+
+def test_unexpected_reset_error_discards_driver():
+    factory, drivers = _driver_factory()
+    pool = DriverPool(size=1, reset=lambda driver: driver.execute_script('boom'))
+    driver = pool.acquire(factory)
+    driver.execute_script.side_effect = AttributeError('no session')
+    with pytest.raises(AttributeError):
+        pool.release(driver)
+    assert driver.quit.called
+    assert pool.acquire(factory) is not driver  # the slot was freed, or this would block
+
+
+def test_close_quits_idle_drivers():
+    factory, drivers = _driver_factory()
+    pool = DriverPool(size=2)
+    first = pool.acquire(factory)
+    second = pool.acquire(factory)
+    pool.release(first)
+    pool.close()
+    assert first.quit.called
+    assert not second.quit.called
+    pool.release(second)
+    assert second.quit.called
+
+
+def test_fixture_uses_shared_pool():
+    class CustomDriver(behave_webdriver.fixtures.BehaveDriverMixin):
+        instances = 0
+
+        def __init__(self, *args, **kwargs):
+            CustomDriver.instances += 1
+            self.window_handles = ['primary']
+            self.quit = mock.MagicMock(name='quit')
+            self.get = mock.MagicMock(name='get')
+            self.execute_script = mock.MagicMock(name='execute_script')
+            self.delete_all_cookies = mock.MagicMock(name='delete_all_cookies')
+
+    drivers = []
+    for _ in range(3):
+        ctx = mock.MagicMock()
+        gen = behave_webdriver.fixtures.fixture_browser(ctx, webdriver_class=CustomDriver, pool_size=1, pool_reset=None)
+        drivers.append(next(gen))
+        with pytest.raises(StopIteration):
+            next(gen)
+        assert 'behave_driver' not in ctx
+    assert CustomDriver.instances == 1
+    assert drivers[0] is drivers[1] is drivers[2]
+    assert not drivers[0].quit.called
+
+
+def test_fixture_pools_by_driver_configuration():
+    from selenium.webdriver import ChromeOptions
+
+    class CustomDriver(behave_webdriver.fixtures.BehaveDriverMixin):
+        def __init__(self, *args, **kwargs):
+            self.kwargs = kwargs
+            self.window_handles = ['primary']
+            self.quit = mock.MagicMock(name='quit')
+
+    def use(**kwargs):
+        gen = behave_webdriver.fixtures.fixture_browser(mock.MagicMock(), webdriver_class=CustomDriver, pool_size=1,
+                                                        pool_reset=None, **kwargs)
+        driver = next(gen)
+        with pytest.raises(StopIteration):
+            next(gen)
+        return driver
+
+    def options(*arguments):
+        chrome_options = ChromeOptions()
+        for argument in arguments:
+            chrome_options.add_argument(argument)
+        return chrome_options
+
+    headless = use(options=options('--headless'), desired_capabilities={'acceptInsecureCerts': True})
+    assert use(options=options('--headless'), desired_capabilities={'acceptInsecureCerts': True}) is headless
+    assert use(options=options('--headless', '--incognito'),
+               desired_capabilities={'acceptInsecureCerts': True}) is not headless
+    assert use(options=options('--headless'), desired_capabilities={'acceptInsecureCerts': False}) is not headless
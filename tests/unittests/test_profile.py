@@ -0,0 +1,82 @@
+import pytest
+import json
+import subprocess
+import sys
+import os
+import textwrap
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver.profile import percentile, StepProfile
+
+
+STEPS = textwrap.dedent('''
+    import time
+    from behave import step
+
+    @step('I sleep {ms:d}ms')
+    def sleep(context, ms):
+        time.sleep(ms / 1000.0)
+
+    @step('the step passes')
+    def passes(context):
+        pass
+''')
+
+ENVIRONMENT = textwrap.dedent('''
+    def after_step(context, step):
+        step.roundtrips = 2
+        step.wait_time = 0.001
+''')
+
+FEATURE = textwrap.dedent('''
+    Feature: profiled
+      Scenario: steps
+        Given I sleep 30ms
+        And I sleep 10ms
+        Then the step passes
+''')
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7], 50) == 7
+    assert percentile([1, 2], 0) == 1
+
+
+def test_step_profile():
+    profile = StepProfile('steps.py:3', 'sleep', 'I sleep {ms:d}ms')
+    for duration in (0.1, 0.3, 0.2):
+        profile.add(duration, roundtrips=2)
+    profile.add(0.4, failed=True)
+    data = profile.to_dict()
+    assert data['calls'] == 4
+    assert data['failures'] == 1
+    assert data['total'] == pytest.approx(1.0)
+    assert data['p50'] == 0.2
+    assert data['p99'] == 0.4
+    assert data['roundtrips'] == 6
+    assert data['wait_time'] is None
+
+
+def test_formatter_in_behave_run(tmpdir):
+    features_dir = tmpdir.mkdir('features')
+    features_dir.mkdir('steps').join('steps.py').write(STEPS)
+    features_dir.join('environment.py').write(ENVIRONMENT)
+    features_dir.join('profiled.feature').write(FEATURE)
+    profile_json = tmpdir.join('profile.json')
+    env = dict(os.environ, PYTHONPATH=root_dir)
+    output = subprocess.check_output([sys.executable, '-m', 'behave', str(features_dir),
+                                      '-f', 'behave_webdriver.profile:ProfileFormatter',
+                                      '-D', 'profile_json={}'.format(profile_json)],
+                                     cwd=str(tmpdir), env=env).decode('utf-8')
+    assert 'Slowest step definitions (2 of 2)' in output
+    steps = json.loads(profile_json.read())['steps']
+    assert [step['name'] for step in steps] == ['sleep', 'passes']
+    assert steps[0]['pattern'] == 'I sleep {ms:d}ms'
+    assert steps[0]['calls'] == 2
+    assert steps[0]['p99'] >= 0.03
+    assert steps[0]['roundtrips'] == 4
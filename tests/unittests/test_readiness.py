@@ -0,0 +1,117 @@
+import pytest
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, present_dir)
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from behave_webdriver import readiness, scripts
+from behave_webdriver.driver import Remote, _set_capability
+from behave_webdriver.readiness import PageNotReady
+from webdriver_stub import StubWebDriverServer
+
+
+class ReadyScripts(object):
+    def __init__(self):
+        self.outcome = {'ok': True}
+        self.calls = []
+
+    def __call__(self, script, args, state):
+        if script == scripts.WAIT_FOR_READY:
+            self.calls.append(args)
+            return self.outcome
+        return None
+
+
+@pytest.fixture
+def page_scripts():
+    return ReadyScripts()
+
+
+@pytest.fixture
+def stub(page_scripts):
+    with StubWebDriverServer(script_handler=page_scripts) as server:
+        yield server
+
+
+def _remote(stub, **kwargs):
+    return Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, **kwargs)
+
+
+@pytest.mark.parametrize('spec, expected', [
+    ('selector:#app', readiness.selector_present('#app')),
+    ('selector: //div[@id="app"]', readiness.selector_present('//div[@id="app"]')),
+    ('network idle', readiness.network_idle(500)),
+    ('network-idle:250', readiness.network_idle(250)),
+    ('js:window.app && window.app.ready', readiness.js_predicate('window.app && window.app.ready')),
+    ('document ready', readiness.document_ready('complete')),
+    ('document_ready:interactive', readiness.document_ready('interactive')),
+])
+def test_parse(spec, expected):
+    assert readiness.parse(spec) == expected
+
+
+@pytest.mark.parametrize('spec', ['onload', 'selector', 'js:', 'document ready:loading'])
+def test_parse_invalid(spec):
+    with pytest.raises(ValueError):
+        readiness.parse(spec)
+
+
+def test_conditions():
+    idle = readiness.network_idle()
+    assert readiness.conditions(None) == []
+    assert readiness.conditions(idle) == [idle]
+    assert readiness.conditions(['selector:#app', idle]) == [readiness.selector_present('#app'), idle]
+
+
+def test_capability_in_options():
+    options = ChromeOptions()
+    args, kwargs = _set_capability(None, (), {'options': options}, 'pageLoadStrategy', 'eager')
+    assert options.to_capabilities()['pageLoadStrategy'] == 'eager'
+
+
+def test_capability_in_desired_capabilities():
+    capabilities = {'browserName': 'stub'}
+    args, kwargs = _set_capability(None, (), {'desired_capabilities': capabilities}, 'pageLoadStrategy', 'none')
+    assert kwargs['desired_capabilities'] == {'browserName': 'stub', 'pageLoadStrategy': 'none'}
+    assert capabilities == {'browserName': 'stub'}
+    args, kwargs = _set_capability(None, ('http://hub', capabilities), {}, 'pageLoadStrategy', 'none')
+    assert args == ('http://hub', {'browserName': 'stub', 'pageLoadStrategy': 'none'})
+
+
+def test_invalid_page_load_strategy(stub):
+    with pytest.raises(ValueError):
+        _remote(stub, page_load_strategy='lazy')
+
+
+def test_open_url_without_conditions(stub, page_scripts):
+    driver = _remote(stub, page_load_strategy='eager')
+    driver.open_url('http://example.com/')
+    assert page_scripts.calls == []
+    driver.quit()
+
+
+def test_open_url_waits_for_driver_conditions(stub, page_scripts):
+    driver = _remote(stub, ready=['selector:#app', 'network idle'], ready_timeout=5)
+    driver.open_url('http://example.com/')
+    assert page_scripts.calls == [[[{'type': 'selector', 'value': '#app'}, {'type': 'networkIdle', 'value': 500}],
+                                   5000]]
+    assert driver.roundtrips.wait_seconds > 0
+    driver.quit()
+
+
+def test_open_url_conditions_replace_driver_conditions(stub, page_scripts):
+    driver = _remote(stub, ready='selector:#app')
+    driver.open_url('http://example.com/', ready='js:window.ready')
+    assert page_scripts.calls[0][0] == [{'type': 'js', 'value': 'window.ready'}]
+    driver.quit()
+
+
+def test_page_not_ready(stub, page_scripts):
+    page_scripts.outcome = {'ok': False, 'failing': [1]}
+    driver = _remote(stub, ready_timeout=2)
+    with pytest.raises(PageNotReady) as excinfo:
+        driver.open_url('http://example.com/', ready=['selector:#app', 'js:window.ready'])
+    assert str(excinfo.value.msg) == "Page not ready within 2 seconds, waiting for js('window.ready')"
+    driver.quit()
@@ -0,0 +1,158 @@
+import pytest
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, present_dir)
+from collections import namedtuple
+import mock
+from selenium.common.exceptions import NoAlertPresentException
+from behave_webdriver import recording
+from behave_webdriver.driver import Remote
+from behave_webdriver.recording import (Replay, ReplayConnection, RecordingConnection, ReplayDivergence, read_log,
+                                        scenario_log_name)
+from behave_webdriver.utils import from_string
+from behave_webdriver.waits import wait_for_quiescence
+from webdriver_stub import StubWebDriverServer
+
+
+Scenario = namedtuple('Scenario', 'filename line name')
+Step = namedtuple('Step', 'keyword name')
+
+
+def _scenario(name='Opening a page', line=3):
+    return Scenario('features/pages.feature', line, name)
+
+
+def _step(name):
+    return Step('When', name)
+
+
+def _run(driver, scenario, steps):
+    context = mock.Mock(behave_driver=driver)
+    recording.before_scenario(context, scenario)
+    for name, action in steps:
+        recording.before_step(context, _step(name))
+        action(driver)
+    recording.after_scenario(context, scenario)
+
+
+STEPS = [('I open the page', lambda driver: driver.get('http://example.com/')),
+         ('I read the title', lambda driver: driver.title),
+         ('I read the text', lambda driver: driver.find_element_by_css_selector('#title').text)]
+
+
+@pytest.fixture
+def recorded(tmpdir):
+    with StubWebDriverServer() as stub:
+        stub.state.title = 'Recorded'
+        stub.state.element_text = 'recorded text'
+        driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, record=str(tmpdir))
+        assert isinstance(driver.command_executor, RecordingConnection)
+        _run(driver, _scenario(), STEPS)
+        driver.quit()
+    return tmpdir
+
+
+def test_recording_a_pooled_remote_closes_its_pool(tmpdir):
+    with StubWebDriverServer() as stub:
+        driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'},
+                        connection_pool={'resolve_ip': False}, record=str(tmpdir))
+        pooled = driver.command_executor._executor
+        _run(driver, _scenario(), STEPS)
+        driver.quit()
+    assert len(pooled._conn.pools) == 0  # closed by quit
+    assert pooled.connection_stats()['connections'] == 1
+    assert tmpdir.join('pages-3-opening-a-page.jsonl.gz').check()
+
+
+def test_log_name():
+    assert scenario_log_name(_scenario('Opening a "page"!', 12)) == 'pages-12-opening-a-page.jsonl.gz'
+    assert scenario_log_name(_scenario(), compress=False) == 'pages-3-opening-a-page.jsonl'
+
+
+def test_records_scenario_commands(recorded):
+    header, entries = read_log(str(recorded.join('pages-3-opening-a-page.jsonl.gz')))
+    assert header['scenario'] == 'Opening a page'
+    assert [entry['command'] for entry in entries] == ['get', 'getTitle', 'findElement', 'getElementText']
+    assert entries[0]['params'] == {'url': 'http://example.com/'}  # without the session id
+    assert entries[1]['response']['value'] == 'Recorded'
+    assert entries[3]['step'] == 'When I read the text'
+
+
+def test_replay(recorded):
+    driver = from_string('replay', recordings=str(recorded))
+    assert isinstance(driver, Replay)
+    results = []
+    steps = [('I open the page', lambda driver: driver.get('http://example.com/')),
+             ('I read the title', lambda driver: results.append(driver.title)),
+             ('I read the text', lambda driver: results.append(driver.find_element_by_css_selector('#title').text))]
+    _run(driver, _scenario(), steps)
+    assert results == ['Recorded', 'recorded text']
+    driver.quit()
+
+
+def test_replay_divergence(recorded):
+    driver = Replay(str(recorded))
+    steps = [('I open the page', lambda driver: driver.get('http://example.com/other'))]
+    with pytest.raises(ReplayDivergence) as excinfo:
+        _run(driver, _scenario(), steps)
+    message = str(excinfo.value)
+    assert 'command #1 in step "When I open the page"' in message
+    assert 'expected get {"url": "http://example.com/"}' in message
+    assert 'got get {"url": "http://example.com/other"}' in message
+
+
+def test_replay_missing_commands(recorded):
+    driver = Replay(str(recorded))
+    with pytest.raises(ReplayDivergence) as excinfo:
+        _run(driver, _scenario(), STEPS[:1])
+    assert 'ended 3 recorded commands early, next was #2 (recorded in step "When I read the title")' in \
+        str(excinfo.value)
+
+
+def test_replay_missing_recording(recorded):
+    with pytest.raises(ReplayDivergence):
+        _run(Replay(str(recorded)), _scenario('Unknown'), [])
+
+
+def test_replay_tolerates_polling(tmpdir):
+    with StubWebDriverServer() as stub:
+        driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, record=str(tmpdir))
+        _run(driver, _scenario(), [('I check for alerts', lambda driver: [driver.has_alert for _ in range(3)]),
+                                   ('I read the title', lambda driver: driver.title)])
+        driver.quit()
+    connection = ReplayConnection(str(tmpdir))
+    for polls in (1, 5):
+        connection.load(_scenario())
+        for _ in range(polls):
+            response = connection.execute('w3cGetAlertText', {'sessionId': 'replay'})
+            assert response['status'] == 404
+        connection.execute('getTitle', {'sessionId': 'replay'})
+        connection.finish()
+
+
+def test_replay_a_later_scenario_alone(tmpdir):
+    steps = [('I wait for the page', lambda driver: wait_for_quiescence(driver, 1, 0))]
+    with StubWebDriverServer() as stub:
+        driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, record=str(tmpdir))
+        _run(driver, _scenario(), steps)
+        _run(driver, _scenario('Opening another page', 9), steps)
+        driver.quit()
+    _, entries = read_log(str(tmpdir.join('pages-9-opening-another-page.jsonl.gz')))
+    assert [entry['command'] for entry in entries] == ['setTimeouts', 'w3cExecuteScriptAsync']
+    _run(Replay(str(tmpdir)), _scenario('Opening another page', 9), steps)
+
+
+def _read_alert(driver):
+    with pytest.raises(NoAlertPresentException):
+        driver.switch_to.alert.text
+
+
+def test_recorded_errors_are_raised_on_replay(tmpdir):
+    with StubWebDriverServer() as stub:
+        driver = Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, record=str(tmpdir))
+        _run(driver, _scenario(), [('I read the alert', _read_alert)])
+        driver.quit()
+    _run(Replay(str(tmpdir)), _scenario(), [('I read the alert', _read_alert)])
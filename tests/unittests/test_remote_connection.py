@@ -0,0 +1,68 @@
+import pytest
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, present_dir)
+import urllib3
+from behave_webdriver.driver import Remote
+from behave_webdriver.remote_connection import PooledRemoteConnection
+from behave_webdriver.utils import from_string
+from webdriver_stub import StubWebDriverServer
+
+
+@pytest.fixture
+def stub():
+    with StubWebDriverServer() as server:
+        yield server
+
+
+def _remote(url, **kwargs):
+    return Remote(command_executor=url, desired_capabilities={'browserName': 'stub'}, **kwargs)
+
+
+def test_connection_pool_reuses_connections(stub):
+    # resolve_ip=False: selenium's reachability probe of the server would open connections of its own
+    driver = _remote(stub.url, connection_pool={'pool_size': 2, 'resolve_ip': False})
+    assert isinstance(driver.command_executor, PooledRemoteConnection)
+    for _ in range(10):
+        driver.current_url
+    driver.quit()
+    stats = driver.command_executor.connection_stats()
+    assert stats['commands'] == 12  # new session, 10 x current_url, quit
+    assert stats['requests'] == 12
+    assert stats['connections'] == 1
+    assert stats['reused'] == 11
+    assert stub.connections == 1
+
+
+def test_positional_command_executor(stub):
+    driver = Remote(stub.url, {'browserName': 'stub'}, connection_pool=True)
+    assert isinstance(driver.command_executor, PooledRemoteConnection)
+    driver.quit()
+
+
+def test_from_string_kwargs(stub):
+    driver = from_string('remote', command_executor=stub.url, desired_capabilities={'browserName': 'stub'},
+                         connection_pool={'timeout': 5})
+    assert driver.command_executor.timeout.read_timeout == 5
+    driver.quit()
+
+
+def test_per_command_timeout(stub):
+    stub.command_latency['GET /session/$id/title'] = 0.5
+    driver = _remote(stub.url, connection_pool={'timeout': 5, 'retries': False,
+                                                 'command_timeouts': {'getTitle': 0.1}})
+    try:
+        with pytest.raises(urllib3.exceptions.ReadTimeoutError):
+            driver.title
+        assert driver.current_url == 'about:blank'
+    finally:
+        driver.quit()
+
+
+def test_default_executor_unchanged(stub):
+    driver = _remote(stub.url)
+    assert not isinstance(driver.command_executor, PooledRemoteConnection)
+    driver.quit()
@@ -0,0 +1,144 @@
+import pytest
+import sys
+import os
+import gzip
+import io
+import threading
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+try:
+    from http.client import HTTPConnection
+except ImportError:
+    from httplib import HTTPConnection
+import mock
+import behave_webdriver.fixtures
+from behave_webdriver.server import SiteServer, accepts_gzip
+
+SCRIPT = 'var answer = 42;\n' * 100
+
+
+@pytest.fixture
+def site(tmpdir):
+    tmpdir.join('index.html').write('<html><body>home</body></html>')
+    tmpdir.mkdir('inc').join('app.js').write(SCRIPT)
+    tmpdir.join('logo.png').write_binary(b'\x89PNG' + b'\x00' * 1000)
+    with SiteServer(str(tmpdir)) as server:
+        yield server
+
+
+def _request(server, path, **headers):
+    connection = HTTPConnection('127.0.0.1', server.port, timeout=5)
+    connection.request('GET', path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_serves_files(site):
+    response, body = _request(site, '/')
+    assert response.status == 200
+    assert body == b'<html><body>home</body></html>'
+    assert response.getheader('Content-Type') == 'text/html; charset=utf-8'
+    assert response.getheader('Cache-Control') == 'no-cache'
+    assert _request(site, '/missing.html')[0].status == 404
+    assert _request(site, '/../../etc/passwd')[0].status == 404
+
+
+def test_directory_without_slash_redirects(site):
+    response, body = _request(site, '/inc?v=1')
+    assert response.status == 301
+    assert response.getheader('Location') == '/inc/?v=1'
+    assert body == b''
+    assert _request(site, '/inc/')[0].status == 404  # no index.html
+
+
+def test_ephemeral_port(site):
+    assert site.port != 0
+    assert site.url == 'http://127.0.0.1:{}/'.format(site.port)
+
+
+def test_in_memory_cache(site):
+    _request(site, '/inc/app.js')
+    _request(site, '/inc/app.js?v=1')
+    assert site.cache.misses == 1
+    assert site.cache.hits == 1
+
+
+def test_changed_files_are_reread(site, tmpdir):
+    _request(site, '/index.html')
+    page = tmpdir.join('index.html')
+    page.write('changed')
+    page.setmtime(page.mtime() + 10)
+    assert _request(site, '/index.html')[1] == b'changed'
+
+
+def test_etag_revalidation(site):
+    response, _ = _request(site, '/inc/app.js')
+    etag = response.getheader('ETag')
+    response, body = _request(site, '/inc/app.js', **{'If-None-Match': etag})
+    assert response.status == 304
+    assert body == b''
+
+
+def test_gzip(site):
+    response, body = _request(site, '/inc/app.js', **{'Accept-Encoding': 'gzip, deflate'})
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert gzip.GzipFile(fileobj=io.BytesIO(body)).read().decode('utf-8') == SCRIPT
+    response, body = _request(site, '/inc/app.js')
+    assert response.getheader('Content-Encoding') is None
+    response, body = _request(site, '/inc/app.js', **{'Accept-Encoding': 'gzip;q=0, deflate'})
+    assert response.getheader('Content-Encoding') is None
+    assert body == SCRIPT.encode('utf-8')
+    response, _ = _request(site, '/logo.png', **{'Accept-Encoding': 'gzip'})
+    assert response.getheader('Content-Encoding') is None
+
+
+@pytest.mark.parametrize('accept_encoding, accepted', [
+    ('gzip, deflate', True),
+    ('deflate, GZIP;q=0.5', True),
+    ('gzip;q=0', False),
+    ('gzip;q=0.0, deflate', False),
+    ('*', True),
+    ('*;q=0', False),
+    ('gzip;q=0, *', False),
+    ('identity', False),
+    ('', False),
+])
+def test_accepts_gzip(accept_encoding, accepted):
+    assert accepts_gzip(accept_encoding) is accepted
+
+
+def test_max_age(tmpdir):
+    tmpdir.join('index.html').write('home')
+    with SiteServer(str(tmpdir), max_age=3600) as server:
+        assert _request(server, '/')[0].getheader('Cache-Control') == 'max-age=3600'
+
+
+def test_concurrent_connections(site):
+    # a connection kept open must not hold the others up
+    idle = HTTPConnection('127.0.0.1', site.port, timeout=5)
+    idle.request('GET', '/')
+    idle.getresponse().read()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(_request(site, '/inc/app.js')[0].status))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    idle.close()
+    assert results == [200] * 5
+
+
+def test_fixture_site(tmpdir):
+    tmpdir.join('index.html').write('home')
+    ctx = mock.MagicMock()
+    gen = behave_webdriver.fixtures.fixture_site(ctx, str(tmpdir))
+    server = next(gen)
+    assert ctx.base_url == server.url.rstrip('/')
+    assert _request(server, '/')[1] == b'home'
+    with pytest.raises(StopIteration):
+        next(gen)
+    assert 'site_server' not in ctx
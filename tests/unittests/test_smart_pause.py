@@ -0,0 +1,93 @@
+import pytest
+import sys
+import os
+import time
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, present_dir)
+import mock
+from selenium.common.exceptions import WebDriverException
+from behave_webdriver import scripts
+from behave_webdriver.driver import Remote
+from webdriver_stub import StubWebDriverServer
+
+
+class Scripts(object):
+    def __init__(self, quiet=True):
+        self.quiet = quiet
+        self.calls = []
+
+    def __call__(self, script, args, state):
+        if script == scripts.WAIT_FOR_QUIESCENCE:
+            self.calls.append(('quiescence', args))
+            return {'quiet': self.quiet, 'elapsed': 10}
+        if script == scripts.ACTIVITY_TRACKER:
+            self.calls.append(('tracker', args))
+        return None
+
+
+@pytest.fixture
+def page_scripts():
+    return Scripts()
+
+
+@pytest.fixture
+def stub(page_scripts):
+    with StubWebDriverServer(script_handler=page_scripts) as server:
+        yield server
+
+
+def _remote(stub, **kwargs):
+    return Remote(command_executor=stub.url, desired_capabilities={'browserName': 'stub'}, **kwargs)
+
+
+def test_plain_pause_sleeps(stub, page_scripts):
+    driver = _remote(stub)
+    driver.pause(50)
+    assert page_scripts.calls == []
+    assert driver.pauses.requested == 0.05
+    assert driver.pauses.actual >= 0.05
+    assert driver.pauses.saved == 0.0
+    driver.quit()
+
+
+def test_smart_pause_returns_once_quiet(stub, page_scripts):
+    driver = _remote(stub, smart_pause=True)
+    started = time.time()
+    driver.pause(2000)
+    assert time.time() - started < 1
+    assert page_scripts.calls == [('quiescence', [100, 2000])]
+    assert driver.pauses.requested == 2.0
+    assert driver.pauses.saved > 1
+    driver.quit()
+
+
+def test_settle_window(stub, page_scripts):
+    driver = _remote(stub, smart_pause=250)
+    driver.pause(1000)
+    assert page_scripts.calls == [('quiescence', [250, 1000])]
+    driver.quit()
+
+
+def test_tracker_installed_on_navigation(stub, page_scripts):
+    driver = _remote(stub, smart_pause=True)
+    driver.get('http://example.com/')
+    assert page_scripts.calls == [('tracker', [])]
+    driver.quit()
+
+
+def test_falls_back_to_sleeping(stub):
+    driver = _remote(stub, smart_pause=True)
+    with mock.patch.object(driver, 'execute_async_script', side_effect=WebDriverException('navigated')):
+        started = time.time()
+        driver.pause(100)
+    assert time.time() - started >= 0.1
+    driver.quit()
+
+
+def test_pause_counts_as_wait_time(stub):
+    driver = _remote(stub, smart_pause=True)
+    driver.pause(1000)
+    assert driver.roundtrips.wait_seconds == pytest.approx(driver.pauses.actual, abs=0.01)
+    driver.quit()
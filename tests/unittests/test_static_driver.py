@@ -0,0 +1,207 @@
+import pytest
+import sys
+import os
+import threading
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+pytest.importorskip('lxml')
+pytest.importorskip('cssselect')
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from selenium.common.exceptions import (InvalidSelectorException,
+                                        NoSuchElementException,
+                                        StaleElementReferenceException)
+from behave_webdriver.readiness import PageNotReady
+from behave_webdriver.static import Static, UnsupportedOperation
+from behave_webdriver.utils import from_string
+
+PAGE = '''<html><head><title> Static  page </title>
+<style>.gone, .also-gone { display: none } @media print { .printed { display: none } }</style></head>
+<body>
+<h1 id="title">Hello <b>world</b></h1>
+<p class="intro lead">First<br>line</p>
+<p class="gone">invisible</p>
+<p id="inline" style="display:none">inline hidden</p>
+<div id="attribute" hidden>hidden attribute</div>
+<p class="printed">printed</p>
+<a id="next" href="other.html">Next page</a>
+<input id="name" value="Jane">
+<input id="check" type="checkbox" checked>
+<input id="empty">
+<fieldset disabled><input id="locked"></fieldset>
+<select id="select"><option value="a">A</option><option value="b">B</option></select>
+<input autofocus id="focused">
+</body></html>'''
+
+OTHER = '<html><head><title>Other</title></head><body><p id="other">other page</p></body></html>'
+
+
+@pytest.fixture
+def pages(tmpdir):
+    tmpdir.join('page.html').write(PAGE)
+    tmpdir.join('other.html').write(OTHER)
+    return tmpdir
+
+
+@pytest.fixture
+def driver(pages):
+    behave_driver = Static()
+    behave_driver.get(str(pages.join('page.html')))
+    yield behave_driver
+    behave_driver.quit()
+
+
+def test_registered_name():
+    assert isinstance(from_string('static'), Static)
+
+
+def test_page(driver, pages):
+    assert driver.title == 'Static page'
+    assert driver.current_url.startswith('file://')
+    assert driver.current_url.endswith('page.html')
+
+
+def test_locate_elements(driver):
+    assert driver.get_element('#title').tag_name == 'h1'
+    assert driver.get_element('//p[@class="gone"]').text == ''
+    assert driver.element_exists('select option')
+    assert not driver.element_exists('#missing')
+    with pytest.raises(NoSuchElementException):
+        driver.get_element('#missing')
+    with pytest.raises(InvalidSelectorException):
+        driver.get_element('//p/@class')
+
+
+def test_text(driver):
+    assert driver.get_element_text('#title') == 'Hello world'
+    assert driver.get_element_text('.intro') == 'First\nline'
+    assert driver.get_element_text('#name') == 'Jane'
+    assert driver.get_element_text('#select') == 'a'
+    assert driver.match_element_text('#title', 'contains', 'world')
+    assert not driver.match_element_text('#inline', 'any')
+    assert not driver.compare_element_texts('#title', '#name')[0]
+    assert driver.compare_element_texts('#select', '//option[1]')[0]
+
+
+@pytest.mark.parametrize('selector, visible', [
+    ('#title', True),
+    ('.gone', False),
+    ('#inline', False),
+    ('#attribute', False),
+    ('.printed', True),  # @media rules are not applied
+    ('title', False),
+])
+def test_visibility(driver, selector, visible):
+    assert driver.element_visible(selector) is visible
+
+
+def test_element_state(driver):
+    assert driver.element_enabled('#name')
+    assert not driver.element_enabled('#locked')
+    assert driver.element_selected('#check')
+    assert driver.element_selected('#select option[value="a"]')
+    assert not driver.element_selected('#select option[value="b"]')
+    assert driver.element_focused('#focused')
+    assert driver.element_has_class('.intro', 'lead')
+
+
+def test_attributes(driver, pages):
+    assert driver.get_element_attribute('#check', 'checked') == 'true'
+    assert driver.get_element_attribute('#name', 'value') == 'Jane'
+    assert driver.get_element_attribute('#next', 'href').endswith('other.html')
+    assert driver.get_element_attribute('#title', 'data-missing') is None
+
+
+def test_wait_for_element_condition_is_immediate(driver):
+    assert driver.wait_for_element_condition('#title', 5000, None, 'be visible').tag_name == 'h1'
+    assert driver.wait_for_element_condition('#check', 5000, None, 'be checked')
+    assert driver.wait_for_element_condition('#missing', 5000, True, 'exist')
+    assert driver.wait_for_element_condition('#inline', 5000, None, 'be visible') is None
+
+
+def test_wait_for_combined_conditions(driver):
+    assert driver.wait_for_element_condition('#name', 5000, None, 'be visible and be enabled and contain a value')
+    assert driver.wait_for_element_condition('#locked', 5000, None, 'be enabled and be visible') is None
+    assert driver.wait_for_element_condition('#locked', 5000, True, 'be enabled and be visible')
+    assert driver.wait_for_element_condition('#empty', 5000, None, 'contain a value or be enabled')
+
+
+def test_follow_link_and_history(driver):
+    title = driver.get_element('#title')
+    driver.click_link_text('Next page')
+    assert driver.title == 'Other'
+    with pytest.raises(StaleElementReferenceException):
+        title.text
+    driver.back()
+    assert driver.title == 'Static page'
+    driver.forward()
+    assert driver.element_exists('#other')
+
+
+def test_unsupported_operations(driver):
+    with pytest.raises(UnsupportedOperation):
+        driver.get_element('#name').send_keys('text')
+    with pytest.raises(UnsupportedOperation):
+        driver.click_element('#title')
+    with pytest.raises(UnsupportedOperation):
+        driver.element_in_viewport('#title')
+    with pytest.raises(UnsupportedOperation):
+        driver.execute_script('return 1')
+    with pytest.raises(UnsupportedOperation):
+        driver.doubleclick_element('#title')
+    assert not driver.has_alert
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = '<html><body><p id="cookie">{}</p></body></html>'.format(self.headers.get('Cookie', '')).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Set-Cookie', 'session=abc; Path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_http_cookies():
+    server = HTTPServer(('127.0.0.1', 0), _CookieHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        driver = Static()
+        url = 'http://127.0.0.1:{}/'.format(server.server_address[1])
+        driver.get(url)
+        assert driver.get_cookie('session')['value'] == 'abc'
+        driver.add_cookie({'name': 'extra', 'value': '1'})
+        driver.refresh()
+        assert driver.get_element_text('#cookie') == 'session=abc; extra=1'
+        driver.delete_all_cookies()
+        assert driver.cookies == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_readiness(pages):
+    driver = Static(ready=['selector:#title', 'network idle'])
+    driver.open_url(str(pages.join('page.html')))
+    with pytest.raises(PageNotReady):
+        driver.open_url(str(pages.join('other.html')))
+    with pytest.raises(UnsupportedOperation):
+        driver.open_url(str(pages.join('page.html')), ready='js:window.ready')
+
+
+def test_auto_wait(pages):
+    behave_driver = Static(auto_wait=True)
+    behave_driver.get(str(pages.join('page.html')))
+    behave_driver.click_element('#next')
+    assert behave_driver.title == 'Other'
+    assert behave_driver.waits.polls == 0  # a single in-page check
+    behave_driver.quit()
@@ -0,0 +1,102 @@
+import pytest
+import mock
+import sys
+import os
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver.driver import BehaveDriverMixin
+from behave_webdriver.predicates import TextMatch
+from behave_webdriver import scripts
+from behave_webdriver.steps import expectations
+from selenium.common.exceptions import NoSuchElementException
+
+
+def _init_script_mocks(result):
+    class DriverTest(BehaveDriverMixin):
+        pass
+    DriverTest.execute_script = mock.MagicMock(name='execute_script', return_value=result)
+    DriverTest.find_element_by_css_selector = mock.MagicMock(name='find_element_by_css_selector')
+    return DriverTest()
+
+
+def _result(matched, excerpt='some text', start=0, length=9):
+    return {'matched': matched, 'excerpt': excerpt, 'start': start, 'length': length}
+
+
+def test_match_sends_only_expected_text_and_mode():
+    driver = _init_script_mocks(_result(True))
+    match = driver.match_element_text('#log', 'contains', 'needle')
+    assert match
+    driver.execute_script.assert_called_once_with(scripts.TEXT_PREDICATE, '#log', 'contains', 'needle', 80)
+    assert not driver.find_element_by_css_selector.called
+
+
+def test_element_contains_uses_predicate():
+    driver = _init_script_mocks(_result(False))
+    assert driver.element_contains('#log', 'needle') is False
+
+
+def test_invalid_mode_raises():
+    driver = _init_script_mocks(_result(True))
+    with pytest.raises(ValueError) as excinfo:
+        driver.match_element_text('#log', 'startswith', 'x')
+    assert 'Invalid text mode "startswith"' in str(excinfo.value)
+
+
+def test_missing_element_raises():
+    driver = _init_script_mocks(None)
+    with pytest.raises(NoSuchElementException):
+        driver.match_element_text('#missing', 'any')
+    with pytest.raises(NoSuchElementException):
+        driver.get_element_text('#missing')
+
+
+def test_get_element_text_is_one_script_call():
+    driver = _init_script_mocks('hello')
+    assert driver.get_element_text('#greeting') == 'hello'
+    driver.execute_script.assert_called_once_with(scripts.ELEMENT_TEXT, '#greeting')
+
+
+def test_compare_texts_is_one_script_call():
+    driver = _init_script_mocks([_result(False, 'abc', 5, 9), _result(False, 'abd', 5, 8)])
+    first, second = driver.compare_element_texts('#a', '#b')
+    assert not first
+    assert (str(first), str(second)) == ('...abc...', '...abd')
+    driver.execute_script.assert_called_once_with(scripts.SAME_TEXT, '#a', '#b', 80)
+
+
+def test_compare_texts_names_the_missing_element():
+    driver = _init_script_mocks({'missing': 1})
+    with pytest.raises(NoSuchElementException) as excinfo:
+        driver.compare_element_texts('#a', '#b')
+    assert 'Unable to locate element: #b' in str(excinfo.value)
+
+
+def test_same_text_step():
+    context = mock.MagicMock()
+    context.behave_driver = _init_script_mocks([_result(True), _result(True)])
+    expectations.elements_same_text(context, '#a', None, '#b')
+    with pytest.raises(AssertionError) as excinfo:
+        expectations.elements_same_text(context, '#a', ' not', '#b')
+    assert 'text "some text" is same as element "#b"' in str(excinfo.value)
+
+
+@pytest.mark.parametrize('start, excerpt, length, expected', [
+    (0, 'abc', 3, 'abc'),
+    (0, 'abc', 10, 'abc...'),
+    (5, 'abc', 8, '...abc'),
+    (5, 'abc', 20, '...abc...'),
+])
+def test_text_match_excerpt(start, excerpt, length, expected):
+    match = TextMatch(False, excerpt, start, length)
+    assert str(match) == expected
+    assert match.truncated is (expected != excerpt)
+
+
+def test_step_failure_message_contains_excerpt():
+    context = mock.MagicMock()
+    context.behave_driver = _init_script_mocks(_result(False, excerpt='a very long log', length=1000000))
+    with pytest.raises(AssertionError) as excinfo:
+        expectations.element_matches_text(context, '#log', None, 'expected')
+    assert 'a very long log...' in str(excinfo.value)
@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+import textwrap
+present_dir = os.path.dirname(os.path.realpath(__file__))
+root_dir = os.path.abspath(os.path.join(present_dir, '..', '..'))
+sys.path.insert(0, root_dir)
+from behave_webdriver.timings import Timings, count_steps, feature_key, shard_by_duration, DEFAULT_SECONDS_PER_STEP
+
+
+def _report(location, *scenarios):
+    return {'location': location + ':1', 'elements': [
+        {'type': 'scenario', 'name': name, 'steps': [{'result': {'status': 'passed', 'duration': d}} for d in durations]}
+        for name, durations in scenarios]}
+
+
+def test_count_steps(tmpdir):
+    feature = tmpdir.join('steps.feature')
+    feature.write(textwrap.dedent('''
+        Feature: counting
+          Background:
+            Given the base url is "http://localhost:8000"
+          Scenario: one
+            When I open the site "/"
+            And I pause for 1000ms
+            # Then a comment
+            Then I expect that the title is "DEMO APP"
+            But there is no element "#nope" on the page
+    '''))
+    assert count_steps(str(feature)) == 5
+
+
+def test_record_and_reload(tmpdir):
+    path = str(tmpdir.join('timings.json'))
+    timings = Timings.load(path)
+    assert timings.features == {}
+    timings.record([_report('features/a.feature', ('slow', [2.0, 1.0]), ('fast', [0.5]))])
+    timings.save()
+    reloaded = Timings.load(path)
+    assert reloaded.features == {'features/a.feature': 3.5}
+    assert reloaded.scenarios == {'features/a.feature::slow': 3.0, 'features/a.feature::fast': 0.5}
+    assert reloaded.seconds_per_step == pytest.approx(3.5 / 3)
+
+
+def test_record_smooths_durations():
+    timings = Timings()
+    timings.record([_report('features/a.feature', ('s', [4.0]))])
+    timings.record([_report('features/a.feature', ('s', [2.0]))])
+    assert timings.features['features/a.feature'] == 3.0
+
+
+def test_estimate_falls_back_to_step_count(tmpdir):
+    feature = tmpdir.join('new.feature')
+    feature.write('Feature: new\n  Scenario: s\n    Given a\n    Then b\n')
+    timings = Timings()
+    assert timings.estimate(str(feature)) == 2 * DEFAULT_SECONDS_PER_STEP
+    timings.features[feature_key(str(feature))] = 42.0
+    assert timings.estimate(str(feature)) == 42.0
+
+
+def test_shard_by_duration_minimises_makespan():
+    durations = {'a': 7, 'b': 5, 'c': 4, 'd': 3, 'e': 1, 'f': 1}
+    shards, loads = shard_by_duration(sorted(durations), 2, durations.get)
+    assert sorted(loads) == [10, 11]
+    assert shards[0] == ['a', 'd', 'f'] and shards[1] == ['b', 'c', 'e']
+
+
+def test_shard_by_duration_more_workers_than_features():
+    shards, loads = shard_by_duration(['a'], 3, lambda feature: 1.0)
+    assert shards == [['a'], [], []]
+    assert loads == [1.0, 0.0, 0.0]
@@ -0,0 +1,205 @@
+"""
+A local stub WebDriver (W3C protocol) server for tests and benchmarks.
+
+It answers enough of the protocol for a selenium ``Remote`` driver to run every ``BehaveDriverMixin`` method, without
+a browser: elements are found by any selector, scripts are answered by ``script_handler`` and every other command
+succeeds with a null value. ``latency`` seconds are added to every command to emulate a remote grid.
+"""
+import json
+import re
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # Python 2
+    from SocketServer import ThreadingMixIn
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+
+class StubState(object):
+    """
+    What the stub browser remembers: the current url, cookies, windows and elements handed out.
+    """
+    def __init__(self):
+        self.url = 'about:blank'
+        self.title = 'Stub page'
+        self.cookies = {}
+        self.windows = ['window-0']
+        self.window = 'window-0'
+        self.elements = 0
+        self.element_text = 'stub text'
+        self.tag_name = 'div'
+        self.element_rect = {'x': 10, 'y': 20, 'width': 100, 'height': 50}
+
+    def new_element(self):
+        self.elements += 1
+        return {ELEMENT_KEY: 'element-{}'.format(self.elements)}
+
+
+def default_script_handler(script, args, state):
+    return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self, status, value):
+        body = json.dumps({'value': value}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length).decode('utf-8') or '{}') if length else {}
+        path = self.path.split('?')[0].rstrip('/')
+        stub = self.server.stub
+        command = '{} {}'.format(method, re.sub(r'/session/[^/]+', '/session/$id',
+                                                re.sub(r'/element/(?!active)[^/]+', '/element/$id', path)))
+        with self.server.lock:
+            stub.requests += 1
+            stub.commands[command] = stub.commands.get(command, 0) + 1
+        delay = stub.command_latency.get(command, stub.latency)
+        if delay:
+            time.sleep(delay)
+        status, value = stub.answer(method, path, command, body)
+        self._respond(status, value)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubWebDriverServer(object):
+    """
+    >>> with StubWebDriverServer(latency=0.05) as stub:
+    ...     driver = Remote(command_executor=stub.url)
+    """
+    def __init__(self, latency=0.0, script_handler=default_script_handler):
+        self.latency = latency
+        self.command_latency = {}
+        self.script_handler = script_handler
+        self.state = StubState()
+        self.requests = 0
+        self.commands = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+
+    @property
+    def connections(self):
+        return self._server.connections
+
+    def reset_counters(self):
+        self.requests = 0
+        self.commands = {}
+
+    def start(self):
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.stub = self
+        self._server.lock = threading.Lock()
+        self._server.connections = 0
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def answer(self, method, path, command, body):
+        state = self.state
+        if command == 'POST /session':
+            return 200, {'sessionId': 'stub-session', 'capabilities': {'browserName': 'stub'}}
+        if command in ('POST /session/$id/element', 'POST /session/$id/element/$id/element',
+                       'GET /session/$id/element/active'):
+            return 200, state.new_element()
+        if command in ('POST /session/$id/elements', 'POST /session/$id/element/$id/elements'):
+            return 200, [state.new_element()]
+        if command in ('POST /session/$id/execute/sync', 'POST /session/$id/execute/async'):
+            return 200, self.script_handler(body.get('script'), body.get('args', []), state)
+        if command == 'POST /session/$id/url':
+            state.url = body.get('url')
+            return 200, None
+        if command == 'GET /session/$id/url':
+            return 200, state.url
+        if command == 'GET /session/$id/title':
+            return 200, state.title
+        if command == 'GET /session/$id/window':
+            return 200, state.window
+        if command == 'GET /session/$id/window/handles':
+            return 200, list(state.windows)
+        if command == 'POST /session/$id/window':
+            state.window = body.get('handle', body.get('name'))
+            return 200, None
+        if command in ('GET /session/$id/window/rect', 'POST /session/$id/window/rect'):
+            return 200, {'x': 0, 'y': 0, 'width': 1024, 'height': 768}
+        if command == 'GET /session/$id/cookie':
+            return 200, list(state.cookies.values())
+        if command.startswith('GET /session/$id/cookie/'):
+            name = path.rsplit('/', 1)[1]
+            if name not in state.cookies:
+                return 404, {'error': 'no such cookie', 'message': name, 'stacktrace': ''}
+            return 200, state.cookies[name]
+        if command == 'POST /session/$id/cookie':
+            cookie = body.get('cookie', {})
+            state.cookies[cookie.get('name')] = cookie
+            return 200, None
+        if command.startswith('DELETE /session/$id/cookie'):
+            if command == 'DELETE /session/$id/cookie':
+                state.cookies.clear()
+            else:
+                state.cookies.pop(path.rsplit('/', 1)[1], None)
+            return 200, None
+        if command.startswith('GET /session/$id/alert'):
+            return 404, {'error': 'no such alert', 'message': 'no such alert', 'stacktrace': ''}
+        if command == 'GET /session/$id/element/$id/text':
+            return 200, state.element_text
+        if command == 'GET /session/$id/element/$id/rect':
+            return 200, state.element_rect
+        if command in ('GET /session/$id/element/$id/displayed', 'GET /session/$id/element/$id/enabled',
+                       'GET /session/$id/element/$id/selected'):
+            return 200, True
+        if command == 'GET /session/$id/element/$id/name':
+            return 200, state.tag_name
+        if command.startswith('GET /session/$id/element/$id/css/'):
+            return 200, 'rgba(0, 0, 0, 1)'
+        if command.startswith('GET /session/$id/element/$id/attribute/'):
+            return 200, 'stub'
+        if command.startswith('GET /session/$id/element/$id/property/'):
+            return 200, None
+        return 200, None